@@ -59,6 +59,14 @@ Example:
     ```
 """
 
-from mcp_kit.proxy import ProxyMCP
+from typing import TYPE_CHECKING
+
+from mcp_kit.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mcp_kit.proxy import ProxyMCP
+
+# The proxy is imported on first use, so importing a subpackage stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {"ProxyMCP": ".proxy"})
 
 __all__ = ["ProxyMCP"]
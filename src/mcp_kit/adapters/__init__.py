@@ -2,11 +2,27 @@
 
 This module provides adapters that convert MCP targets to different interfaces,
 including client sessions, OpenAI Agents SDK compatibility, and LangGraph integration.
+
+Adapters are imported on first use.
 """
 
-from .client_session import ClientSessionAdapter
-from .langgraph import LangGraphMultiServerMCPClient
-from .openai import OpenAIMCPServerAdapter
+from typing import TYPE_CHECKING
+
+from mcp_kit.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client_session import ClientSessionAdapter
+    from .langgraph import LangGraphMultiServerMCPClient
+    from .openai import OpenAIMCPServerAdapter
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClientSessionAdapter": ".client_session",
+        "LangGraphMultiServerMCPClient": ".langgraph",
+        "OpenAIMCPServerAdapter": ".openai",
+    },
+)
 
 __all__ = [
     "ClientSessionAdapter",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
@@ -20,10 +20,11 @@ class LangGraphMultiServerMCPClient:
     langchain-mcp-adapters, allowing MCP targets to be used with LangGraph workflows.
     """
 
-    def __init__(self, target: Target):
+    def __init__(self, target: Target, start: Callable[[], Awaitable[Any]] | None = None):
         """Initialize the LangGraph MCP client adapter.
 
         :param target: The MCP target to adapt for LangGraph use
+        :param start: Optional coroutine function starting the target, defaults to its initialize method
         :raises ImportError: If langchain_mcp_adapters is not installed
         """
         try:
@@ -37,6 +38,7 @@ class LangGraphMultiServerMCPClient:
             ) from e
 
         self.target = target
+        self._start = start or target.initialize
         self._session: ClientSessionAdapter | None = None
 
     @asynccontextmanager
@@ -59,7 +61,7 @@ class LangGraphMultiServerMCPClient:
             )
         try:
             if auto_initialize:
-                await self.target.initialize()
+                await self._start()
             self._session = ClientSessionAdapter(self.target)
             yield self._session
         finally:
@@ -83,7 +85,7 @@ class LangGraphMultiServerMCPClient:
                 )
 
         if self._session is None:
-            await self.target.initialize()
+            await self._start()
             self._session = ClientSessionAdapter(self.target)
         # Use load_mcp_tools to convert MCP tools to LangChain tools
         return await self._load_mcp_tools(self._session)  # type: ignore
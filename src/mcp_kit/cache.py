@@ -0,0 +1,295 @@
+"""Caches bounded by size in bytes, and canonical hashing of call arguments."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+def hash_arguments(name: str, arguments: dict[str, Any] | None) -> str:
+    """Hash a call by name and canonicalized arguments.
+
+    Arguments are serialized as JSON with sorted keys and without whitespace, so
+    the same arguments always hash the same regardless of their order.
+
+    :param name: Name of the tool, prompt or model
+    :param arguments: Arguments of the call
+    :return: Hex digest identifying the call
+    """
+    canonical = json.dumps(
+        [name, arguments or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LruCache(Generic[V]):
+    """Least recently used cache bounded by the total size of its values in bytes.
+
+    Entries can expire after a time to live. Expired entries are dropped when they
+    are looked up, and the least recently used entries are evicted when the total
+    size goes over `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        :param max_bytes: Maximum total size in bytes of the cached values
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[V, int, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries.
+
+        :return: Number of entries, including expired ones not looked up yet
+        """
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        """Look up a value, marking it as recently used.
+
+        :param key: Key of the value
+        :return: The cached value, or None if it is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, _, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: V, size: int, ttl: float | None = None) -> None:
+        """Cache a value, evicting the least recently used values to make room.
+
+        Values larger than the whole cache are not cached.
+
+        :param key: Key of the value
+        :param value: Value to cache
+        :param size: Size of the value in bytes
+        :param ttl: Optional time in seconds after which the value expires
+        """
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+        while self.size + size > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, size, expires_at)
+        self.size += size
+
+    def delete(self, key: str) -> None:
+        """Remove a value if it is cached.
+
+        :param key: Key of the value
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+        self.size = 0
+
+
+class SqliteCache:
+    """Persistent cache of strings stored in a SQLite database.
+
+    Entries are evicted least recently used first when the total size of the
+    values goes over `max_bytes`. The total size is kept up to date by triggers
+    in a one-row table, so writes don't scan the entries, and the access times
+    of the entries read are written in batches, at the latest with the next
+    write. The database can be shared by several processes, and the cache can be
+    used from several threads. The database is only opened when the cache is
+    first used, so creating a cache has no side effects.
+    """
+
+    ACCESS_BATCH_SIZE = 128
+    """Number of entries read before their access times are written without waiting for a write."""
+
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        :param path: Path of the SQLite database file
+        :param max_bytes: Maximum total size in bytes of the cached values
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._accessed: dict[str, float] = {}
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection to the database, opening it and creating the database if needed.
+
+        :return: The connection, to use with the lock held
+        """
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)"
+                )
+                # Databases created before the totals table start from the size of their entries
+                connection.execute(
+                    "INSERT OR IGNORE INTO totals (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM entries"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                    "BEGIN UPDATE totals SET size = size + NEW.size; END"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries "
+                    "BEGIN UPDATE totals SET size = size - OLD.size + NEW.size; END"
+                )
+                connection.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                    "BEGIN UPDATE totals SET size = size - OLD.size; END"
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                connection.close()
+                raise
+            self._db = connection
+        return self._db
+
+    def __len__(self) -> int:
+        """Get the number of cached entries.
+
+        :return: Number of entries
+        """
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(count)
+
+    @property
+    def size(self) -> int:
+        """Get the total size of the cached values.
+
+        :return: Size in bytes
+        """
+        with self._lock:
+            return self._total_size()
+
+    def get(self, key: str) -> str | None:
+        """Look up a value, marking it as recently used.
+
+        :param key: Key of the value
+        :return: The cached value, or None if it is missing
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= self.ACCESS_BATCH_SIZE:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._write_accessed()
+                    self._connection.execute("COMMIT")
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+        return str(row[0])
+
+    def put(self, key: str, value: str) -> None:
+        """Cache a value, evicting the least recently used values to make room.
+
+        Values larger than the whole cache are not cached.
+
+        :param key: Key of the value
+        :param value: Value to cache
+        """
+        size = len(value.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Written first, so the entries read since the last write are not evicted as unused
+                self._write_accessed()
+                self._connection.execute(
+                    "INSERT INTO entries (key, value, size, accessed_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "value = excluded.value, size = excluded.size, accessed_at = excluded.accessed_at",
+                    (key, value, size, time.time()),
+                )
+                self._evict()
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._accessed.clear()
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Write the pending access times and close the database."""
+        with self._lock:
+            if self._db is not None:
+                try:
+                    if self._accessed:
+                        self._db.execute("BEGIN IMMEDIATE")
+                        self._write_accessed()
+                        self._db.execute("COMMIT")
+                finally:
+                    self._db.close()
+                    self._db = None
+
+    def _total_size(self) -> int:
+        """Get the total size of the cached values from the totals table, with the lock held.
+
+        :return: Size in bytes
+        """
+        (size,) = self._connection.execute("SELECT size FROM totals WHERE id = 0").fetchone()
+        return int(size)
+
+    def _write_accessed(self) -> None:
+        """Write the access times of the entries read since the last write, within a transaction."""
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in max_bytes."""
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
@@ -0,0 +1,63 @@
+"""Command line interface of MCP Kit.
+
+```bash
+mcp-kit compile proxy_config.yaml -o proxy_config.snapshot
+```
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from mcp_kit.snapshot import compile_snapshot
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    :param argv: Command line arguments, defaults to the arguments of the process
+    :return: Exit status of the process
+    """
+    parser = argparse.ArgumentParser(prog="mcp-kit", description="MCP Kit command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="validate a config and compile it into a snapshot for ProxyMCP.from_snapshot",
+    )
+    compile_parser.add_argument("config", type=Path, help="configuration file (YAML or JSON)")
+    compile_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="snapshot file to write (defaults to the config file with a .snapshot suffix)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compile":
+        return _compile(args.config, args.output or args.config.with_suffix(".snapshot"))
+    return 2
+
+
+def _compile(config_file: Path, snapshot_file: Path) -> int:
+    """Compile a config file into a snapshot, reporting errors in the config.
+
+    :param config_file: Path to the configuration file
+    :param snapshot_file: Path of the snapshot file to write
+    :return: Exit status of the process
+    """
+    try:
+        snapshot = compile_snapshot(config_file, snapshot_file)
+    except (OSError, ValueError) as e:
+        print(f"mcp-kit compile: error: {e}", file=sys.stderr)
+        return 1
+    print(
+        f"Compiled {config_file} to {snapshot_file} "
+        f"({len(snapshot.catalogs)} catalogs, {snapshot.tool_count} tools, {snapshot.prompt_count} prompts)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,11 @@
-"""Factory for creating instances from configuration using reflection.
-This module provides a central registry to avoid circular imports and supports
-both Target and ToolResponseGenerator creation.
+"""Factory for creating instances from configuration.
+This module provides the central registries of target, generator and prompt engine
+types (also avoiding circular imports), and creates instances from config nodes.
 """
 
 from __future__ import annotations
 
-import importlib
-from collections.abc import Callable
-from typing import Any, cast
+from typing import TypeVar, cast
 
 from mcp import Tool
 from mcp.types import Prompt, PromptArgument, ToolAnnotations
@@ -16,21 +14,54 @@ from omegaconf import DictConfig, ListConfig, OmegaConf
 from mcp_kit.generators import ToolResponseGenerator
 from mcp_kit.mixins import ConfigurableMixin
 from mcp_kit.prompts import PromptEngine
+from mcp_kit.registry import Registry
+from mcp_kit.snapshot import get_snapshot_catalog
 from mcp_kit.targets import Target
 
-
-def create_object_from_config(
-    config: DictConfig,
-    get_class_name: Callable[[str], str],
-    get_module_name: Callable[[str], str],
-    object_type_name: str = "object",
-) -> Any:
-    """Generic factory function to create any object instance from configuration using reflection.
+T = TypeVar("T")
+
+target_registry: Registry[Target] = Registry(
+    "target",
+    "mcp_kit.targets",
+    {
+        "balanced": "mcp_kit.targets.balanced:BalancedTarget",
+        "cached": "mcp_kit.targets.cached:CachedTarget",
+        "mcp": "mcp_kit.targets.mcp:McpTarget",
+        "mocked": "mcp_kit.targets.mocked:MockedTarget",
+        "multiplex": "mcp_kit.targets.multiplex:MultiplexTarget",
+        "oas": "mcp_kit.targets.oas:OasTarget",
+        "recording": "mcp_kit.targets.recording:RecordingTarget",
+        "replay": "mcp_kit.targets.replay:ReplayTarget",
+    },
+)
+"""Registry of the target types."""
+
+generator_registry: Registry[ToolResponseGenerator] = Registry(
+    "generator",
+    "mcp_kit.generators",
+    {
+        "llm": "mcp_kit.generators.llm:LlmResponseGenerator",
+        "random": "mcp_kit.generators.random:RandomResponseGenerator",
+        "schema": "mcp_kit.generators.schema:SchemaResponseGenerator",
+    },
+)
+"""Registry of the tool response generator types."""
+
+prompt_engine_registry: Registry[PromptEngine] = Registry(
+    "engine",
+    "mcp_kit.prompt_engines",
+    {
+        "interpolation": "mcp_kit.prompts.interpolation:InterpolationPromptEngine",
+    },
+)
+"""Registry of the prompt engine types."""
+
+
+def create_object_from_config(config: DictConfig, registry: Registry[T]) -> T:
+    """Generic factory function to create any object instance from configuration.
 
     :param config: Configuration from OmegaConf with a 'type' field
-    :param get_class_name: Function that converts type string to class name
-    :param get_module_name: Function that converts type string to module name
-    :param object_type_name: Name of object type for error messages (e.g., "target", "generator")
+    :param registry: Registry resolving the type to the class to create
     :return: Object instance
     :raises ValueError: If type is unknown or cannot be instantiated
     """
@@ -38,71 +69,36 @@ def create_object_from_config(
 
     if not object_type:
         raise ValueError(
-            f"Configuration must specify a 'type' field for {object_type_name}",
+            f"Configuration must specify a 'type' field for {registry.kind}",
         )
 
-    # Get class and module names using provided functions
-    class_name = get_class_name(object_type)
-    module_name = get_module_name(object_type)
-
+    object_class = cast(type[ConfigurableMixin], registry.resolve(object_type))
     try:
-        # Import the module
-        module = importlib.import_module(module_name)
-
-        # Get the class from the module
-        object_class: ConfigurableMixin = getattr(module, class_name)
-
-        # Create instance from config
-        return object_class.from_config(config)
-
-    except ModuleNotFoundError as e:
-        raise ValueError(
-            f"Unknown {object_type_name} type '{object_type}'. No module found for this {object_type_name} type.",
-        ) from e
-    except AttributeError as e:
-        raise ValueError(
-            f"Unknown {object_type_name} type '{object_type}'. Class '{class_name}' not found in module.",
-        ) from e
+        return cast(T, object_class.from_config(config))
     except Exception as e:
         raise ValueError(
-            f"Failed to create {object_type_name} of type '{object_type}': {e!s}",
+            f"Failed to create {registry.kind} of type '{object_type}': {e!s}",
         ) from e
 
 
 def create_target_from_config(config: DictConfig) -> Target:
-    """Factory function to create any Target instance from configuration using reflection.
+    """Factory function to create any Target instance from configuration.
 
     :param config: Target configuration from OmegaConf
     :return: Target instance
     :raises ValueError: If target type is unknown or cannot be instantiated
     """
-    return cast(
-        Target,
-        create_object_from_config(
-            config,
-            get_class_name=lambda target_type: target_type.capitalize() + "Target",
-            get_module_name=lambda target_type: f"mcp_kit.targets.{target_type}",
-            object_type_name="target",
-        ),
-    )
+    return create_object_from_config(config, target_registry)
 
 
 def create_response_generator_from_config(config: DictConfig) -> ToolResponseGenerator:
-    """Factory function to create any ToolResponseGenerator instance from configuration using reflection.
+    """Factory function to create any ToolResponseGenerator instance from configuration.
 
     :param config: ToolResponseGenerator configuration from OmegaConf
     :return: ToolResponseGenerator instance
     :raises ValueError: If generator type is unknown or cannot be instantiated
     """
-    return cast(
-        ToolResponseGenerator,
-        create_object_from_config(
-            config,
-            get_class_name=lambda generator_type: generator_type.capitalize() + "ResponseGenerator",
-            get_module_name=lambda generator_type: f"mcp_kit.generators.{generator_type}",
-            object_type_name="generator",
-        ),
-    )
+    return create_object_from_config(config, generator_registry)
 
 
 def create_tools_from_config(config: DictConfig) -> list[Tool] | None:
@@ -111,6 +107,10 @@ def create_tools_from_config(config: DictConfig) -> list[Tool] | None:
     :param config: Tool configuration from OmegaConf
     :return: List of Tool instances or None if no tools are defined
     """
+    catalog = get_snapshot_catalog(config)
+    if catalog is not None:
+        return catalog.tools
+
     tools_config: ListConfig | None = config.get("tools")
     if tools_config is None:
         return None
@@ -148,6 +148,10 @@ def create_prompts_from_config(config: DictConfig) -> list[Prompt] | None:
     :param config: Prompt configuration from OmegaConf
     :return: List of Prompt instances or None if no prompts are defined
     """
+    catalog = get_snapshot_catalog(config)
+    if catalog is not None:
+        return catalog.prompts
+
     prompts_config: ListConfig | None = config.get("prompts")
     if prompts_config is None:
         return None
@@ -178,18 +182,10 @@ def create_prompts_from_config(config: DictConfig) -> list[Prompt] | None:
 
 
 def create_prompt_engine_from_config(config: DictConfig) -> PromptEngine:
-    """Factory function to create any PromptEngine instance from configuration using reflection.
+    """Factory function to create any PromptEngine instance from configuration.
 
     :param config: PromptEngine configuration from OmegaConf
     :return: PromptEngine instance
     :raises ValueError: If engine type is unknown or cannot be instantiated
     """
-    return cast(
-        PromptEngine,
-        create_object_from_config(
-            config,
-            get_class_name=lambda engine_type: engine_type.capitalize() + "PromptEngine",
-            get_module_name=lambda engine_type: f"mcp_kit.prompts.{engine_type}",
-            object_type_name="engine",
-        ),
-    )
+    return create_object_from_config(config, prompt_engine_registry)
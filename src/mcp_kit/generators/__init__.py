@@ -1,16 +1,39 @@
 """Response generator implementations for creating mock MCP responses.
 
 This module provides different strategies for generating synthetic responses
-to MCP tool calls, including random text generation and LLM-based intelligent responses.
+to MCP tool calls, including random text generation, JSON generation from a JSON Schema
+and LLM-based intelligent responses.
+
+Generators are imported on first use, so that litellm is only imported when
+the LLM generator is used.
 """
 
+from typing import TYPE_CHECKING
+
+from mcp_kit.lazy import lazy_exports
+
+from .errors import LlmAuthenticationError, LlmCacheMissError
 from .interfaces import ToolResponseGenerator
-from .llm import LlmAuthenticationError, LlmResponseGenerator
-from .random import RandomResponseGenerator
+
+if TYPE_CHECKING:
+    from .llm import LlmResponseGenerator
+    from .random import RandomResponseGenerator
+    from .schema import SchemaResponseGenerator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "LlmResponseGenerator": ".llm",
+        "RandomResponseGenerator": ".random",
+        "SchemaResponseGenerator": ".schema",
+    },
+)
 
 __all__ = [
     "LlmResponseGenerator",
     "RandomResponseGenerator",
+    "SchemaResponseGenerator",
     "ToolResponseGenerator",
     "LlmAuthenticationError",
+    "LlmCacheMissError",
 ]
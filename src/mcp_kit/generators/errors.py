@@ -0,0 +1,21 @@
+"""Exceptions raised by response generators."""
+
+
+class LlmAuthenticationError(Exception):
+    """Exception raised when LLM authentication fails.
+
+    This exception is raised when the LLM service rejects the authentication
+    credentials (API key, token, etc.).
+    """
+
+    pass
+
+
+class LlmCacheMissError(Exception):
+    """Exception raised in replay mode when a response is not in the cache.
+
+    In replay mode the LLM is never called, so every tool call must have been
+    recorded in the cache by a previous run.
+    """
+
+    pass
@@ -1,32 +1,45 @@
 """LLM-based response generator for realistic mock responses."""
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 
 import litellm
 from litellm import acompletion
 from litellm.exceptions import AuthenticationError
-from litellm.types.utils import Choices, ModelResponse
+from litellm.types.utils import Choices, ModelResponse, StreamingChoices
+from litellm.utils import token_counter
 from mcp import Tool
 from mcp.types import Content, TextContent
 from omegaconf import DictConfig
 from typing_extensions import Self
 
+from mcp_kit.cache import SqliteCache, hash_arguments
+from mcp_kit.generators.errors import LlmAuthenticationError, LlmCacheMissError
 from mcp_kit.generators.interfaces import ToolResponseGenerator
+from mcp_kit.progress import ProgressFanOut, current_progress_callback, progress_reporting, report_progress
+from mcp_kit.rate_limit import TokenBucket
 
-# Suppress INFO logging from LiteLLM
-logging.getLogger("LiteLLM").setLevel(logging.WARNING)
-litellm.suppress_debug_info = True  # Suppress extra debug info from litellm
+logger = logging.getLogger(__name__)
 
+BATCH_SYSTEM_PROMPT = """
+You are a Mock Response Generator that creates realistic mock responses for tool calls.
 
-class LlmAuthenticationError(Exception):
-    """Exception raised when LLM authentication fails.
+You receive a JSON array of tool call contexts. For each of them:
+1. Analyze the provided tool call context.
+2. Generate a realistic mock response that matches that context.
+3. Consider the tool name, description, input schema, and call arguments to create appropriate content.
 
-    This exception is raised when the LLM service rejects the authentication
-    credentials (API key, token, etc.).
-    """
+Return only a JSON array of strings with exactly one mock response per tool call, in the same order.
+Don't use a markdown code block or add any explanations or metadata.
+"""
 
-    pass
+# Suppress INFO logging from LiteLLM
+logging.getLogger("LiteLLM").setLevel(logging.WARNING)
+litellm.suppress_debug_info = True  # Suppress extra debug info from litellm
 
 
 class LlmResponseGenerator(ToolResponseGenerator):
@@ -35,14 +48,72 @@ class LlmResponseGenerator(ToolResponseGenerator):
     This generator uses a Large Language Model to create realistic mock responses
     based on the tool context, making it suitable for testing scenarios that
     require believable synthetic data.
+
+    Responses can be stored in a persistent cache keyed on the model and a hash of
+    the prompt, so identical tool calls are only generated once across runs. In
+    replay mode the LLM is never called and every response must come from the cache.
+
+    Calls to the LLM can be limited to `max_concurrency` at a time, and to
+    `requests_per_minute` and `tokens_per_minute` with token buckets. Identical
+    generation requests made while one is in flight share its LLM call, and the
+    progress of a streamed call is reported to all of them.
+
+    In batching mode, generation requests arriving within `batch_wait` seconds (or
+    until `batch_size` of them are waiting) are sent to the LLM as a single request
+    asking for all the responses as a JSON array. If the batched response can't be
+    parsed, the requests of the batch are sent to the LLM one by one.
+
+    In streaming mode, the completion is streamed from the LLM and every chunk is
+    reported as progress (see `mcp_kit.progress`), which the official MCP server
+    adapter sends to the client as progress notifications. `generate_stream` yields
+    the chunks directly.
     """
 
-    def __init__(self, model: str):
+    def __init__(
+        self,
+        model: str,
+        cache: SqliteCache | None = None,
+        replay: bool = False,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        batch_size: int | None = None,
+        batch_wait: float = 0.02,
+        stream: bool = False,
+    ):
         """Initialize the LLM response generator.
 
         :param model: The LLM model identifier to use for generation
+        :param cache: Optional persistent cache of the generated responses
+        :param replay: Whether to only answer from the cache, without calling the LLM
+        :param max_concurrency: Optional maximum number of concurrent LLM calls
+        :param requests_per_minute: Optional maximum number of LLM calls per minute
+        :param tokens_per_minute: Optional maximum number of LLM tokens (prompt and completion) per minute
+        :param batch_size: Optional maximum number of generation requests sent to the LLM as one batch
+        :param batch_wait: Time in seconds to wait for more requests before sending a batch
+        :param stream: Whether to stream completions from the LLM and report the chunks as progress
+        :raises ValueError: If replay mode is enabled without a cache, the batch size is not positive
+            or streaming is combined with batching
         """
+        if replay and cache is None:
+            raise ValueError("Replay mode of LLMResponseGenerator requires a cache.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Invalid batch size {batch_size} for LLMResponseGenerator.")
+        if stream and batch_size is not None:
+            raise ValueError("Streaming and batching modes of LLMResponseGenerator can't be combined.")
         self.model = model
+        self.cache = cache
+        self.replay = replay
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        self._requests_bucket = TokenBucket.per_minute(requests_per_minute) if requests_per_minute else None
+        self._tokens_bucket = TokenBucket.per_minute(tokens_per_minute) if tokens_per_minute else None
+        self._in_flight: dict[str, tuple[asyncio.Future[str], ProgressFanOut]] = {}
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self._batch: list[tuple[str, asyncio.Future[str]]] = []
+        self._batch_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self.stream = stream
         self.messages = [
             {
                 "role": "system",
@@ -74,7 +145,32 @@ Make the response realistic and contextually appropriate for the given tool call
             raise ValueError(
                 "Configuration must include a 'model' parameter for LLMResponseGenerator.",
             )
-        return cls(model=model)
+        cache = None
+        replay = False
+        batch_size = None
+        batch_wait = 0.02
+        cache_config = config.get("cache")
+        if cache_config is not None:
+            cache = SqliteCache(
+                path=cache_config.get("path", ".mcp_kit/llm_cache.sqlite"),
+                max_bytes=cache_config.get("max_bytes", 100 * 1024 * 1024),
+            )
+            replay = cache_config.get("replay", False)
+        batch_config = config.get("batch")
+        if batch_config is not None:
+            batch_size = batch_config.get("max_size", 10)
+            batch_wait = batch_config.get("max_wait", batch_wait)
+        return cls(
+            model=model,
+            cache=cache,
+            replay=replay,
+            max_concurrency=config.get("max_concurrency"),
+            requests_per_minute=config.get("requests_per_minute"),
+            tokens_per_minute=config.get("tokens_per_minute"),
+            batch_size=batch_size,
+            batch_wait=batch_wait,
+            stream=config.get("stream", False),
+        )
 
     async def generate(
         self,
@@ -92,8 +188,44 @@ Make the response realistic and contextually appropriate for the given tool call
         :param arguments: Arguments passed to the tool
         :return: List containing generated text content
         :raises LlmAuthenticationError: If LLM authentication fails
+        :raises LlmCacheMissError: If the response is not cached in replay mode
         :raises ValueError: If the LLM response is empty
         """
+        messages = self._build_messages(target_name, tool, arguments)
+        key = hash_arguments(self.model, {"messages": messages})
+        text = await self._single_flight(key, lambda: self._generate_text(key, messages, target_name, tool))
+        return [TextContent(type="text", text=text)]
+
+    async def generate_stream(
+        self,
+        target_name: str,
+        tool: Tool,
+        arguments: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a mock response from the LLM, without caching it.
+
+        :param target_name: Name of the target server
+        :param tool: The MCP tool definition
+        :param arguments: Arguments passed to the tool
+        :return: Iterator over the chunks of the response text
+        :raises LlmAuthenticationError: If LLM authentication fails
+        """
+        async for chunk in self._stream(self._build_messages(target_name, tool, arguments)):
+            yield chunk
+
+    def _build_messages(
+        self,
+        target_name: str,
+        tool: Tool,
+        arguments: dict[str, Any] | None,
+    ) -> list[dict[str, str]]:
+        """Build the messages asking the LLM for a mock response.
+
+        :param target_name: Name of the target server
+        :param tool: The MCP tool definition
+        :param arguments: Arguments passed to the tool
+        :return: System and user messages
+        """
         # Create a detailed prompt with server request information
         prompt = f"""
         Generate a mock response for the following tool call, using all contextual
@@ -108,18 +240,247 @@ Make the response realistic and contextually appropriate for the given tool call
         Please generate a realistic mock response for this tool call.
         """
 
+        return self.messages + [{"role": "user", "content": prompt}]
+
+    async def _single_flight(self, key: str, generate: Callable[[], Awaitable[str]]) -> str:
+        """Share the generation of identical requests made while one is in flight.
+
+        The progress reported by the shared generation is sent to every caller
+        waiting for it, from the time it started waiting.
+
+        :param key: Key identifying the request
+        :param generate: Function generating the response if no identical request is in flight
+        :return: The generated response text
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            progress = ProgressFanOut()
+
+            async def generate_shared() -> str:
+                with progress_reporting(progress):
+                    return await generate()
+
+            future: asyncio.Future[str] = asyncio.ensure_future(generate_shared())
+            self._in_flight[key] = future, progress
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            future, progress = in_flight
+        callback = current_progress_callback()
+        if callback is not None:
+            progress.add(callback)
         try:
-            response: ModelResponse = await acompletion(
-                model=self.model,
-                messages=self.messages + [{"role": "user", "content": prompt}],
+            # Shield the shared generation so a cancelled caller doesn't cancel the others
+            return await asyncio.shield(future)
+        finally:
+            if callback is not None:
+                progress.discard(callback)
+
+    async def _generate_text(self, key: str, messages: list[dict[str, str]], target_name: str, tool: Tool) -> str:
+        """Get the response text from the cache, or generate it with the LLM.
+
+        :param key: Cache key of the request
+        :param messages: Messages to send to the LLM
+        :param target_name: Name of the target server
+        :param tool: The MCP tool definition
+        :return: The response text
+        :raises LlmCacheMissError: If the response is not cached in replay mode
+        """
+        if self.cache is None:
+            return await self._generate_completion(messages)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return cached
+        if self.replay:
+            raise LlmCacheMissError(
+                f"No cached response for tool '{tool.name}' of server '{target_name}' in replay mode.",
             )
-        except AuthenticationError:
-            raise LlmAuthenticationError(
-                f"Authentication failed for model '{self.model}'. Please check your API key and model configuration.",
-            ) from None
+        text = await self._generate_completion(messages)
+        await asyncio.to_thread(self.cache.put, key, text)
+        return text
+
+    async def _generate_completion(self, messages: list[dict[str, str]]) -> str:
+        """Generate a response with the LLM, batched with other requests in batching mode.
+
+        :param messages: Messages to send to the LLM
+        :return: The response text
+        """
+        if self.stream:
+            return await self._complete_streaming(messages)
+        if self.batch_size is None:
+            return await self._complete(messages)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._batch.append((messages[-1]["content"], future))
+        if len(self._batch) >= self.batch_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(self.batch_wait, self._flush_batch)
+        return await future
+
+    def _flush_batch(self) -> None:
+        """Send the waiting generation requests to the LLM as one batch."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.create_task(self._complete_batch(batch))
+            # Keep a reference to the task so it isn't garbage collected while running
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _complete_batch(self, batch: list[tuple[str, asyncio.Future[str]]]) -> None:
+        """Generate the responses of a batch and hand them to the waiting callers.
+
+        :param batch: Prompts of the batched requests, with the futures their callers wait on
+        """
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(prompts) == 1:
+                texts = [await self._complete(self.messages + [{"role": "user", "content": prompts[0]}])]
+            else:
+                texts = await self._complete_many(prompts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), text in zip(batch, texts, strict=True):
+            if not future.done():
+                future.set_result(text)
+
+    async def _complete_many(self, prompts: list[str]) -> list[str]:
+        """Generate the responses of several prompts with a single LLM call.
+
+        :param prompts: Prompts of the tool calls
+        :return: One response text per prompt, in the same order
+        """
+        text = await self._complete(
+            [
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(prompts)},
+            ]
+        )
+        try:
+            texts = json.loads(text.removeprefix("```json").removeprefix("```").removesuffix("```"))
+        except json.JSONDecodeError:
+            texts = None
+        if (
+            isinstance(texts, list)
+            and len(texts) == len(prompts)
+            and all(isinstance(text, str) and text.strip() for text in texts)
+        ):
+            return [text.strip() for text in texts]
+
+        logger.warning("Invalid batched LLM response for %d tool calls, generating them one by one", len(prompts))
+        return list(
+            await asyncio.gather(
+                *[self._complete(self.messages + [{"role": "user", "content": prompt}]) for prompt in prompts]
+            )
+        )
+
+    async def _complete(self, messages: list[dict[str, str]]) -> str:
+        """Call the LLM to generate a response, within the concurrency and rate limits.
+
+        The tokens per minute limit is enforced with the estimated prompt tokens
+        before the call, and corrected with the actual usage after it.
+
+        :param messages: Messages to send to the LLM
+        :return: The stripped response text
+        :raises LlmAuthenticationError: If LLM authentication fails
+        :raises ValueError: If the LLM response is empty
+        """
+        limit: AbstractAsyncContextManager[Any] = self._semaphore or nullcontext()
+        async with limit:
+            if self._requests_bucket is not None:
+                await self._requests_bucket.acquire()
+            estimated_tokens = 0
+            if self._tokens_bucket is not None:
+                estimated_tokens = token_counter(model=self.model, messages=messages)
+                await self._tokens_bucket.acquire(estimated_tokens)
+            response = await self._acompletion(messages)
+        usage = getattr(response, "usage", None)
+        if self._tokens_bucket is not None and usage is not None:
+            self._tokens_bucket.consume(usage.total_tokens - estimated_tokens)
         choice: Choices = response.choices[0]  # type: ignore[assignment]
         if not choice.message.content:
             raise ValueError(
                 "LLM response is empty. Please check the model and prompt.",
             )
-        return [TextContent(type="text", text=choice.message.content.strip())]
+        return choice.message.content.strip()
+
+    async def _complete_streaming(self, messages: list[dict[str, str]]) -> str:
+        """Stream a response from the LLM, reporting every chunk as progress.
+
+        :param messages: Messages to send to the LLM
+        :return: The stripped response text
+        :raises ValueError: If the LLM response is empty
+        """
+        chunks = []
+        async for chunk in self._stream(messages):
+            chunks.append(chunk)
+            await report_progress(len(chunks), chunk)
+        text = "".join(chunks).strip()
+        if not text:
+            raise ValueError(
+                "LLM response is empty. Please check the model and prompt.",
+            )
+        return text
+
+    async def _stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a completion from the LLM, within the concurrency and rate limits.
+
+        :param messages: Messages to send to the LLM
+        :return: Iterator over the non empty chunks of the response text
+        :raises LlmAuthenticationError: If LLM authentication fails
+        """
+        limit: AbstractAsyncContextManager[Any] = self._semaphore or nullcontext()
+        async with limit:
+            if self._requests_bucket is not None:
+                await self._requests_bucket.acquire()
+            estimated_tokens = 0
+            if self._tokens_bucket is not None:
+                estimated_tokens = token_counter(model=self.model, messages=messages)
+                await self._tokens_bucket.acquire(estimated_tokens)
+            try:
+                response = await acompletion(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                )
+            except AuthenticationError:
+                raise self._authentication_error() from None
+            completion_tokens = 0
+            async for chunk in response:
+                choice: StreamingChoices = chunk.choices[0]
+                if choice.delta is not None and choice.delta.content:
+                    completion_tokens += 1
+                    yield choice.delta.content
+        if self._tokens_bucket is not None:
+            # Streamed chunks are roughly one token each
+            self._tokens_bucket.consume(completion_tokens)
+
+    async def _acompletion(self, messages: list[dict[str, str]]) -> ModelResponse:
+        """Call the LLM.
+
+        :param messages: Messages to send to the LLM
+        :return: The LLM response
+        :raises LlmAuthenticationError: If LLM authentication fails
+        """
+        try:
+            response: ModelResponse = await acompletion(
+                model=self.model,
+                messages=messages,
+            )
+        except AuthenticationError:
+            raise self._authentication_error() from None
+        return response
+
+    def _authentication_error(self) -> LlmAuthenticationError:
+        """Create the error raised when the LLM rejects the credentials.
+
+        :return: The authentication error
+        """
+        return LlmAuthenticationError(
+            f"Authentication failed for model '{self.model}'. Please check your API key and model configuration.",
+        )
@@ -1,33 +1,133 @@
 """Random response generator for testing purposes."""
 
+import hashlib
 import random
 import string
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Literal, get_args
 
 from mcp import Tool
 from mcp.types import Content, TextContent
 from omegaconf import DictConfig
 from typing_extensions import Self
 
+from mcp_kit.cache import hash_arguments
 from mcp_kit.generators.interfaces import ToolResponseGenerator
 
+ALPHABET = string.ascii_letters + string.digits + " "
+
+LengthDistributionKind = Literal["fixed", "uniform", "normal", "exponential"]
+
+
+@dataclass
+class LengthDistribution:
+    """Distribution of the length of the random responses.
+
+    :param distribution: Kind of distribution ("fixed", "uniform", "normal" or "exponential")
+    :param mean: Length of fixed responses, or mean length of normal and exponential ones
+    :param stddev: Standard deviation of the length of normal responses
+    :param min_length: Minimum length, and lower bound of uniform responses
+    :param max_length: Optional maximum length, and upper bound of uniform responses
+    """
+
+    distribution: LengthDistributionKind = "fixed"
+    mean: float = 100
+    stddev: float = 0
+    min_length: int = 0
+    max_length: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the distribution.
+
+        :raises ValueError: If the distribution is unknown or its bounds are invalid
+        """
+        if self.distribution not in get_args(LengthDistributionKind):
+            raise ValueError(
+                f"Unknown length distribution '{self.distribution}', expected one of {get_args(LengthDistributionKind)}"
+            )
+        if self.distribution == "uniform" and self.max_length is None:
+            raise ValueError("A uniform length distribution needs a max_length")
+        if self.min_length < 0 or (self.max_length is not None and self.max_length < self.min_length):
+            raise ValueError(f"Invalid length bounds: min_length={self.min_length}, max_length={self.max_length}")
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw a response length.
+
+        :param rng: Random generator to draw the length with
+        :return: Length between min_length and max_length
+        """
+        if self.distribution == "uniform":
+            return rng.randint(self.min_length, self.max_length or self.min_length)
+        if self.distribution == "normal":
+            length = rng.gauss(self.mean, self.stddev)
+        elif self.distribution == "exponential":
+            length = rng.expovariate(1 / self.mean) if self.mean > 0 else 0
+        else:
+            length = self.mean
+        length = max(self.min_length, round(length))
+        return min(length, self.max_length) if self.max_length is not None else length
+
 
 class RandomResponseGenerator(ToolResponseGenerator):
     """Generate random text content for testing.
 
     This generator creates synthetic responses containing random text,
     useful for testing MCP integrations without needing real data sources.
+
+    Each (target, tool, arguments) call gets its own random stream derived from
+    the seed, so with a seed the responses only depend on the calls made with the
+    same arguments, whatever the order concurrent calls are scheduled in. The
+    position in the streams of the `max_streams` most recently used calls is kept,
+    the streams of older calls start over. Responses are sliced out of a pool of
+    random text generated once, so no string is built character by character on
+    each call.
     """
 
+    def __init__(
+        self,
+        seed: int | None = None,
+        length: LengthDistribution | None = None,
+        pool_size: int = 64 * 1024,
+        max_streams: int = 100_000,
+    ) -> None:
+        """Initialize the random response generator.
+
+        :param seed: Optional seed to generate the same responses on every run
+        :param length: Distribution of the response lengths (100 characters by default)
+        :param pool_size: Number of random characters generated up front to slice responses from
+        :param max_streams: Number of distinct calls whose position in their random stream is kept
+        :raises ValueError: If the pool size or the number of streams is not positive
+        """
+        if pool_size < 1:
+            raise ValueError(f"Invalid random pool size {pool_size}")
+        if max_streams < 1:
+            raise ValueError(f"Invalid number of random streams {max_streams}")
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.length = length or LengthDistribution()
+        self._pool = "".join(random.Random(self.seed).choices(ALPHABET, k=pool_size))
+        self.max_streams = max_streams
+        self._calls: OrderedDict[str, int] = OrderedDict()
+
     @classmethod
     def from_config(cls, config: DictConfig) -> Self:
         """Create RandomResponseGenerator from configuration.
 
-        :param config: Configuration data (no parameters needed for random generator)
+        :param config: Configuration data with optional 'seed', 'length', 'pool_size' and 'max_streams'
+            parameters, 'length' being a number of characters or a length distribution
         :return: RandomResponseGenerator instance
         """
-        _ = config  # Unused in this generator, but required for interface compliance
-        return cls()
+        length = config.get("length")
+        if isinstance(length, int | float):
+            length = LengthDistribution(mean=length)
+        elif length is not None:
+            length = LengthDistribution(**length)
+        return cls(
+            seed=config.get("seed"),
+            length=length,
+            pool_size=config.get("pool_size", 64 * 1024),
+            max_streams=config.get("max_streams", 100_000),
+        )
 
     async def generate(
         self,
@@ -37,18 +137,31 @@ class RandomResponseGenerator(ToolResponseGenerator):
     ) -> list[Content]:
         """Generate a random text response.
 
-        :param target_name: Name of the target (unused in random generation)
-        :param tool: The MCP tool definition (unused in random generation)
-        :param arguments: Tool arguments (unused in random generation)
+        :param target_name: Name of the target, identifying the random stream of the call
+        :param tool: The MCP tool definition, identifying the random stream of the call
+        :param arguments: Tool arguments, identifying the random stream of the call
         :return: List containing a single TextContent with random text
         """
-        _, _, _ = target_name, tool, arguments  # Unused in this generator
-
-        return [
-            TextContent(
-                type="text",
-                text="".join(
-                    random.choices(string.ascii_letters + string.digits + " ", k=100),
-                ),
-            ),
-        ]
+        rng = self._call_random(f"{target_name}/{tool.name}", arguments)
+        length = self.length.sample(rng)
+        start = rng.randrange(len(self._pool))
+        text = self._pool[start : start + length]
+        while len(text) < length:
+            text += self._pool[: length - len(text)]
+
+        return [TextContent(type="text", text=text)]
+
+    def _call_random(self, name: str, arguments: dict[str, Any] | None) -> random.Random:
+        """Get the random generator of the next call in the stream of a tool and its arguments.
+
+        :param name: Name identifying the tool
+        :param arguments: Tool arguments
+        :return: Random generator seeded from the seed, the call and the number of identical calls made before
+        """
+        key = hash_arguments(name, arguments)
+        count = self._calls.pop(key, 0)
+        self._calls[key] = count + 1
+        if len(self._calls) > self.max_streams:
+            self._calls.popitem(last=False)
+        digest = hashlib.sha256(f"{self.seed}:{key}:{count}".encode()).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
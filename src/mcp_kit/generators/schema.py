@@ -0,0 +1,420 @@
+"""JSON Schema based response generator for fast, structurally valid mock responses."""
+
+import json
+import math
+import random
+import string
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+from mcp import Tool
+from mcp.types import Content, TextContent
+from omegaconf import DictConfig, OmegaConf
+from typing_extensions import Self
+
+from mcp_kit.generators.interfaces import ToolResponseGenerator
+
+T = TypeVar("T", int, float)
+
+ValueGenerator = Callable[[random.Random], Any]
+"""Function generating a value matching a compiled schema."""
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo"
+).split()
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class SchemaResponseGenerator(ToolResponseGenerator):
+    """Generate JSON responses matching a JSON Schema, without an LLM.
+
+    The schema of a tool response is taken from the tool configuration of the
+    generator, or from the output schema declared by the tool. Tools without a
+    schema get responses matching `default_schema`. Each schema is compiled once
+    into a generator function, so generating a response only costs a few
+    function calls.
+
+    Supported keywords are type, properties, required, additionalProperties,
+    items, minItems, maxItems, enum, const, minimum, maximum, exclusiveMinimum,
+    exclusiveMaximum, minLength, maxLength, format (date-time, date, email,
+    uuid, uri), oneOf, anyOf, allOf and local $ref.
+    """
+
+    def __init__(
+        self,
+        schemas: dict[str, dict[str, Any]] | None = None,
+        default_schema: dict[str, Any] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the schema response generator.
+
+        :param schemas: Response schemas per tool name, taking precedence over the tool output schemas
+        :param default_schema: Schema of the responses of tools without a schema (an empty object by default)
+        :param seed: Optional seed to generate the same responses on every run
+        """
+        self.schemas = schemas or {}
+        self.default_schema = default_schema or {"type": "object"}
+        self._random = random.Random(seed)
+        self._compiled: dict[tuple[str, str], tuple[dict[str, Any], ValueGenerator]] = {}
+
+    @classmethod
+    def from_config(cls, config: DictConfig) -> Self:
+        """Create SchemaResponseGenerator from configuration.
+
+        :param config: Configuration data with optional 'schemas', 'default_schema' and 'seed' parameters
+        :return: SchemaResponseGenerator instance
+        """
+        schemas = config.get("schemas")
+        if schemas is not None:
+            schemas = OmegaConf.to_container(schemas)
+        default_schema = config.get("default_schema")
+        if default_schema is not None:
+            default_schema = OmegaConf.to_container(default_schema)
+        return cls(schemas=schemas, default_schema=default_schema, seed=config.get("seed"))
+
+    async def generate(
+        self,
+        target_name: str,
+        tool: Tool,
+        arguments: dict[str, Any] | None = None,
+    ) -> list[Content]:
+        """Generate a JSON response matching the tool response schema.
+
+        :param target_name: Name of the target, the compiled schemas are kept per target and tool
+        :param tool: The MCP tool definition
+        :param arguments: Tool arguments (unused in schema generation)
+        :return: List containing a single TextContent with the JSON response
+        """
+        _ = arguments  # Unused in this generator
+
+        value = self._get_generator(target_name, tool)(self._random)
+        return [TextContent(type="text", text=json.dumps(value))]
+
+    def _get_generator(self, target_name: str, tool: Tool) -> ValueGenerator:
+        """Get the compiled generator of a tool response schema, compiling it on first use.
+
+        Generators are kept per target and tool name, as targets served by the same
+        generator can have tools of the same name, and are reused as long as the
+        schema of the tool doesn't change.
+
+        :param target_name: Name of the target of the tool
+        :param tool: The MCP tool definition
+        :return: Function generating a response value
+        """
+        schema = self.schemas.get(tool.name) or getattr(tool, "outputSchema", None) or self.default_schema
+        key = (target_name, tool.name)
+        compiled = self._compiled.get(key)
+        if compiled is None or (compiled[0] is not schema and compiled[0] != schema):
+            compiled = (schema, compile_schema(schema))
+            self._compiled[key] = compiled
+        return compiled[1]
+
+
+def compile_schema(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile a JSON Schema into a function generating matching values.
+
+    :param schema: The JSON Schema
+    :return: Function generating a value matching the schema with the given random generator
+    :raises ValueError: If the schema contains a $ref that can't be resolved
+    """
+    return _SchemaCompiler(schema).compile(schema)
+
+
+class _SchemaCompiler:
+    """Compiles the (sub)schemas of a root JSON Schema into value generators."""
+
+    def __init__(self, root: dict[str, Any]) -> None:
+        """Initialize the compiler.
+
+        :param root: Root schema that local $ref are resolved against
+        """
+        self.root = root
+        self._refs: dict[str, ValueGenerator] = {}
+
+    def compile(self, schema: dict[str, Any] | bool) -> ValueGenerator:
+        """Compile a (sub)schema.
+
+        :param schema: The schema
+        :return: Function generating a value matching the schema
+        """
+        if isinstance(schema, bool) or not schema:
+            return lambda rng: None
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"])
+        if "const" in schema:
+            const = schema["const"]
+            return lambda rng: const
+        if "enum" in schema:
+            choices = list(schema["enum"])
+            return lambda rng: rng.choice(choices)
+        if "allOf" in schema:
+            return self.compile(_merge_schemas(schema["allOf"], schema))
+        for keyword in ("oneOf", "anyOf"):
+            if keyword in schema:
+                options = [self.compile(option) for option in schema[keyword]]
+                return lambda rng: rng.choice(options)(rng)
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            options = [self.compile({**schema, "type": option}) for option in schema_type]
+            return lambda rng: rng.choice(options)(rng)
+        if schema_type is None:
+            schema_type = _infer_type(schema)
+        compilers: dict[str, Callable[[dict[str, Any]], ValueGenerator]] = {
+            "object": self._compile_object,
+            "array": self._compile_array,
+            "string": _compile_string,
+            "integer": _compile_integer,
+            "number": _compile_number,
+            "boolean": _compile_boolean,
+            "null": _compile_null,
+        }
+        return compilers.get(schema_type, _compile_string)(schema)
+
+    def _compile_ref(self, ref: str) -> ValueGenerator:
+        """Compile a local $ref, compiling each referenced schema once.
+
+        Recursive references generate None once they are nested too deeply.
+
+        :param ref: The reference, like "#/$defs/Item"
+        :return: Function generating a value matching the referenced schema
+        :raises ValueError: If the reference is not local or can't be resolved
+        """
+        if ref in self._refs:
+            return self._refs[ref]
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local $ref are supported, got '{ref}'")
+        target: Any = self.root
+        for part in filter(None, ref[1:].split("/")):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or part not in target:
+                raise ValueError(f"Can't resolve $ref '{ref}'")
+            target = target[part]
+
+        # Register a placeholder first so recursive schemas terminate
+        compiled: ValueGenerator | None = None
+        depth = 0
+
+        def generate_ref(rng: random.Random) -> Any:
+            nonlocal depth
+            if compiled is None or depth >= 3:
+                return None
+            depth += 1
+            try:
+                return compiled(rng)
+            finally:
+                depth -= 1
+
+        self._refs[ref] = generate_ref
+        compiled = self.compile(target)
+        return generate_ref
+
+    def _compile_object(self, schema: dict[str, Any]) -> ValueGenerator:
+        """Compile an object schema.
+
+        Required properties are always generated, even when they aren't listed in
+        the properties, optional ones half of the time.
+
+        :param schema: The object schema
+        :return: Function generating a matching object
+        """
+        required = set(schema.get("required", []))
+        property_schemas = schema.get("properties", {})
+        properties = [
+            (name, name in required, self.compile(property_schema))
+            for name, property_schema in property_schemas.items()
+        ]
+        # Required properties without a schema of their own follow additionalProperties
+        additional = schema.get("additionalProperties")
+        generate_additional = self.compile(additional if isinstance(additional, dict) else {})
+        properties += [
+            (name, True, generate_additional) for name in schema.get("required", []) if name not in property_schemas
+        ]
+
+        def generate_object(rng: random.Random) -> dict[str, Any]:
+            return {
+                name: generate(rng) for name, is_required, generate in properties if is_required or rng.random() < 0.5
+            }
+
+        return generate_object
+
+    def _compile_array(self, schema: dict[str, Any]) -> ValueGenerator:
+        """Compile an array schema.
+
+        :param schema: The array schema
+        :return: Function generating a matching array
+        """
+        items = schema.get("items", {})
+        generate_item = self.compile(items) if isinstance(items, dict) else (lambda rng: None)
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems", max(min_items, 5))
+        return lambda rng: [generate_item(rng) for _ in range(rng.randint(min_items, max_items))]
+
+
+def _compile_string(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile a string schema.
+
+    :param schema: The string schema
+    :return: Function generating a matching string
+    """
+    string_format = schema.get("format")
+    if string_format == "date-time":
+        return lambda rng: (_EPOCH + timedelta(seconds=rng.randrange(5 * 365 * 86400))).isoformat()
+    if string_format == "date":
+        return lambda rng: (_EPOCH + timedelta(days=rng.randrange(5 * 365))).date().isoformat()
+    if string_format == "email":
+        return lambda rng: f"{rng.choice(_WORDS)}.{rng.choice(_WORDS)}@example.com"
+    if string_format == "uuid":
+        return lambda rng: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    if string_format in ("uri", "url"):
+        return lambda rng: f"https://example.com/{rng.choice(_WORDS)}/{rng.randrange(1000)}"
+
+    min_length = schema.get("minLength", 0)
+    max_length = schema.get("maxLength", max(min_length, 32))
+
+    def generate_string(rng: random.Random) -> str:
+        length = rng.randint(min_length, max_length)
+        text = " ".join(rng.choices(_WORDS, k=length // 4 + 1))[:length]
+        return text.ljust(length, rng.choice(string.ascii_lowercase))
+
+    return generate_string
+
+
+def _compile_integer(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile an integer schema.
+
+    :param schema: The integer schema
+    :return: Function generating a matching integer
+    :raises ValueError: If no integer is within the bounds of the schema
+    """
+    lower, lower_exclusive, upper, upper_exclusive = _bounds(schema)
+    minimum = None if lower is None else math.floor(lower) + 1 if lower_exclusive else math.ceil(lower)
+    maximum = None if upper is None else math.ceil(upper) - 1 if upper_exclusive else math.floor(upper)
+    minimum, maximum = _default_range(minimum, maximum)
+    if minimum > maximum:
+        raise ValueError(f"No integer between the bounds of schema {schema}")
+    return lambda rng: rng.randint(minimum, maximum)
+
+
+def _compile_number(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile a number schema.
+
+    Numbers are rounded to 2 decimals, unless rounding them would leave the bounds.
+
+    :param schema: The number schema
+    :return: Function generating a matching number
+    :raises ValueError: If no number is within the bounds of the schema
+    """
+    lower, lower_exclusive, upper, upper_exclusive = _bounds(schema)
+    minimum, maximum = _default_range(lower, upper)
+    if minimum > maximum or (minimum == maximum and (lower_exclusive or upper_exclusive)):
+        raise ValueError(f"No number between the bounds of schema {schema}")
+
+    def within_bounds(value: float) -> bool:
+        above = value > minimum or (value == minimum and not lower_exclusive)
+        below = value < maximum or (value == maximum and not upper_exclusive)
+        return above and below
+
+    def generate_number(rng: random.Random) -> float:
+        value = rng.uniform(minimum, maximum)
+        rounded = round(value, 2)
+        if within_bounds(rounded):
+            return rounded
+        # Drawn at an exclusive bound
+        return value if within_bounds(value) else (minimum + maximum) / 2
+
+    return generate_number
+
+
+def _bounds(schema: dict[str, Any]) -> tuple[float | None, bool, float | None, bool]:
+    """Get the bounds of a numeric schema.
+
+    Exclusive bounds can be numbers (JSON Schema draft 6 and later) or booleans
+    making minimum and maximum exclusive (draft 4 and OpenAPI 3.0).
+
+    :param schema: The integer or number schema
+    :return: Tuple of (lower bound, whether it is exclusive, upper bound, whether it is exclusive),
+        None for missing bounds
+    """
+    lower, lower_exclusive = schema.get("minimum"), schema.get("exclusiveMinimum", False)
+    if not isinstance(lower_exclusive, bool):
+        if lower is None or lower_exclusive >= lower:
+            lower, lower_exclusive = lower_exclusive, True
+        else:
+            lower_exclusive = False
+    upper, upper_exclusive = schema.get("maximum"), schema.get("exclusiveMaximum", False)
+    if not isinstance(upper_exclusive, bool):
+        if upper is None or upper_exclusive <= upper:
+            upper, upper_exclusive = upper_exclusive, True
+        else:
+            upper_exclusive = False
+    return lower, lower_exclusive and lower is not None, upper, upper_exclusive and upper is not None
+
+
+def _default_range(minimum: T | None, maximum: T | None) -> tuple[T | int, T | int]:
+    """Fill in the missing bounds of a numeric range, spanning 1000 from the given bound or from 0.
+
+    :param minimum: The lower bound, or None
+    :param maximum: The upper bound, or None
+    :return: Tuple of (minimum, maximum)
+    """
+    if minimum is None:
+        if maximum is None:
+            return 0, 1000
+        return (0 if maximum >= 0 else maximum - 1000), maximum
+    return minimum, minimum + 1000 if maximum is None else maximum
+
+
+def _compile_boolean(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile a boolean schema.
+
+    :param schema: The boolean schema
+    :return: Function generating a boolean
+    """
+    return lambda rng: rng.random() < 0.5
+
+
+def _compile_null(schema: dict[str, Any]) -> ValueGenerator:
+    """Compile a null schema.
+
+    :param schema: The null schema
+    :return: Function generating None
+    """
+    return lambda rng: None
+
+
+def _infer_type(schema: dict[str, Any]) -> str:
+    """Infer the type of a schema without a type keyword from its other keywords.
+
+    :param schema: The schema
+    :return: The inferred JSON type
+    """
+    if "properties" in schema or "additionalProperties" in schema:
+        return "object"
+    if "items" in schema:
+        return "array"
+    if any(keyword in schema for keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")):
+        return "number"
+    return "string"
+
+
+def _merge_schemas(schemas: list[dict[str, Any]], parent: dict[str, Any]) -> dict[str, Any]:
+    """Merge the schemas of an allOf into a single schema.
+
+    :param schemas: Schemas that must all match
+    :param parent: Schema containing the allOf, merged first
+    :return: The merged schema
+    """
+    merged: dict[str, Any] = {key: value for key, value in parent.items() if key != "allOf"}
+    for schema in schemas:
+        for key, value in schema.items():
+            if key == "properties":
+                merged["properties"] = {**merged.get("properties", {}), **value}
+            elif key == "required":
+                merged["required"] = [*merged.get("required", []), *value]
+            else:
+                merged[key] = value
+    return merged
@@ -0,0 +1,35 @@
+"""Lazy exports for packages whose modules pull in heavy optional dependencies.
+
+Packages list the attributes they export and the modules defining them. The
+modules are only imported when one of their attributes is first accessed, so
+importing a package doesn't import litellm, FastAPI and the like for configs
+that don't use them.
+"""
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module `__getattr__` and `__dir__` functions of a package with lazy exports.
+
+    :param package: Name of the package, usually `__name__`
+    :param exports: Map of the exported attribute names to the relative names of their modules
+    :return: The `__getattr__` and `__dir__` functions to define in the package
+    """
+    package_module = import_module(package)
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name, package), name)
+        # Cache the attribute so the module __getattr__ is only called once per name
+        setattr(package_module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(package_module), *exports})
+
+    return __getattr__, __dir__
@@ -3,11 +3,20 @@
 from contextlib import AsyncExitStack
 from typing import Any
 
-from mcp import ClientSession
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.session import MessageHandlerFnT
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.message import SessionMessage
 
 
-async def http_streamable_session(url: str, headers: dict[str, Any] | None) -> tuple[ClientSession, AsyncExitStack]:
+async def http_streamable_session(
+    url: str,
+    headers: dict[str, Any] | None,
+    message_handler: MessageHandlerFnT | None = None,
+) -> tuple[ClientSession, AsyncExitStack]:
     """Create an HTTP streamable MCP client session.
 
     Establishes a connection to an MCP server over HTTP and returns both
@@ -15,11 +24,67 @@ async def http_streamable_session(url: str, headers: dict[str, Any] | None) -> t
 
     :param url: URL of the MCP server
     :param headers: Optional HTTP headers to include in requests
+    :param message_handler: Optional handler for server notifications and requests
     :return: Tuple of (ClientSession, AsyncExitStack) for the connection
     """
     exit_stack = AsyncExitStack()
     read, write, *_ = await exit_stack.enter_async_context(streamablehttp_client(url=url, headers=headers))
-    mcp_session = await exit_stack.enter_async_context(ClientSession(read, write))
+    return await _client_session(exit_stack, read, write, message_handler), exit_stack
+
+
+async def sse_session(
+    url: str,
+    headers: dict[str, Any] | None,
+    message_handler: MessageHandlerFnT | None = None,
+) -> tuple[ClientSession, AsyncExitStack]:
+    """Create an SSE MCP client session.
+
+    Establishes a connection to an MCP server over the legacy HTTP+SSE transport and
+    returns both the session and the exit stack for proper cleanup.
+
+    :param url: URL of the MCP server SSE endpoint
+    :param headers: Optional HTTP headers to include in requests
+    :param message_handler: Optional handler for server notifications and requests
+    :return: Tuple of (ClientSession, AsyncExitStack) for the connection
+    """
+    exit_stack = AsyncExitStack()
+    read, write = await exit_stack.enter_async_context(sse_client(url=url, headers=headers))
+    return await _client_session(exit_stack, read, write, message_handler), exit_stack
+
+
+async def stdio_session(
+    server_parameters: StdioServerParameters,
+    message_handler: MessageHandlerFnT | None = None,
+) -> tuple[ClientSession, AsyncExitStack]:
+    """Create a stdio MCP client session.
+
+    Spawns the MCP server as a subprocess, talks to it over stdin/stdout and returns
+    both the session and the exit stack that terminates the subprocess.
+
+    :param server_parameters: Command, arguments and environment of the server process
+    :param message_handler: Optional handler for server notifications and requests
+    :return: Tuple of (ClientSession, AsyncExitStack) for the connection
+    """
+    exit_stack = AsyncExitStack()
+    read, write = await exit_stack.enter_async_context(stdio_client(server_parameters))
+    return await _client_session(exit_stack, read, write, message_handler), exit_stack
+
+
+async def _client_session(
+    exit_stack: AsyncExitStack,
+    read: MemoryObjectReceiveStream[SessionMessage | Exception],
+    write: MemoryObjectSendStream[SessionMessage],
+    message_handler: MessageHandlerFnT | None,
+) -> ClientSession:
+    """Open and initialize a client session over the given transport streams.
+
+    :param exit_stack: Exit stack that owns the transport
+    :param read: Stream of messages from the server
+    :param write: Stream of messages to the server
+    :param message_handler: Optional handler for server notifications and requests
+    :return: The initialized client session
+    """
+    mcp_session = await exit_stack.enter_async_context(ClientSession(read, write, message_handler=message_handler))
     await mcp_session.initialize()
 
-    return mcp_session, exit_stack
+    return mcp_session
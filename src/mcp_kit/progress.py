@@ -0,0 +1,100 @@
+"""Progress reporting from tool call handling back to the MCP client.
+
+Adapters that can notify the client about progress (like the official MCP
+server) install a progress callback for the duration of a tool call. Targets
+and generators called while handling it, however deeply wrapped, report
+progress without it being passed through every call_tool signature.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[float, str | None], Awaitable[None]]
+"""Callback receiving the progress so far and an optional message."""
+
+_progress_callback: ContextVar[ProgressCallback | None] = ContextVar("progress_callback", default=None)
+
+
+@contextmanager
+def progress_reporting(callback: ProgressCallback) -> Iterator[None]:
+    """Send the progress reported in this context to a callback.
+
+    :param callback: Callback receiving the progress so far and an optional message
+    :yield: Nothing, progress is reported to the callback until the context exits
+    """
+    token = _progress_callback.set(callback)
+    try:
+        yield
+    finally:
+        _progress_callback.reset(token)
+
+
+def current_progress_callback() -> ProgressCallback | None:
+    """Get the callback progress reported in this context is sent to.
+
+    :return: The progress callback, or None if progress isn't reported
+    """
+    return _progress_callback.get()
+
+
+def is_progress_reported() -> bool:
+    """Check whether progress reported in this context is sent anywhere.
+
+    :return: True if a progress callback is installed
+    """
+    return _progress_callback.get() is not None
+
+
+async def report_progress(progress: float, message: str | None = None) -> None:
+    """Report progress to the callback of the current context, if any.
+
+    :param progress: Progress so far, increasing with every report
+    :param message: Optional message describing the progress
+    """
+    callback = _progress_callback.get()
+    if callback is not None:
+        await callback(progress, message)
+
+
+class ProgressFanOut:
+    """Progress callback sending the progress to several callbacks.
+
+    Used when work is shared by several callers, like identical requests coalesced
+    into one, so every caller gets the progress from the time it joined. A failing
+    callback is logged, without failing the work or the other callbacks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the fan-out without callbacks."""
+        self._callbacks: list[ProgressCallback] = []
+
+    def add(self, callback: ProgressCallback) -> None:
+        """Send the progress to a callback.
+
+        :param callback: Callback receiving the progress so far and an optional message
+        """
+        self._callbacks.append(callback)
+
+    def discard(self, callback: ProgressCallback) -> None:
+        """Stop sending the progress to a callback.
+
+        :param callback: A callback added before
+        """
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    async def __call__(self, progress: float, message: str | None = None) -> None:
+        """Send progress to every callback.
+
+        :param progress: Progress so far, increasing with every report
+        :param message: Optional message describing the progress
+        """
+        for callback in list(self._callbacks):
+            try:
+                await callback(progress, message)
+            except Exception:
+                logger.warning("Failed to report progress", exc_info=True)
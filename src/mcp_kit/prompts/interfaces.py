@@ -14,6 +14,9 @@ class PromptEngine(ConfigurableMixin):
     specific arguments.
     """
 
+    deterministic: bool = False
+    """Whether the engine always generates the same result for the same prompt and arguments."""
+
     @abstractmethod
     async def generate(
         self,
@@ -1,6 +1,10 @@
 """Interpolation prompt engine for safe string substitution."""
 
-from dataclasses import dataclass
+import re
+import string
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
 
 from mcp.types import GetPromptResult, Prompt, PromptMessage, TextContent
 from omegaconf import DictConfig
@@ -8,22 +12,136 @@ from typing_extensions import Self
 
 from mcp_kit.prompts.interfaces import PromptEngine
 
+_FIELD_ROOT = re.compile(r"[^.\[]*")
+
+
+@dataclass(frozen=True)
+class _Field:
+    """A replacement field of a template.
+
+    :param name: Field name, possibly with attribute or index lookups like `user.name`
+    :param argument: Name of the argument the field is looked up in
+    :param conversion: Optional conversion ("r", "s" or "a")
+    :param format_spec: Format specification, itself a template when it contains fields
+    """
+
+    name: str
+    argument: str
+    conversion: str | None
+    format_spec: "str | PromptTemplate"
+    simple: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Check whether the field is a plain argument, rendered as the argument value."""
+        object.__setattr__(
+            self, "simple", self.name == self.argument and self.conversion is None and self.format_spec == ""
+        )
+
+
+class PromptTemplate:
+    """A `{placeholder}` template parsed once into literal and field segments.
+
+    Templates follow the `str.format` syntax with named fields only. Parsing
+    happens once, so rendering is a lookup per field and a single join.
+    """
+
+    _formatter = string.Formatter()
+
+    def __init__(self, text: str) -> None:
+        """Parse a template.
+
+        :param text: Template with `{placeholder}` syntax
+        :raises ValueError: If the template is malformed or has positional fields
+        """
+        self.text = text
+        self.segments: list[str | _Field] = []
+        arguments: dict[str, None] = {}
+        for literal, name, format_spec, conversion in self._formatter.parse(text):
+            if literal:
+                self.segments.append(literal)
+            if name is None:
+                continue
+            argument = _FIELD_ROOT.match(name).group()  # type: ignore[union-attr]
+            if not argument or argument.isdigit():
+                raise ValueError(f"Positional placeholder '{{{name}}}' is not supported, use named placeholders")
+            arguments[argument] = None
+            spec: str | PromptTemplate = format_spec or ""
+            if format_spec and "{" in format_spec:
+                spec = PromptTemplate(format_spec)
+                arguments.update(dict.fromkeys(spec.arguments))
+            self.segments.append(_Field(name, argument, conversion, spec))
+        self.arguments: tuple[str, ...] = tuple(arguments)
+        """Names of the arguments used by the template, in order of appearance."""
+
+    def render(self, arguments: Mapping[str, Any], defaults: Mapping[str, Any] | None = None) -> str:
+        """Render the template.
+
+        :param arguments: Values of the template arguments
+        :param defaults: Optional default values of the arguments missing from `arguments`
+        :return: The rendered text
+        :raises KeyError: If an argument is missing
+        """
+        defaults = defaults or {}
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+            elif segment.simple:
+                name = segment.argument
+                parts.append(str(arguments[name] if name in arguments else defaults[name]))
+            else:
+                parts.append(self._render_field(segment, {**defaults, **arguments}))
+        return "".join(parts)
+
+    def _render_field(self, segment: _Field, arguments: Mapping[str, Any]) -> str:
+        """Render a field with lookups, a conversion or a format specification.
+
+        :param segment: The field
+        :param arguments: Values of the template arguments
+        :return: The rendered field
+        """
+        value, _ = self._formatter.get_field(segment.name, (), arguments)
+        if segment.conversion is not None:
+            value = self._formatter.convert_field(value, segment.conversion)
+        format_spec = segment.format_spec
+        if isinstance(format_spec, PromptTemplate):
+            format_spec = format_spec.render(arguments)
+        return format(value, format_spec)
+
 
 @dataclass
 class InterpolationPrompt:
     """A prompt with interpolation text and optional default values.
 
+    The text is compiled into a template when the prompt is created.
+
     :param text: The prompt string with `{placeholder}` syntax
     :param defaults: Optional default values for placeholders
     """
 
     text: str
     defaults: dict[str, str] | None = None
+    template: PromptTemplate = field(init=False, repr=False, compare=False)
+    required_arguments: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Initialize defaults as empty dict if None."""
+        """Initialize defaults as empty dict if None, and compile the text.
+
+        :raises ValueError: If the text is not a valid template
+        """
         if self.defaults is None:
             self.defaults = {}
+        self.template = PromptTemplate(self.text)
+        self.required_arguments = tuple(name for name in self.template.arguments if name not in self.defaults)
+
+    def render(self, arguments: Mapping[str, str]) -> str:
+        """Render the prompt text.
+
+        :param arguments: Prompt arguments, taking precedence over the defaults
+        :return: The interpolated text
+        :raises KeyError: If a required argument is missing
+        """
+        return self.template.render(arguments, self.defaults)
 
 
 class InterpolationPromptEngine(PromptEngine):
@@ -34,6 +152,8 @@ class InterpolationPromptEngine(PromptEngine):
     executing arbitrary code like f-strings would.
     """
 
+    deterministic = True
+
     def __init__(self, prompts: dict[str, InterpolationPrompt]):
         """Initialize the interpolation prompt engine.
 
@@ -80,7 +200,10 @@ class InterpolationPromptEngine(PromptEngine):
 
             text = prompt_config["text"]
             defaults = dict(prompt_config.get("defaults", {}))
-            prompts[name] = InterpolationPrompt(text=text, defaults=defaults)
+            try:
+                prompts[name] = InterpolationPrompt(text=text, defaults=defaults)
+            except ValueError as e:
+                raise ValueError(f"Invalid text for prompt '{name}': {e}") from None
 
         return cls(prompts)
 
@@ -92,8 +215,8 @@ class InterpolationPromptEngine(PromptEngine):
     ) -> GetPromptResult:
         """Generate a prompt response using prompt interpolation.
 
-        Safely substitutes argument values into the prompt string using
-        simple string replacement without executing code. Uses default values
+        Safely substitutes argument values into the prompt template compiled
+        from the prompt string, without executing code. Uses default values
         for missing arguments when available.
 
         :param target_name: Name of the target that would handle the prompt call
@@ -107,19 +230,12 @@ class InterpolationPromptEngine(PromptEngine):
 
         interpolation_prompt = self.prompts[prompt.name]
         arguments = arguments or {}
-
-        # Merge provided arguments with defaults (provided arguments take precedence)
-        # Ensure defaults is not None before unpacking
-        defaults = interpolation_prompt.defaults or {}
-        final_arguments = {**defaults, **arguments}
+        for name in interpolation_prompt.required_arguments:
+            if name not in arguments:
+                raise ValueError(f"Missing required argument '{name}' for prompt '{prompt.name}'")
 
         try:
-            # Use safe string replacement with format() instead of f-strings
-            # This only replaces named placeholders and doesn't execute code
-            interpolated_text = interpolation_prompt.text.format(**final_arguments)
-        except KeyError as e:
-            missing_arg = str(e).strip("'\"")
-            raise ValueError(f"Missing required argument '{missing_arg}' for prompt '{prompt.name}'") from None
+            interpolated_text = interpolation_prompt.render(arguments)
         except Exception as e:
             raise ValueError(f"Failed to interpolate prompt for prompt '{prompt.name}': {e}") from None
 
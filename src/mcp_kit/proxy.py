@@ -9,7 +9,7 @@ from typing import Any
 from mcp import Tool
 from mcp.server import Server
 from mcp.types import Content
-from omegaconf import OmegaConf
+from omegaconf import DictConfig, ListConfig, OmegaConf
 from typing_extensions import Self
 
 from mcp_kit.adapters import (
@@ -18,6 +18,9 @@ from mcp_kit.adapters import (
     OpenAIMCPServerAdapter,
 )
 from mcp_kit.factory import create_target_from_config
+from mcp_kit.progress import progress_reporting
+from mcp_kit.snapshot import create_target_from_snapshot, read_snapshot
+from mcp_kit.startup import StartupConfig, StartupReport, start_target
 from mcp_kit.targets import Target
 
 logger = logging.getLogger(__name__)
@@ -31,12 +34,15 @@ class ProxyMCP:
     OpenAI Agents SDK, official MCP servers, and LangGraph compatibility.
     """
 
-    def __init__(self, target: Target) -> None:
+    def __init__(self, target: Target, startup: StartupConfig | None = None) -> None:
         """Initialize the ProxyMCP with a target MCP server.
 
         :param target: The target MCP server to proxy requests to
+        :param startup: Optional configuration of the startup of the target tree
         """
         self.target = target
+        self.startup = startup
+        self.startup_report: StartupReport | None = None
 
     @classmethod
     def from_config(cls, config_file: str | Path) -> Self:
@@ -47,7 +53,33 @@ class ProxyMCP:
         """
         config = OmegaConf.load(config_file)
         target = create_target_from_config(config.target)
-        return cls(target)
+        return cls(target, _startup_from_config(config))
+
+    @classmethod
+    def from_snapshot(cls, snapshot_file: str | Path) -> Self:
+        """Factory method to create ProxyMCP from a snapshot compiled with `mcp-kit compile`.
+
+        Loading a snapshot is much faster than loading its configuration file when
+        the configuration declares large tool or prompt catalogs.
+
+        :param snapshot_file: Path to the snapshot file
+        :return: ProxyMCP instance
+        :raises ValueError: If the file is not a valid snapshot
+        """
+        snapshot = read_snapshot(snapshot_file)
+        target = create_target_from_snapshot(snapshot)
+        return cls(target, _startup_from_config(OmegaConf.create(snapshot.config)))
+
+    async def start(self) -> StartupReport:
+        """Initialize the target tree, with maximum concurrency and the configured timeouts.
+
+        The adapters start the target tree when they are opened, the report of
+        the last startup is kept in `startup_report`.
+
+        :return: Report of the startup timings of each target of the tree
+        """
+        self.startup_report = await start_target(self.target, self.startup)
+        return self.startup_report
 
     @asynccontextmanager
     async def client_session_adapter(self) -> AsyncIterator[Any]:
@@ -59,7 +91,7 @@ class ProxyMCP:
         :yield: ClientSessionAdapter for the target
         """
         try:
-            await self.target.initialize()
+            await self.start()
             yield ClientSessionAdapter(self.target)
         finally:
             await self.target.close()
@@ -75,7 +107,8 @@ class ProxyMCP:
         """
         adapter = OpenAIMCPServerAdapter(self.target)
         try:
-            await adapter.connect()
+            # Starting the target tree is what connecting the adapter does
+            await self.start()
             yield adapter
         finally:
             await adapter.cleanup()
@@ -85,11 +118,12 @@ class ProxyMCP:
         """Convert the target to an official MCP server.
 
         Creates a standard MCP Server instance that wraps the target,
-        allowing it to be used with official MCP tooling.
+        allowing it to be used with official MCP tooling. Progress reported by
+        the target while handling a tool call is sent to clients that asked for it.
 
         :yield: Official MCP Server instance wrapping the target
         """
-        await self.target.initialize()
+        await self.start()
 
         try:
             wrapped_mcp: Server[Any] = Server(self.target.name)
@@ -109,11 +143,29 @@ class ProxyMCP:
             ) -> Iterable[Content]:
                 """Handle call_tool requests for the wrapped server.
 
+                When the client asks for progress, the progress reported while
+                handling the call (like streamed LLM chunks) is sent to the client
+                as progress notifications.
+
                 :param name: Name of the tool to call
                 :param arguments: Arguments to pass to the tool
                 :return: Iterable of content responses from the tool
                 """
-                return await self.target.call_tool(name=name, arguments=arguments)
+                context = wrapped_mcp.request_context
+                progress_token = context.meta.progressToken if context.meta is not None else None
+                if progress_token is None:
+                    return await self.target.call_tool(name=name, arguments=arguments)
+
+                async def send_progress(progress: float, message: str | None) -> None:
+                    await context.session.send_progress_notification(
+                        progress_token,
+                        progress,
+                        message=message,
+                        related_request_id=str(context.request_id),
+                    )
+
+                with progress_reporting(send_progress):
+                    return await self.target.call_tool(name=name, arguments=arguments)
 
             yield wrapped_mcp
         finally:
@@ -127,4 +179,16 @@ class ProxyMCP:
 
         :return: LangGraphMultiServerMCPClient adapter for the target
         """
-        return LangGraphMultiServerMCPClient(self.target)
+        return LangGraphMultiServerMCPClient(self.target, self.start)
+
+
+def _startup_from_config(config: DictConfig | ListConfig) -> StartupConfig | None:
+    """Create the startup configuration from the `startup` section of a configuration.
+
+    :param config: The whole configuration from OmegaConf
+    :return: StartupConfig instance, or None if the configuration has no `startup` section
+    """
+    startup_config = config.get("startup") if isinstance(config, DictConfig) else None
+    if startup_config is None:
+        return None
+    return StartupConfig(**startup_config)
@@ -0,0 +1,69 @@
+"""Token bucket rate limiting for calls to rate limited services."""
+
+import asyncio
+import time
+
+from typing_extensions import Self
+
+
+class TokenBucket:
+    """Token bucket that limits how fast tokens (requests, LLM tokens...) are spent.
+
+    The bucket refills at `rate` tokens per second up to `capacity`. Acquiring
+    tokens waits until enough are available, and waiters are served in order.
+    Tokens can also be consumed without waiting, letting the balance go negative
+    when the actual cost of a call is only known after it was made.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full token bucket.
+
+        :param rate: Number of tokens added per second
+        :param capacity: Maximum number of tokens in the bucket
+        :raises ValueError: If the rate or capacity is not positive
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"Invalid token bucket: rate={rate}, capacity={capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> Self:
+        """Create a bucket allowing `limit` tokens per minute.
+
+        :param limit: Number of tokens allowed per minute
+        :return: TokenBucket instance
+        """
+        return cls(rate=limit / 60, capacity=limit)
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until enough tokens are available, then take them.
+
+        Amounts larger than the capacity only wait for a full bucket.
+
+        :param amount: Number of tokens to take
+        """
+        async with self._lock:
+            needed = min(amount, self.capacity)
+            self._refill()
+            while self.tokens < needed:
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+    def consume(self, amount: float) -> None:
+        """Take tokens without waiting, or give them back with a negative amount.
+
+        :param amount: Number of tokens to take
+        """
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
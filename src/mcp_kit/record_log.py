@@ -0,0 +1,176 @@
+"""Append-only JSONL log of recorded MCP traffic, with size based rotation."""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class RecordLog:
+    """Append-only log of records, one JSON object per line.
+
+    Records are appended to the file at `path`. Once it grows over `max_bytes`,
+    the file is renamed with an increasing segment number (`calls.000001.jsonl`
+    for `calls.jsonl`) and a new file is started. With `backup_count`, only that
+    many rotated segments are kept.
+
+    From the event loop, records are queued with `append_nowait` and appended
+    in order by a writer task, in batches written from a worker thread, so the
+    file I/O doesn't block the other requests.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int | None = None, backup_count: int | None = None) -> None:
+        """Initialize the log.
+
+        :param path: Path of the current log file
+        :param max_bytes: Optional size in bytes after which the log file is rotated
+        :param backup_count: Optional number of rotated log files to keep
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file: TextIO | None = None
+        self._size = 0
+        self._lock = threading.Lock()
+        self._queue: list[str] = []
+        self._writer: asyncio.Task[None] | None = None
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append a record to the log, rotating the log file if it is full.
+
+        :param record: JSON serializable record
+        """
+        self._write([_encode(record)])
+
+    def append_nowait(self, record: dict[str, Any]) -> None:
+        """Queue a record to be appended by the writer task, without blocking the event loop.
+
+        The record is encoded right away, so it can be modified once queued.
+
+        :param record: JSON serializable record
+        """
+        self._queue.append(_encode(record))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.get_running_loop().create_task(self._write_queued())
+
+    async def flush(self) -> None:
+        """Wait until the queued records are appended."""
+        while self._writer is not None and not self._writer.done():
+            await asyncio.shield(self._writer)
+
+    async def aclose(self) -> None:
+        """Append the queued records and close the current log file."""
+        await self.flush()
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        """Close the current log file."""
+        with self._lock:
+            self._close_file()
+
+    async def _write_queued(self) -> None:
+        """Append the queued records from a worker thread until the queue is empty."""
+        while self._queue:
+            lines, self._queue = self._queue, []
+            try:
+                await asyncio.to_thread(self._write, lines)
+            except Exception:
+                logger.exception("Failed to append %d records to %s", len(lines), self.path)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append encoded records to the log, rotating the log file when it is full.
+
+        :param lines: Records encoded as JSON lines
+        """
+        with self._lock:
+            for line in lines:
+                size = len(line.encode())
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = self.path.open("a", encoding="utf-8")
+                    self._size = self._file.tell()
+                elif self.max_bytes is not None and self._size > 0 and self._size + size > self.max_bytes:
+                    self._rotate()
+                assert self._file is not None
+                self._file.write(line)
+                self._size += size
+            if self._file is not None:
+                self._file.flush()
+
+    def _close_file(self) -> None:
+        """Close the current log file, with the lock held."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self) -> None:
+        """Rename the current log file to the next segment and start a new one, with the lock held."""
+        self._close_file()
+        segments = log_segments(self.path)[:-1]
+        index = _segment_index(self.path, segments[-1]) + 1 if segments else 1
+        self.path.rename(self.path.with_name(f"{self.path.stem}.{index:06d}{self.path.suffix}"))
+        if self.backup_count is not None:
+            segments = log_segments(self.path)
+            for segment in segments[: max(0, len(segments) - self.backup_count)]:
+                segment.unlink(missing_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._size = 0
+
+
+def log_segments(path: str | Path) -> list[Path]:
+    """List the files of a log, oldest first, the current log file last.
+
+    :param path: Path of the current log file
+    :return: Existing rotated segments in order, then the current log file if it exists
+    """
+    path = Path(path)
+    pattern = re.compile(rf"{re.escape(path.stem)}\.(\d+){re.escape(path.suffix)}")
+    candidates = path.parent.glob(f"{path.stem}.*{path.suffix}")
+    segments = sorted(
+        (candidate for candidate in candidates if pattern.fullmatch(candidate.name)),
+        key=lambda candidate: _segment_index(path, candidate),
+    )
+    if path.exists():
+        segments.append(path)
+    return segments
+
+
+def read_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Read the records of a log, including its rotated segments, oldest first.
+
+    A truncated last line (when the recording process was killed) is skipped.
+
+    :param path: Path of the current log file
+    :return: Iterator over the records
+    """
+    for segment in log_segments(path):
+        with segment.open(encoding="utf-8") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                yield json.loads(line)
+
+
+def _encode(record: dict[str, Any]) -> str:
+    """Encode a record as a JSON line.
+
+    :param record: JSON serializable record
+    :return: The compact JSON line, with its line break
+    """
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _segment_index(path: Path, segment: Path) -> int:
+    """Get the number of a rotated segment.
+
+    :param path: Path of the current log file
+    :param segment: Path of the segment
+    :return: The segment number
+    """
+    return int(segment.name[len(path.stem) + 1 : len(segment.name) - len(path.suffix)])
@@ -0,0 +1,120 @@
+"""Registries of the configurable types of targets, generators and prompt engines.
+
+A registry maps the `type` of a config node to the class created from it. Types
+come from the built-in types, from types registered in code, and from the
+installed packages declaring entry points in the registry group, so plugins can
+provide their own targets, generators and prompt engines:
+
+```toml
+[project.entry-points."mcp_kit.targets"]
+my_target = "my_package.targets:MyTarget"
+```
+
+Classes are imported on first use and cached, so resolving a type is a
+dictionary lookup after the first time.
+"""
+
+import logging
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Registry(Generic[T]):
+    """Registry of the classes of a kind of configurable object, by config type name."""
+
+    def __init__(self, kind: str, entry_point_group: str, builtins: dict[str, str] | None = None) -> None:
+        """Initialize the registry.
+
+        :param kind: Name of the kind of object for error messages (e.g., "target", "generator")
+        :param entry_point_group: Entry point group that plugins declare their types in
+        :param builtins: Built-in types, mapped to the "module:Class" path of their class
+        """
+        self.kind = kind
+        self.entry_point_group = entry_point_group
+        self._paths: dict[str, str] = dict(builtins or {})
+        self._classes: dict[str, type[T]] = {}
+        self._entry_points_loaded = False
+
+    def register(self, name: str, cls: type[T] | str) -> None:
+        """Register a type, replacing any type with the same name.
+
+        :param name: Type name used in configs
+        :param cls: The class, or the "module:Class" path to import it from on first use
+        """
+        self._classes.pop(name, None)
+        if isinstance(cls, str):
+            self._paths[name] = cls
+        else:
+            self._paths.pop(name, None)
+            self._classes[name] = cls
+
+    def resolve(self, name: str) -> type[T]:
+        """Get the class of a type, importing it on first use.
+
+        Types that are neither built in, registered nor declared by an entry point
+        can be given as a "module:Class" path.
+
+        :param name: Type name used in configs
+        :return: The class of the type
+        :raises ValueError: If the type is unknown or its class can't be imported
+        """
+        cls = self._classes.get(name)
+        if cls is not None:
+            return cls
+
+        path = self._paths.get(name)
+        if path is None and not self._entry_points_loaded:
+            self._load_entry_points()
+            path = self._paths.get(name)
+        if path is None and ":" in name:
+            path = name
+        if path is None:
+            raise ValueError(f"Unknown {self.kind} type '{name}'. Known {self.kind} types: {', '.join(self.names())}")
+
+        module_name, _, class_name = path.partition(":")
+        try:
+            module = import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name == module_name or module_name.startswith(f"{e.name}."):
+                raise ValueError(f"Unknown {self.kind} type '{name}'. No module found for '{path}'.") from e
+            raise ValueError(f"Failed to import {self.kind} type '{name}' from '{module_name}': {e}") from e
+        except ImportError as e:
+            raise ValueError(f"Failed to import {self.kind} type '{name}' from '{module_name}': {e}") from e
+        try:
+            loaded: type[T] = getattr(module, class_name)
+        except AttributeError as e:
+            raise ValueError(f"Unknown {self.kind} type '{name}'. Class '{class_name}' not found in module.") from e
+
+        self._classes[name] = loaded
+        return loaded
+
+    def names(self) -> list[str]:
+        """List the known type names.
+
+        :return: Sorted names of the built-in, registered and plugin types
+        """
+        if not self._entry_points_loaded:
+            self._load_entry_points()
+        return sorted({*self._paths, *self._classes})
+
+    def _load_entry_points(self) -> None:
+        """Add the types declared by the entry points of installed packages.
+
+        Built-in and registered types take precedence over plugin types with the same name.
+        """
+        self._entry_points_loaded = True
+        for entry_point in entry_points(group=self.entry_point_group):
+            if entry_point.name in self._paths or entry_point.name in self._classes:
+                logger.warning(
+                    "Ignoring %s type '%s' from %s, the type is already defined",
+                    self.kind,
+                    entry_point.name,
+                    entry_point.value,
+                )
+                continue
+            self._paths[entry_point.name] = entry_point.value
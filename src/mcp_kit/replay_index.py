@@ -0,0 +1,339 @@
+"""Indexes matching calls to recorded responses, for replaying recorded traffic."""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, Literal, TypeVar, get_args
+
+from mcp_kit.cache import hash_arguments
+
+R = TypeVar("R")
+
+MatchStrategy = Literal["exact", "ignore_paths", "nearest"]
+
+MAX_CANDIDATE_POSTINGS = 512
+"""Number of recorded calls above which a feature is too frequent to select the candidates of a nearest lookup."""
+
+
+@dataclass
+class MatchConfig:
+    """Configuration of how calls are matched to recorded calls.
+
+    :param strategy: "exact" to match identical arguments, "ignore_paths" to match
+        arguments that are identical except for `ignore_paths`, or "nearest" to match
+        the recorded arguments sharing the most distinctive values with the call
+    :param ignore_paths: Dotted paths of the arguments to ignore, "*" matching any key or list item
+    :param min_similarity: Minimum share of the (weighted) argument values of a call that the
+        nearest recorded call must have, between 0 and 1
+    """
+
+    strategy: MatchStrategy = "exact"
+    ignore_paths: list[str] = field(default_factory=list)
+    min_similarity: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        :raises ValueError: If the strategy is unknown or inconsistent with the other parameters
+        """
+        if self.strategy not in get_args(MatchStrategy):
+            raise ValueError(f"Unknown match strategy '{self.strategy}', expected one of {get_args(MatchStrategy)}")
+        if self.strategy == "ignore_paths" and not self.ignore_paths:
+            raise ValueError("The ignore_paths match strategy needs ignore_paths")
+        if self.strategy == "exact" and self.ignore_paths:
+            raise ValueError("ignore_paths only apply to the ignore_paths and nearest match strategies")
+        if not 0 <= self.min_similarity <= 1:
+            raise ValueError(f"Invalid min_similarity {self.min_similarity}, expected a value between 0 and 1")
+
+    def create_index(self) -> "ReplayIndex[Any]":
+        """Create an empty index matching calls with this configuration.
+
+        :return: The index
+        """
+        if self.strategy == "nearest":
+            return NearestIndex(self.ignore_paths, self.min_similarity)
+        return ExactIndex(self.ignore_paths)
+
+
+class RecordedResponses(Generic[R]):
+    """Responses recorded for calls, keyed by a hash of their arguments.
+
+    When the same call was recorded several times, its responses are served in
+    the recorded order, starting over after the last one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._responses: dict[str, list[R]] = {}
+        self._next: dict[str, int] = {}
+
+    def add(self, key: str, response: R) -> None:
+        """Add a recorded response.
+
+        :param key: Hash of the call arguments
+        :param response: The recorded response
+        """
+        self._responses.setdefault(key, []).append(response)
+
+    def get(self, key: str) -> R | None:
+        """Get the next recorded response of a call.
+
+        :param key: Hash of the call arguments
+        :return: The next recorded response, or None if the call was not recorded
+        """
+        responses = self._responses.get(key)
+        if not responses:
+            return None
+        index = self._next.get(key, 0)
+        self._next[key] = (index + 1) % len(responses)
+        return responses[index]
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a call was recorded.
+
+        :param key: Hash of the call arguments
+        :return: True if responses were recorded for the call
+        """
+        return key in self._responses
+
+    def __len__(self) -> int:
+        """Get the number of distinct recorded calls.
+
+        :return: Number of recorded argument hashes
+        """
+        return len(self._responses)
+
+
+class ReplayIndex(ABC, Generic[R]):
+    """Index of the responses recorded for one tool or prompt."""
+
+    @abstractmethod
+    def add(self, arguments: dict[str, Any] | None, response: R) -> None:
+        """Add a recorded call.
+
+        :param arguments: Arguments of the recorded call
+        :param response: The recorded response
+        """
+        ...
+
+    @abstractmethod
+    def get(self, arguments: dict[str, Any] | None) -> R | None:
+        """Get the recorded response matching a call.
+
+        :param arguments: Arguments of the call
+        :return: The matching recorded response, or None if no recorded call matches
+        """
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the number of distinct recorded calls.
+
+        :return: Number of distinct recorded arguments
+        """
+        ...
+
+
+class ExactIndex(ReplayIndex[R]):
+    """Index matching calls with the same arguments, except for the ignored paths.
+
+    Lookups hash the canonicalized arguments, so they take a dictionary lookup
+    whatever the number of recorded calls.
+    """
+
+    def __init__(self, ignore_paths: Sequence[str] = ()) -> None:
+        """Initialize an empty index.
+
+        :param ignore_paths: Dotted paths of the arguments to ignore, "*" matching any key or list item
+        """
+        self._ignore_paths = [path.split(".") for path in ignore_paths]
+        self._responses: RecordedResponses[R] = RecordedResponses()
+
+    def add(self, arguments: dict[str, Any] | None, response: R) -> None:
+        """Add a recorded call.
+
+        :param arguments: Arguments of the recorded call
+        :param response: The recorded response
+        """
+        self._responses.add(self._key(self._normalize(arguments)), response)
+
+    def get(self, arguments: dict[str, Any] | None) -> R | None:
+        """Get the recorded response of a call with the same arguments.
+
+        :param arguments: Arguments of the call
+        :return: The matching recorded response, or None if no recorded call matches
+        """
+        return self._responses.get(self._key(self._normalize(arguments)))
+
+    def __len__(self) -> int:
+        """Get the number of distinct recorded calls.
+
+        :return: Number of distinct recorded arguments
+        """
+        return len(self._responses)
+
+    def _normalize(self, arguments: dict[str, Any] | None) -> dict[str, Any]:
+        """Remove the ignored paths from arguments.
+
+        :param arguments: Arguments of a call
+        :return: Arguments without the ignored paths
+        """
+        normalized = arguments or {}
+        for path in self._ignore_paths:
+            normalized = _remove_path(normalized, path)
+        return normalized
+
+    @staticmethod
+    def _key(arguments: dict[str, Any]) -> str:
+        """Hash normalized arguments.
+
+        :param arguments: Normalized arguments of a call
+        :return: Hash of the arguments
+        """
+        return hash_arguments("", arguments)
+
+
+class NearestIndex(ExactIndex[R]):
+    """Index matching calls to the recorded call with the most similar arguments.
+
+    Calls with the same arguments (except for the ignored paths) are matched
+    exactly. Others are matched to the recorded arguments sharing the most
+    argument values with them, each value weighted by how rare it is among the
+    recorded calls of the tool (its inverse document frequency). Argument values
+    are normalized into features (strings are case folded and stripped, and
+    numbers also contribute their order of magnitude), and an inverted index from
+    features to the distinct recorded arguments having them is maintained as
+    calls are added.
+
+    A lookup only scores the recorded arguments sharing a distinctive feature
+    with the call, found in at most `MAX_CANDIDATE_POSTINGS` recorded arguments,
+    so it takes a bounded time whatever the number of recorded calls. The frequent
+    features of the call are only checked on these candidates, and when the call
+    shares no distinctive feature, the candidates are the first recorded
+    arguments having its least frequent feature.
+    """
+
+    def __init__(self, ignore_paths: Sequence[str] = (), min_similarity: float = 0.0) -> None:
+        """Initialize an empty index.
+
+        :param ignore_paths: Dotted paths of the arguments to ignore, "*" matching any key or list item
+        :param min_similarity: Minimum share of the weighted features of a call that the nearest
+            recorded call must have
+        """
+        super().__init__(ignore_paths)
+        self.min_similarity = min_similarity
+        self._keys: list[str] = []
+        self._features: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def add(self, arguments: dict[str, Any] | None, response: R) -> None:
+        """Add a recorded call.
+
+        :param arguments: Arguments of the recorded call
+        :param response: The recorded response
+        """
+        normalized = self._normalize(arguments)
+        key = self._key(normalized)
+        if key not in self._responses:
+            entry = len(self._keys)
+            features = frozenset(_features(normalized))
+            self._keys.append(key)
+            self._features.append(features)
+            for feature in features:
+                self._postings.setdefault(feature, []).append(entry)
+        self._responses.add(key, response)
+
+    def get(self, arguments: dict[str, Any] | None) -> R | None:
+        """Get the recorded response of the call with the most similar arguments.
+
+        :param arguments: Arguments of the call
+        :return: The matching recorded response, or None if no recorded call shares
+            an argument value with the call or the nearest one is not similar enough
+        """
+        normalized = self._normalize(arguments)
+        key = self._key(normalized)
+        if key in self._responses or not self._keys:
+            return self._responses.get(key)
+
+        count = len(self._keys)
+        scores: dict[int, float] = {}
+        frequent: list[tuple[str, float, list[int]]] = []
+        total = 0.0
+        for feature in set(_features(normalized)):
+            postings = self._postings.get(feature, [])
+            weight = math.log((1 + count) / (1 + len(postings))) + 1
+            total += weight
+            if len(postings) > MAX_CANDIDATE_POSTINGS:
+                frequent.append((feature, weight, postings))
+                continue
+            for entry in postings:
+                scores[entry] = scores.get(entry, 0.0) + weight
+        if not scores and frequent:
+            # Only frequent features are shared, take a bounded sample of the recorded calls having the rarest one
+            scores = dict.fromkeys(min(frequent, key=lambda item: len(item[2]))[2][:MAX_CANDIDATE_POSTINGS], 0.0)
+        if not scores:
+            return None
+        for feature, weight, _ in frequent:
+            for entry in scores:
+                if feature in self._features[entry]:
+                    scores[entry] += weight
+
+        # Ties go to the first recorded call
+        nearest = min(scores, key=lambda entry: (-scores[entry], entry))
+        if scores[nearest] / total < self.min_similarity:
+            return None
+        return self._responses.get(self._keys[nearest])
+
+
+def _remove_path(value: Any, path: list[str]) -> Any:
+    """Remove a path from a JSON value, without modifying it.
+
+    :param value: The JSON value
+    :param path: Keys (or list indices) of the path, "*" matching any of them
+    :return: The value without the path
+    """
+    if not path:
+        return value
+    head, rest = path[0], path[1:]
+    if isinstance(value, dict):
+        if head == "*":
+            return {key: _remove_path(item, rest) for key, item in value.items() if rest}
+        if head not in value:
+            return value
+        if not rest:
+            return {key: item for key, item in value.items() if key != head}
+        return {**value, head: _remove_path(value[head], rest)}
+    if isinstance(value, list):
+        if head == "*":
+            return [_remove_path(item, rest) for item in value] if rest else []
+        if head.isdigit() and int(head) < len(value):
+            index = int(head)
+            if not rest:
+                return value[:index] + value[index + 1 :]
+            return [*value[:index], _remove_path(value[index], rest), *value[index + 1 :]]
+    return value
+
+
+def _features(value: Any, path: str = "") -> Iterator[str]:
+    """Extract the normalized features of a JSON value.
+
+    :param value: The JSON value
+    :param path: Path of the value in the arguments
+    :return: Iterator over features, like "query.text=hello" or "limit~3"
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _features(item, f"{path}.{key}" if path else str(key))
+    elif isinstance(value, list):
+        yield f"{path}#{len(value)}"
+        for item in value:
+            yield from _features(item, f"{path}[]")
+    elif isinstance(value, bool) or value is None:
+        yield f"{path}={value}"
+    elif isinstance(value, int | float):
+        yield f"{path}={float(value)!r}"
+        if value and math.isfinite(value):
+            yield f"{path}~{math.floor(math.log10(abs(value)))}"
+    else:
+        yield f"{path}={' '.join(str(value).casefold().split())}"
@@ -0,0 +1,130 @@
+"""Reconnect and circuit breaker helpers for targets talking to remote servers."""
+
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+
+class CircuitOpenError(ConnectionError):
+    """Exception raised when a request is rejected because the circuit is open.
+
+    The remote server failed repeatedly, so requests fail fast until the circuit
+    breaker lets a trial request through again.
+    """
+
+    pass
+
+
+@dataclass
+class ReconnectConfig:
+    """Configuration for reconnecting to a remote server after connection errors.
+
+    :param max_attempts: Number of reconnect attempts before giving up until the next failure
+    :param initial_backoff: Time in seconds to wait before the first reconnect attempt
+    :param max_backoff: Upper bound in seconds for the wait between reconnect attempts
+    :param backoff_multiplier: Factor applied to the wait after every failed attempt
+    :param jitter: Whether to randomize the wait to avoid synchronized reconnects
+    :param max_replays: Maximum number of idempotent requests waiting to be replayed after a reconnect
+    :param failure_threshold: Number of consecutive failures that open the circuit
+    :param reset_timeout: Time in seconds the circuit stays open before letting a trial request through
+    """
+
+    max_attempts: int = 5
+    initial_backoff: float = 0.5
+    max_backoff: float = 30.0
+    backoff_multiplier: float = 2.0
+    jitter: bool = True
+    max_replays: int = 100
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Get the time to wait before a reconnect attempt.
+
+        :param attempt: Zero-based number of the attempt
+        :return: Time to wait in seconds
+        """
+        delay = min(self.max_backoff, self.initial_backoff * self.backoff_multiplier**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker that stops sending requests to a failing server.
+
+    The circuit opens after `failure_threshold` consecutive failures. While open,
+    requests are rejected until `reset_timeout` seconds have passed, then a single
+    trial request is let through (half open) and the other requests are rejected
+    until it completes. A success closes the circuit again and a failure re-opens
+    it. A trial request that never completes, like a cancelled one, is given up
+    after `reset_timeout` seconds, so another one can be let through.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize the circuit breaker.
+
+        :param failure_threshold: Number of consecutive failures that open the circuit
+        :param reset_timeout: Time in seconds before an open circuit lets a trial request through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_started_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving from open to half open once the reset timeout passed.
+
+        :return: The circuit state
+        """
+        if self._state is CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Check whether a request would be allowed, without taking the trial request of a half-open circuit.
+
+        :return: False while the circuit is open, or half open with a trial request in flight
+        """
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            return self._trial_started_at is None or time.monotonic() - self._trial_started_at >= self.reset_timeout
+        return state is CircuitState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, taking the trial request of a half-open circuit.
+
+        The caller must record the outcome of an allowed request with `record_success` or `record_failure`.
+
+        :return: False while the circuit is open, or half open with a trial request in flight
+        """
+        if not self.available:
+            return False
+        if self._state is CircuitState.HALF_OPEN:
+            self._trial_started_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.failures = 0
+        self._state = CircuitState.CLOSED
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if the threshold is reached."""
+        self.failures += 1
+        self._trial_started_at = None
+        if self._state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
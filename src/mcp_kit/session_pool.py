@@ -0,0 +1,301 @@
+"""Pool of MCP client sessions to a single server."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+
+from mcp import ClientSession, McpError
+from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Awaitable[tuple[ClientSession, AsyncExitStack]]]
+
+
+@dataclass
+class SessionPoolConfig:
+    """Configuration for a pool of MCP client sessions.
+
+    :param min_size: Number of sessions opened up front and kept open
+    :param max_size: Maximum number of sessions the pool grows to under load
+    :param health_check_interval: Optional time in seconds between pings of the sessions
+    """
+
+    min_size: int = 1
+    max_size: int = 1
+    health_check_interval: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the pool sizes."""
+        if self.min_size < 1 or self.max_size < self.min_size:
+            raise ValueError(
+                f"Invalid session pool sizes min_size={self.min_size}, max_size={self.max_size}, "
+                "expected 1 <= min_size <= max_size",
+            )
+
+
+@dataclass(eq=False)
+class OwnedSession:
+    """A session together with the task that owns its connection.
+
+    The anyio task groups behind the MCP transports must be exited by the task that
+    entered them, so each connection is opened and closed by a dedicated task and
+    the session can be used, and closed, from any task.
+
+    :param session: The MCP client session
+    :param exit_stack: Exit stack of the connection, closed by the owner task
+    :param task: Task that opened the connection and closes it when `closing` is set
+    :param closing: Event that asks the owner task to close the connection
+    """
+
+    session: ClientSession
+    exit_stack: AsyncExitStack
+    task: asyncio.Task[None]
+    closing: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @classmethod
+    async def open(cls, session_factory: SessionFactory) -> Self:
+        """Open a new session in a dedicated owner task.
+
+        :param session_factory: Coroutine function that opens the session and its exit stack
+        :return: The opened session
+        """
+        ready: asyncio.Future[tuple[ClientSession, AsyncExitStack]] = asyncio.get_running_loop().create_future()
+        closing = asyncio.Event()
+        task = asyncio.create_task(_run_session(session_factory, ready, closing))
+        session, exit_stack = await ready
+        return cls(session=session, exit_stack=exit_stack, task=task, closing=closing)
+
+    async def close(self) -> None:
+        """Ask the owner task to close the connection and wait until it is closed."""
+        self.closing.set()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+@dataclass(eq=False)
+class _PooledSession(OwnedSession):
+    """A session in the pool.
+
+    :param in_flight: Number of requests currently using the session
+    """
+
+    in_flight: int = 0
+
+
+async def _run_session(
+    session_factory: SessionFactory,
+    ready: asyncio.Future[tuple[ClientSession, AsyncExitStack]],
+    closing: asyncio.Event,
+) -> None:
+    """Open a session, keep it open until asked to close and then close it.
+
+    :param session_factory: Coroutine function that opens the session and its exit stack
+    :param ready: Future resolved with the session and its exit stack once it is open
+    :param closing: Event that asks this task to close the session
+    """
+    try:
+        session, exit_stack = await session_factory()
+    except BaseException as e:
+        if not ready.done():
+            ready.set_exception(e)
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return
+    try:
+        if ready.done():
+            # The caller stopped waiting for the session, close it right away
+            return
+        ready.set_result((session, exit_stack))
+        await closing.wait()
+    finally:
+        try:
+            await exit_stack.aclose()
+        except Exception:
+            logger.warning("Error while closing MCP session", exc_info=True)
+
+
+class ClientSessionPool:
+    """Pool of MCP client sessions connected to the same server.
+
+    Requests are routed to the session with the fewest requests in flight. The pool
+    opens `min_size` sessions on start and, when every session is busy, opens another
+    one in the background, up to `max_size`, while requests keep going to the least
+    busy session. Sessions that fail with a connection error or don't answer a health
+    check ping are dropped and replaced on demand.
+
+    Each connection is opened and closed by its own task, so the anyio task groups
+    behind the MCP transports are never exited from a different task.
+    """
+
+    def __init__(self, session_factory: SessionFactory, config: SessionPoolConfig) -> None:
+        """Initialize the session pool.
+
+        :param session_factory: Coroutine function that opens a new session and its exit stack
+        :param config: Pool sizing and health check configuration
+        """
+        self._session_factory = session_factory
+        self.config = config
+        self._sessions: list[_PooledSession] = []
+        self._opening = 0
+        self._growing: set[asyncio.Task[None]] = set()
+        self._health_check_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Get the number of open sessions.
+
+        :return: Number of sessions in the pool
+        """
+        return len(self._sessions)
+
+    async def start(self) -> None:
+        """Open the initial sessions and start the periodic health check if configured."""
+        self._closed = False
+        await self._fill()
+        if self.config.health_check_interval is not None:
+            self._health_check_task = asyncio.create_task(self._health_check_loop(self.config.health_check_interval))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        """Borrow the least busy session for a request.
+
+        Errors reported by the server (McpError) leave the session in the pool,
+        any other error drops it as broken.
+
+        :yield: A client session
+        :raises ValueError: If the pool is closed
+        """
+        pooled = await self._select()
+        pooled.in_flight += 1
+        try:
+            yield pooled.session
+        except McpError:
+            raise
+        except Exception:
+            self._discard(pooled)
+            raise
+        finally:
+            pooled.in_flight -= 1
+
+    async def check_health(self, timeout: float = 10.0) -> None:
+        """Ping every session, drop the ones that fail and reopen up to min_size.
+
+        Busy sessions are pinged too, so a dead connection is found even while
+        requests are stuck waiting on it.
+
+        :param timeout: Time in seconds to wait for each ping
+        """
+        sessions = list(self._sessions)
+        results = await asyncio.gather(
+            *[asyncio.wait_for(pooled.session.send_ping(), timeout) for pooled in sessions],
+            return_exceptions=True,
+        )
+        for pooled, result in zip(sessions, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Dropping MCP session that failed the health check: %r", result)
+                self._discard(pooled)
+        await self._fill()
+
+    async def close(self) -> None:
+        """Stop the health check and close all sessions."""
+        self._closed = True
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            await asyncio.gather(self._health_check_task, return_exceptions=True)
+            self._health_check_task = None
+        for task in self._growing:
+            task.cancel()
+        await asyncio.gather(*self._growing, return_exceptions=True)
+        sessions, self._sessions = self._sessions, []
+        for pooled in sessions:
+            pooled.closing.set()
+        await asyncio.gather(*[pooled.task for pooled in sessions], return_exceptions=True)
+
+    async def _select(self) -> _PooledSession:
+        """Pick the session with the fewest requests in flight.
+
+        When every session is busy the pool grows in the background and the request
+        goes to the least busy session meanwhile. A session is only opened inline
+        when the pool is empty.
+
+        :return: The selected session
+        :raises ValueError: If the pool is closed
+        """
+        if self._closed:
+            raise ValueError("Session pool is closed.")
+        least = min(self._sessions, key=lambda pooled: pooled.in_flight, default=None)
+        if least is None:
+            self._opening += 1
+            try:
+                pooled = await self._open()
+            finally:
+                self._opening -= 1
+            self._sessions.append(pooled)
+            return pooled
+
+        if least.in_flight > 0 and len(self._sessions) + self._opening < self.config.max_size:
+            self._opening += 1
+            task = asyncio.create_task(self._grow())
+            self._growing.add(task)
+            task.add_done_callback(self._growing.discard)
+        return least
+
+    async def _grow(self) -> None:
+        """Open one more session in the background and add it to the pool."""
+        try:
+            pooled = await self._open()
+        except Exception:
+            logger.warning("Failed to grow the MCP session pool", exc_info=True)
+            return
+        finally:
+            self._opening -= 1
+        if self._closed:
+            await pooled.close()
+            return
+        self._sessions.append(pooled)
+
+    async def _fill(self) -> None:
+        """Open sessions concurrently until the pool holds min_size sessions."""
+        missing = self.config.min_size - len(self._sessions) - self._opening
+        if missing <= 0:
+            return
+        self._opening += missing
+        try:
+            opened = await asyncio.gather(*[self._open() for _ in range(missing)], return_exceptions=True)
+        finally:
+            self._opening -= missing
+        errors = [result for result in opened if isinstance(result, BaseException)]
+        self._sessions.extend(result for result in opened if isinstance(result, _PooledSession))
+        if errors:
+            raise errors[0]
+
+    async def _open(self) -> _PooledSession:
+        """Open a new session in a dedicated owner task.
+
+        :return: The opened session
+        """
+        return await _PooledSession.open(self._session_factory)
+
+    async def _health_check_loop(self, interval: float) -> None:
+        """Run the health check every `interval` seconds until cancelled.
+
+        :param interval: Time in seconds between health checks
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.check_health()
+            except Exception:
+                logger.warning("MCP session pool health check failed", exc_info=True)
+
+    def _discard(self, pooled: _PooledSession) -> None:
+        """Remove a session from the pool and ask its owner task to close it.
+
+        :param pooled: The session to drop
+        """
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+        pooled.closing.set()
@@ -0,0 +1,221 @@
+"""Compiled config snapshots for fast proxy startup.
+
+Loading a config with OmegaConf and building the tools and prompts it declares
+one by one is slow for catalogs with thousands of tools. Compiling the config
+validates it by creating its target tree, then stores the config with the tool
+and prompt catalogs of its MCP targets prebuilt into a compact binary snapshot:
+
+```bash
+mcp-kit compile proxy_config.yaml -o proxy_config.snapshot
+```
+
+Loading the snapshot validates the catalogs in a single pass and creates the
+targets from the small config left, which takes milliseconds:
+
+```python
+proxy = ProxyMCP.from_snapshot("proxy_config.snapshot")
+```
+
+Interpolations like `${oc.env:API_KEY}` are kept as is in the snapshot, so they
+are resolved when the snapshot is loaded and secrets are not written to it.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from mcp.types import Prompt, Tool
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from mcp_kit.targets import Target
+
+SNAPSHOT_MAGIC = b"MCPKSNAP"
+"""Bytes at the start of every snapshot file."""
+
+SNAPSHOT_FORMAT = 1
+"""Version of the snapshot format, bumped whenever snapshots need to be recompiled."""
+
+CATALOG_KEY = "_snapshot_catalog"
+"""Config key replacing the tools and prompts of a target with the index of its prebuilt catalog."""
+
+_catalogs: ContextVar[Sequence[SnapshotCatalog] | None] = ContextVar("_catalogs", default=None)
+
+
+class SnapshotCatalog(BaseModel):
+    """Tools and prompts of a target, prebuilt from its config.
+
+    :param tools: The tools, or None if the config doesn't declare any
+    :param prompts: The prompts, or None if the config doesn't declare any
+    """
+
+    tools: list[Tool] | None = None
+    prompts: list[Prompt] | None = None
+
+
+class Snapshot(BaseModel):
+    """Compiled config, with the catalogs of its targets prebuilt.
+
+    :param format: Version of the snapshot format
+    :param config: The config, with catalogs replaced by references to `catalogs`
+    :param catalogs: The prebuilt catalogs
+    """
+
+    format: int = SNAPSHOT_FORMAT
+    config: dict[str, Any]
+    catalogs: list[SnapshotCatalog] = []
+
+    @property
+    def tool_count(self) -> int:
+        """Count the prebuilt tools.
+
+        :return: Total number of tools in the catalogs
+        """
+        return sum(len(catalog.tools or []) for catalog in self.catalogs)
+
+    @property
+    def prompt_count(self) -> int:
+        """Count the prebuilt prompts.
+
+        :return: Total number of prompts in the catalogs
+        """
+        return sum(len(catalog.prompts or []) for catalog in self.catalogs)
+
+
+def compile_snapshot(config_file: str | Path, snapshot_file: str | Path | None = None) -> Snapshot:
+    """Compile a config file into a snapshot.
+
+    :param config_file: Path to the configuration file (YAML or JSON)
+    :param snapshot_file: Optional path to write the snapshot to
+    :return: The compiled snapshot
+    :raises ValueError: If the config is invalid
+    """
+    # Imported here as the factory reads the catalogs of the snapshots being loaded
+    from mcp_kit.factory import create_prompts_from_config, create_target_from_config, create_tools_from_config
+
+    config = OmegaConf.load(config_file)
+    if not isinstance(config, DictConfig) or "target" not in config:
+        raise ValueError(f"Config file '{config_file}' must define a 'target'")
+    # Creating the target tree validates the whole config, targets and generators only open
+    # connections, caches and logs once they are initialized or used
+    create_target_from_config(config.target)
+
+    catalogs: list[SnapshotCatalog] = []
+    for node in _catalog_nodes(config.target):
+        catalogs.append(SnapshotCatalog(tools=create_tools_from_config(node), prompts=create_prompts_from_config(node)))
+        node.pop("tools", None)
+        node.pop("prompts", None)
+        node[CATALOG_KEY] = len(catalogs) - 1
+
+    container = cast(dict[str, Any], OmegaConf.to_container(config, resolve=False))
+    snapshot = Snapshot(config=container, catalogs=catalogs)
+    if snapshot_file is not None:
+        write_snapshot(snapshot, snapshot_file)
+    return snapshot
+
+
+def write_snapshot(snapshot: Snapshot, snapshot_file: str | Path) -> None:
+    """Write a snapshot to a file.
+
+    :param snapshot: The snapshot to write
+    :param snapshot_file: Path of the snapshot file
+    """
+    data = zlib.compress(snapshot.model_dump_json(by_alias=True).encode())
+    Path(snapshot_file).write_bytes(SNAPSHOT_MAGIC + data)
+
+
+def read_snapshot(snapshot_file: str | Path) -> Snapshot:
+    """Read a snapshot from a file.
+
+    :param snapshot_file: Path of the snapshot file
+    :return: The snapshot
+    :raises ValueError: If the file is not a snapshot, or was compiled for another snapshot format
+    """
+    data = Path(snapshot_file).read_bytes()
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError(f"'{snapshot_file}' is not an MCP Kit snapshot")
+    try:
+        snapshot = Snapshot.model_validate_json(zlib.decompress(data[len(SNAPSHOT_MAGIC) :]))
+    except (zlib.error, ValidationError) as e:
+        raise ValueError(f"Invalid snapshot '{snapshot_file}': {e}") from e
+    if snapshot.format != SNAPSHOT_FORMAT:
+        raise ValueError(
+            f"Snapshot '{snapshot_file}' has format {snapshot.format} instead of {SNAPSHOT_FORMAT}, "
+            "compile the config again"
+        )
+    return snapshot
+
+
+def create_target_from_snapshot(snapshot: Snapshot) -> Target:
+    """Create the target tree of a snapshot.
+
+    :param snapshot: The snapshot
+    :return: The root target
+    """
+    from mcp_kit.factory import create_target_from_config
+
+    config = OmegaConf.create(snapshot.config)
+    with snapshot_catalogs(snapshot.catalogs):
+        return create_target_from_config(config.target)
+
+
+@contextmanager
+def snapshot_catalogs(catalogs: Sequence[SnapshotCatalog]) -> Iterator[None]:
+    """Make the catalogs of a snapshot available to the targets created from its config.
+
+    :param catalogs: The prebuilt catalogs of the snapshot
+    """
+    token = _catalogs.set(catalogs)
+    try:
+        yield
+    finally:
+        _catalogs.reset(token)
+
+
+def get_snapshot_catalog(config: DictConfig) -> SnapshotCatalog | None:
+    """Get the prebuilt catalog referenced by the config of a target.
+
+    :param config: Target configuration from OmegaConf
+    :return: The catalog, or None if the config doesn't come from a snapshot
+    :raises ValueError: If the config references a catalog while no snapshot is being loaded
+    """
+    index: int | None = config.get(CATALOG_KEY)
+    if index is None:
+        return None
+    catalogs = _catalogs.get()
+    if catalogs is None or not 0 <= index < len(catalogs):
+        raise ValueError(f"Catalog {index} of the snapshot is not available, load the config with from_snapshot")
+    return catalogs[index]
+
+
+def _catalog_nodes(config: Any) -> Iterator[DictConfig]:
+    """Find the config nodes of the targets whose tools and prompts are declared in the config.
+
+    :param config: A config node
+    :yield: The nodes of MCP targets declaring tools or prompts
+    """
+    from mcp_kit.factory import target_registry
+    from mcp_kit.targets.mcp import McpTarget
+
+    if isinstance(config, ListConfig):
+        for item in config:
+            yield from _catalog_nodes(item)
+    elif isinstance(config, DictConfig):
+        node_type = config.get("type")
+        if isinstance(node_type, str) and ("tools" in config or "prompts" in config):
+            try:
+                is_mcp_target = issubclass(target_registry.resolve(node_type), McpTarget)
+            except ValueError:
+                # Not a target, like a generator type
+                is_mcp_target = False
+            if is_mcp_target:
+                yield config
+                return
+        for value in config.values():
+            yield from _catalog_nodes(value)
@@ -0,0 +1,195 @@
+"""Local cache of downloaded OpenAPI specifications and of the tools built from them.
+
+Specifications are stored by the SHA-256 digest of their content, next to the
+ETag and Last-Modified headers they were served with. Fetching a cached
+specification again sends a conditional request, so an unchanged specification
+is not downloaded again, and the cached copy is used if the server can't be
+reached. The tool catalogs built from a specification are stored by its digest,
+so the specification doesn't have to be parsed again to list its tools.
+
+Files are written atomically, so several processes can share a cache directory:
+
+```text
+.mcp_kit/oas_cache/
+    urls/<sha256 of the URL>.json       # digest and validators of the last download
+    specs/<sha256 of the content>       # specification content
+    catalogs/<sha256 of the content>.v1.json  # tools built from the specification
+```
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+from mcp import Tool
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FORMAT = 1
+"""Version of the cached catalogs, bumped whenever the tools built from specifications change."""
+
+_tools_adapter = TypeAdapter(list[Tool])
+
+
+@dataclass(frozen=True)
+class CachedSpec:
+    """An OpenAPI specification from the cache.
+
+    :param url: URL the specification was downloaded from
+    :param digest: SHA-256 hex digest of the content
+    :param content: Raw content of the specification
+    """
+
+    url: str
+    digest: str
+    content: bytes
+
+
+class SpecCache:
+    """Content-addressed cache of OpenAPI specifications and of their tool catalogs."""
+
+    def __init__(self, path: str | Path, max_age: float = 0.0) -> None:
+        """Initialize the cache.
+
+        :param path: Directory of the cache
+        :param max_age: Seconds a downloaded specification is used without revalidating it with the server
+        :raises ValueError: If max_age is negative
+        """
+        if max_age < 0:
+            raise ValueError(f"Spec cache max_age must not be negative, got {max_age}")
+        self.path = Path(path)
+        self.max_age = max_age
+
+    async def fetch(self, url: str) -> CachedSpec:
+        """Get a specification, downloading it only if it changed since it was cached.
+
+        :param url: URL of the specification
+        :return: The specification
+        :raises ValueError: If the specification can't be downloaded and isn't cached
+        """
+        metadata = self._read_metadata(url)
+        cached = self._read_spec(url, metadata["digest"]) if metadata is not None else None
+        if cached is not None and metadata is not None and time.time() - metadata["fetched_at"] < self.max_age:
+            return cached
+
+        headers = {}
+        if cached is not None and metadata is not None:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+        try:
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                response = await client.get(url, headers=headers)
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            if cached is None:
+                raise ValueError(f"Failed to fetch OpenAPI spec from {url}: {e}") from e
+            logger.warning("Failed to revalidate OpenAPI spec from %s, using the cached copy: %s", url, e)
+            return cached
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None and metadata is not None:
+            spec = cached
+            # A 304 doesn't have to repeat the validators, the previous ones still apply
+            etag = etag or metadata.get("etag")
+            last_modified = last_modified or metadata.get("last_modified")
+        else:
+            content = response.content
+            spec = CachedSpec(url=url, digest=hashlib.sha256(content).hexdigest(), content=content)
+            _write_atomic(self._spec_path(spec.digest), content)
+        metadata = {
+            "url": url,
+            "digest": spec.digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        _write_atomic(self._metadata_path(url), json.dumps(metadata).encode())
+        return spec
+
+    def load_catalog(self, digest: str) -> list[Tool] | None:
+        """Load the tools built from a specification.
+
+        :param digest: Digest of the specification
+        :return: The tools, or None if they aren't cached
+        """
+        try:
+            return _tools_adapter.validate_json(self._catalog_path(digest).read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValidationError as e:
+            logger.warning("Ignoring invalid cached catalog for OpenAPI spec %s: %s", digest, e)
+            return None
+
+    def save_catalog(self, digest: str, tools: list[Tool]) -> None:
+        """Store the tools built from a specification.
+
+        :param digest: Digest of the specification
+        :param tools: The tools built from it
+        """
+        _write_atomic(self._catalog_path(digest), _tools_adapter.dump_json(tools, by_alias=True))
+
+    def _read_metadata(self, url: str) -> dict[str, Any] | None:
+        """Read the metadata of the last download of a specification.
+
+        :param url: URL of the specification
+        :return: The metadata, or None if the specification was never downloaded
+        """
+        try:
+            metadata: dict[str, Any] = json.loads(self._metadata_path(url).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        return metadata
+
+    def _read_spec(self, url: str, digest: str) -> CachedSpec | None:
+        """Read a cached specification, checking its content wasn't corrupted.
+
+        :param url: URL of the specification
+        :param digest: Digest of the specification
+        :return: The specification, or None if it isn't cached or is corrupted
+        """
+        try:
+            content = self._spec_path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            logger.warning("Ignoring corrupted cached OpenAPI spec from %s", url)
+            return None
+        return CachedSpec(url=url, digest=digest, content=content)
+
+    def _metadata_path(self, url: str) -> Path:
+        return self.path / "urls" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _spec_path(self, digest: str) -> Path:
+        return self.path / "specs" / digest
+
+    def _catalog_path(self, digest: str) -> Path:
+        return self.path / "catalogs" / f"{digest}.v{CATALOG_FORMAT}.json"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file atomically, so concurrent readers never see a partial file.
+
+    :param path: Path of the file
+    :param data: Content of the file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
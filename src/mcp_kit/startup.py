@@ -0,0 +1,282 @@
+"""Startup orchestration of target trees.
+
+Wrapper targets initialize their sub-targets from their own `initialize`, so a
+tree of nested targets starts top-down and nothing shows which target is slow.
+The orchestrator walks the tree from the leaves up instead: each sub-target is
+initialized first, with the sub-targets of multiplex and balanced targets
+initialized concurrently, and each wrapper then only does its own part of the
+initialization with `Target.initialize_own`.
+
+Each target is given a timeout for its own initialization, the tool catalogs of
+the leaf targets keeping them can be fetched as soon as they are ready, and the
+time each target took is reported:
+
+```text
+Started 'combined' in 1.204s
+combined (MultiplexTarget): ready in 1.204s (own 0.001s)
+  first_mocked (MockedTarget): ready in 1.203s (own 0.152s)
+    first (McpTarget): ready in 1.051s, 12 tools warmed in 0.031s
+  second (McpTarget): ready in 0.402s, 3 tools warmed in 0.020s
+```
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Iterator
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from mcp_kit.targets import Target
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StartupTimeoutError(TimeoutError):
+    """A target of the tree didn't initialize within the startup timeout."""
+
+
+@dataclass
+class StartupConfig:
+    """Configuration for starting a target tree.
+
+    :param timeout: Optional timeout in seconds for each target to initialize once its sub-targets are ready,
+        and to warm its catalog
+    :param warm_catalogs: Whether to fetch the tools of the leaf targets keeping their catalog as soon as they are
+        initialized, before the targets wrapping them list them
+    """
+
+    timeout: float | None = None
+    warm_catalogs: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        :raises ValueError: If the timeout is not positive
+        """
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError(f"Startup timeout must be positive, got {self.timeout}")
+
+
+@dataclass(eq=False)
+class TargetStartup:
+    """Startup timings of a target of the tree.
+
+    :param name: Name of the target
+    :param target_type: Class name of the target
+    :param sub_targets: Startup timings of the sub-targets
+    :param elapsed: Seconds from the start of the tree until the target was initialized, or failed
+    :param own: Seconds the target took to initialize once its sub-targets were ready
+    :param error: The error the target failed to initialize with
+    :param warmup: Seconds the catalog of the target took to fetch, if it was warmed
+    :param tool_count: Number of tools in the warmed catalog
+    :param warmup_error: The error fetching the catalog failed with
+    """
+
+    name: str
+    target_type: str
+    sub_targets: list["TargetStartup"] = field(default_factory=list)
+    elapsed: float | None = None
+    own: float | None = None
+    error: BaseException | None = None
+    warmup: float | None = None
+    tool_count: int | None = None
+    warmup_error: BaseException | None = None
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "TargetStartup"]]:
+        """Iterate over this target and its sub-targets, depth first.
+
+        :param depth: Depth of this target in the tree
+        :yield: Tuples of (depth, target startup)
+        """
+        yield depth, self
+        for sub in self.sub_targets:
+            yield from sub.walk(depth + 1)
+
+
+@dataclass
+class StartupReport:
+    """Report of the startup of a target tree.
+
+    :param root: Startup timings of the root target
+    :param elapsed: Seconds the whole tree took to start
+    """
+
+    root: TargetStartup
+    elapsed: float
+
+    def format(self) -> str:
+        """Format the report as an indented tree with a line per target.
+
+        :return: The formatted report
+        """
+        lines = [f"Started '{self.root.name}' in {self.elapsed:.3f}s"]
+        for depth, node in self.root.walk():
+            line = f"{'  ' * depth}{node.name} ({node.target_type}): "
+            if node.error is not None:
+                line += f"failed after {node.elapsed:.3f}s: {node.error!r}"
+            elif node.elapsed is None:
+                line += "not started"
+            else:
+                line += f"ready in {node.elapsed:.3f}s"
+                if node.sub_targets and node.own is not None:
+                    line += f" (own {node.own:.3f}s)"
+            if node.warmup_error is not None:
+                line += f", catalog failed: {node.warmup_error!r}"
+            elif node.warmup is not None:
+                line += f", {node.tool_count} tools warmed in {node.warmup:.3f}s"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class _StartingTarget:
+    """A target of the tree being started, with its sub-targets."""
+
+    def __init__(self, target: Target, startup: TargetStartup, sub_targets: list["_StartingTarget"]) -> None:
+        self.target = target
+        self.startup = startup
+        self.sub_targets = sub_targets
+        self.started: asyncio.Future[BaseException | None] | None = None
+
+
+async def start_target(target: Target, config: StartupConfig | None = None) -> StartupReport:
+    """Initialize a target tree from the leaves up, with maximum concurrency.
+
+    Each target is initialized once, even when it is shared by several wrappers,
+    and in the task of the caller unless it is one of several sub-targets started
+    concurrently.
+
+    :param target: The root target of the tree
+    :param config: Configuration of the startup, defaults to no timeouts and no catalog warm-up
+    :return: Report of the startup timings of each target
+    :raises StartupTimeoutError: If the root target, or a sub-target it needs, didn't initialize in time
+    :raises Exception: The error the root target failed to initialize with
+    """
+    config = config or StartupConfig()
+    root = _collect(target, {})
+    start = time.perf_counter()
+
+    async def start_node(node: _StartingTarget) -> BaseException | None:
+        if node.started is not None:
+            # Shared by several wrappers and started by the first one, shielded so a
+            # wrapper being cancelled doesn't cancel the startup for the others
+            return await asyncio.shield(node.started)
+        node.started = asyncio.get_running_loop().create_future()
+        try:
+            await run(node)
+        except Exception as e:
+            node.started.set_result(e)
+            return e
+        except BaseException:
+            node.started.cancel()
+            raise
+        node.started.set_result(None)
+        return None
+
+    async def run(node: _StartingTarget) -> None:
+        # Sub-targets are started first, so their startup doesn't count in the timeout of the target
+        if len(node.sub_targets) > 1:
+            errors = list(await asyncio.gather(*[start_node(sub) for sub in node.sub_targets]))
+        else:
+            errors = [await start_node(sub) for sub in node.sub_targets]
+        own_start = time.perf_counter()
+        try:
+            await _with_timeout(
+                node.target.initialize_own(errors) if node.sub_targets else node.target.initialize(),
+                config.timeout,
+                f"Target '{node.startup.name}' did not initialize within {config.timeout}s",
+            )
+        except BaseException as e:
+            node.startup.error = e
+            raise
+        finally:
+            end = time.perf_counter()
+            node.startup.elapsed = end - start
+            node.startup.own = end - own_start
+        if config.warm_catalogs and not node.sub_targets:
+            await warm(node)
+
+    async def warm(node: _StartingTarget) -> None:
+        warmup_start = time.perf_counter()
+        try:
+            tools = await _with_timeout(
+                node.target.warm_catalog(),
+                config.timeout,
+                f"Target '{node.startup.name}' did not list its tools within {config.timeout}s",
+            )
+        except Exception as e:
+            logger.warning("Failed to warm the catalog of target '%s': %s", node.startup.name, e)
+            node.startup.warmup_error = e
+        else:
+            if tools is None:
+                return
+            node.startup.tool_count = len(tools)
+        node.startup.warmup = time.perf_counter() - warmup_start
+
+    error = await start_node(root)
+    report = StartupReport(root=root.startup, elapsed=time.perf_counter() - start)
+    if error is not None:
+        logger.warning("Failed to start target '%s':\n%s", target.name, report.format())
+        raise error
+    logger.info("%s", report.format())
+    return report
+
+
+async def _with_timeout(awaitable: Awaitable[T], timeout: float | None, message: str) -> T:
+    """Await in the current task, cancelling it once the timeout expires.
+
+    Unlike `asyncio.wait_for` on Python 3.10 and anyio cancel scopes, no task or
+    scope is created around the awaitable, so a target can enter contexts in its
+    `initialize` and exit them in its `close`.
+
+    :param awaitable: The awaitable to wait for
+    :param timeout: Timeout in seconds, or None to wait without a timeout
+    :param message: Message of the error raised on timeout
+    :return: The result of the awaitable
+    :raises StartupTimeoutError: If the timeout expired
+    """
+    if timeout is None:
+        return await awaitable
+    task = asyncio.current_task()
+    assert task is not None
+    expired = False
+
+    def expire() -> None:
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    handle = asyncio.get_running_loop().call_later(timeout, expire)
+    try:
+        return await awaitable
+    except asyncio.CancelledError as e:
+        if not expired:
+            raise
+        uncancel = getattr(task, "uncancel", None)
+        if uncancel is not None:
+            uncancel()
+        raise StartupTimeoutError(message) from e
+    finally:
+        handle.cancel()
+
+
+def _collect(target: Target, nodes: dict[int, _StartingTarget]) -> _StartingTarget:
+    """Collect the targets of a tree.
+
+    :param target: The root target of the tree
+    :param nodes: The targets collected so far, by id, to collect targets shared by several wrappers once
+    :return: The root target, linked to its sub-targets
+    """
+    existing = nodes.get(id(target))
+    if existing is not None:
+        return existing
+    sub_targets = [_collect(sub_target, nodes) for sub_target in target.sub_targets]
+    startup = TargetStartup(
+        name=target.name,
+        target_type=type(target).__name__,
+        sub_targets=[sub.startup for sub in sub_targets],
+    )
+    node = nodes[id(target)] = _StartingTarget(target, startup, sub_targets)
+    return node
@@ -3,19 +3,53 @@
 This module provides various targets for different types of model interactions,
 including direct MCP connections (hosted or spec), OpenAPI REST APIs (hosted or OAS spec), etc.
 It also provides a mocked target that wraps any target to allow mocking
-and a multiplex target that combines multiple targets into a single interface.
+a multiplex target that combines multiple targets into a single interface,
+a balanced target that spreads calls over equivalent replicas,
+a cached target that memoizes tool call results of any target,
+and recording and replay targets that log the traffic of any target and serve it back.
+
+Targets are imported on first use, so that the dependencies of a target (like
+the OpenAPI tooling of the OAS target) are only imported when it is used.
 """
 
+from typing import TYPE_CHECKING
+
+from mcp_kit.lazy import lazy_exports
+
 from .interfaces import Target
-from .mcp import McpTarget
-from .mocked import MockedTarget
-from .multiplex import MultiplexTarget
-from .oas import OasTarget
+
+if TYPE_CHECKING:
+    from .balanced import BalancedTarget
+    from .cached import CachedTarget
+    from .mcp import McpTarget
+    from .mocked import MockedTarget
+    from .multiplex import MultiplexTarget
+    from .oas import OasTarget
+    from .recording import RecordingTarget
+    from .replay import ReplayTarget
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BalancedTarget": ".balanced",
+        "CachedTarget": ".cached",
+        "McpTarget": ".mcp",
+        "MockedTarget": ".mocked",
+        "MultiplexTarget": ".multiplex",
+        "OasTarget": ".oas",
+        "RecordingTarget": ".recording",
+        "ReplayTarget": ".replay",
+    },
+)
 
 __all__ = [
+    "BalancedTarget",
+    "CachedTarget",
     "McpTarget",
     "MockedTarget",
     "MultiplexTarget",
     "OasTarget",
+    "RecordingTarget",
+    "ReplayTarget",
     "Target",
 ]
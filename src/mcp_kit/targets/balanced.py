@@ -0,0 +1,426 @@
+"""Balanced target implementation for spreading calls over equivalent replicas."""
+
+import asyncio
+import itertools
+import logging
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar, get_args
+
+from mcp import McpError
+from mcp.types import Content, GetPromptResult, Prompt, Tool
+from omegaconf import DictConfig
+from typing_extensions import Self
+
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.resilience import CircuitBreaker
+from mcp_kit.targets.interfaces import Target
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BalancingStrategy = Literal["round_robin", "least_outstanding", "power_of_two"]
+
+
+@dataclass
+class HedgingConfig:
+    """Configuration for hedging slow tool calls on a second replica.
+
+    :param quantile: Quantile of the observed call latencies after which a call is hedged
+    :param window: Number of recent call latencies the quantile is computed over
+    :param min_samples: Number of observed calls needed before calls are hedged
+    """
+
+    quantile: float = 0.95
+    window: int = 1000
+    min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        :raises ValueError: If the quantile is not between 0 and 1 or the window is too small
+        """
+        if not 0 < self.quantile < 1 or self.window < 1 or not 1 <= self.min_samples <= self.window:
+            raise ValueError(
+                f"Invalid hedging configuration: quantile={self.quantile}, "
+                f"window={self.window}, min_samples={self.min_samples}"
+            )
+
+
+@dataclass(eq=False)
+class Replica:
+    """A replica behind a balanced target with its health and load.
+
+    :param target: The replica target
+    :param circuit_breaker: Tracks failures and ejects the replica while its circuit is open
+    :param outstanding: Number of requests currently sent to the replica
+    """
+
+    target: Target
+    circuit_breaker: CircuitBreaker
+    outstanding: int = 0
+
+    @property
+    def healthy(self) -> bool:
+        """Check whether the replica can receive requests.
+
+        :return: False while the replica is ejected, or while a trial request checks whether it recovered
+        """
+        return self.circuit_breaker.available
+
+
+class BalancedTarget(Target):
+    """Target that spreads calls over several equivalent replicas of the same server.
+
+    Unlike MultiplexTarget, the replicas expose the same tools and prompts, which are
+    listed from one replica and not namespaced. Each call_tool is sent to a single
+    replica picked with the configured strategy:
+
+    - round_robin: replicas take turns
+    - least_outstanding: the replica with the fewest requests in flight
+    - power_of_two: the less busy of two random replicas
+
+    A replica that fails `failure_threshold` times in a row is ejected for
+    `ejection_time` seconds, then receives a trial request. If every replica is
+    ejected, calls are spread over all of them rather than failing.
+
+    With a `hedging` configuration, a call to a tool annotated with `idempotentHint`
+    or `readOnlyHint` that hasn't returned after the observed latency quantile
+    (p95 by default) is also sent to a second replica, and the first answer wins.
+    The latency of the first replica a call is sent to is observed for every tool
+    call, so hedged calls don't lower the quantile, and the quantile is computed
+    again once 1% of the observed latencies are new.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *targets: Target,
+        strategy: BalancingStrategy = "round_robin",
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+        hedging: HedgingConfig | None = None,
+    ) -> None:
+        """Initialize the balanced target.
+
+        :param name: Name of the balanced target
+        :param targets: Equivalent replica targets
+        :param strategy: How to pick the replica for each call
+        :param failure_threshold: Number of consecutive failures that eject a replica
+        :param ejection_time: Time in seconds an ejected replica is kept out of rotation
+        :param hedging: Optional configuration to hedge slow calls to idempotent tools
+        :raises ValueError: If the strategy is unknown or there are no replicas
+        """
+        if strategy not in get_args(BalancingStrategy):
+            raise ValueError(f"Unknown balancing strategy '{strategy}', expected one of {get_args(BalancingStrategy)}")
+        if not targets:
+            raise ValueError("A balanced target needs at least one replica target")
+        self._name = name
+        self.strategy = strategy
+        self.replicas = [Replica(target, CircuitBreaker(failure_threshold, ejection_time)) for target in targets]
+        self._round_robin = itertools.count()
+        self._select: Callable[[list[Replica]], Replica] = {
+            "round_robin": self._select_round_robin,
+            "least_outstanding": self._select_least_outstanding,
+            "power_of_two": self._select_power_of_two,
+        }[strategy]
+        self.hedging = hedging
+        self._hedgeable_tools: set[str] = set()
+        self._latencies: deque[float] = deque(maxlen=hedging.window if hedging else 1)
+        self._new_latencies = 0
+        self._delay: float | None = None
+
+    @property
+    def name(self) -> str:
+        """Get the target name.
+
+        :return: The target name
+        """
+        return self._name
+
+    @property
+    def sub_targets(self) -> list[Target]:
+        """Get the targets this target depends on.
+
+        :return: The replica targets
+        """
+        return [replica.target for replica in self.replicas]
+
+    @classmethod
+    def from_config(cls, config: DictConfig) -> Self:
+        """Create BalancedTarget from configuration.
+
+        :param config: Target configuration from OmegaConf
+        :return: BalancedTarget instance
+        """
+        targets = [create_target_from_config(replica_config) for replica_config in config.targets]
+        hedging = None
+        hedging_config = config.get("hedging")
+        if hedging_config is not None:
+            hedging = HedgingConfig(**hedging_config)
+        return cls(
+            config.name,
+            *targets,
+            strategy=config.get("strategy", "round_robin"),
+            failure_threshold=config.get("failure_threshold", 3),
+            ejection_time=config.get("ejection_time", 30.0),
+            hedging=hedging,
+        )
+
+    async def initialize(self) -> None:
+        """Initialize all replicas concurrently.
+
+        Replicas that fail to initialize are ejected, the target only fails if
+        no replica could be initialized.
+
+        :raises Exception: The first initialization error if every replica failed
+        """
+        results = await asyncio.gather(
+            *[replica.target.initialize() for replica in self.replicas],
+            return_exceptions=True,
+        )
+        await self.initialize_own([result if isinstance(result, BaseException) else None for result in results])
+
+    async def initialize_own(self, sub_target_errors: list[BaseException | None]) -> None:
+        """Eject the replicas that failed to initialize.
+
+        :param sub_target_errors: Error each replica failed to initialize with, None for the ready ones
+        :raises Exception: The first initialization error if every replica failed
+        """
+        errors = []
+        for replica, error in zip(self.replicas, sub_target_errors, strict=True):
+            if isinstance(error, Exception):
+                logger.warning("Replica '%s' of '%s' failed to initialize: %s", replica.target.name, self.name, error)
+                self._eject(replica)
+                errors.append(error)
+            elif error is not None:
+                raise error
+        if len(errors) == len(self.replicas):
+            raise errors[0]
+
+    async def list_tools(self) -> list[Tool]:
+        """List the tools of a healthy replica.
+
+        :return: List of tools, tried on the other replicas if the first one fails
+        """
+        tools = await self._with_failover(lambda target: target.list_tools())
+        self._hedgeable_tools = self._get_hedgeable_tools(tools)
+        return tools
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> list[Content]:
+        """Call a tool on the replica picked by the balancing strategy.
+
+        The call is not retried on another replica, since tools may not be idempotent.
+        Calls to idempotent tools are hedged when hedging is configured.
+
+        :param name: Name of the tool to call
+        :param arguments: Arguments to pass to the tool
+        :return: List of content responses from the tool
+        """
+        if self.hedging is None:
+            return await self._send(self._pick(), lambda target: target.call_tool(name, arguments))
+        if name not in self._hedgeable_tools:
+            return await self._timed_send(self._pick(), lambda target: target.call_tool(name, arguments))
+        return await self._hedged_send(lambda target: target.call_tool(name, arguments))
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List the prompts of a healthy replica.
+
+        :return: List of prompts, tried on the other replicas if the first one fails
+        """
+        return await self._with_failover(lambda target: target.list_prompts())
+
+    async def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, str] | None = None,
+    ) -> GetPromptResult:
+        """Get a prompt from a healthy replica.
+
+        :param name: Name of the prompt to get
+        :param arguments: Arguments to pass to the prompt
+        :return: Prompt result, tried on the other replicas if the first one fails
+        """
+        return await self._with_failover(lambda target: target.get_prompt(name, arguments))
+
+    async def close(self) -> None:
+        """Close all replicas concurrently."""
+        await asyncio.gather(*[replica.target.close() for replica in self.replicas])
+
+    def _pick(self, exclude: list[Replica] | None = None) -> Replica:
+        """Pick a replica with the balancing strategy.
+
+        :param exclude: Replicas that must not be picked (if others are left)
+        :return: The picked replica
+        """
+        candidates = [replica for replica in self.replicas if replica not in (exclude or [])] or self.replicas
+        healthy = [replica for replica in candidates if replica.healthy]
+        if not healthy:
+            logger.warning("All replicas of '%s' are ejected, spreading calls over all of them", self.name)
+            healthy = candidates
+        return self._select(healthy)
+
+    def _select_round_robin(self, replicas: list[Replica]) -> Replica:
+        """Pick replicas in turn.
+
+        :param replicas: Healthy replicas
+        :return: The next replica
+        """
+        return replicas[next(self._round_robin) % len(replicas)]
+
+    def _select_least_outstanding(self, replicas: list[Replica]) -> Replica:
+        """Pick the replica with the fewest requests in flight.
+
+        :param replicas: Healthy replicas
+        :return: The least busy replica
+        """
+        return min(replicas, key=lambda replica: replica.outstanding)
+
+    def _select_power_of_two(self, replicas: list[Replica]) -> Replica:
+        """Pick the less busy of two random replicas.
+
+        :param replicas: Healthy replicas
+        :return: The less busy of the two sampled replicas
+        """
+        if len(replicas) == 1:
+            return replicas[0]
+        first, second = random.sample(replicas, 2)
+        return first if first.outstanding <= second.outstanding else second
+
+    async def _send(self, replica: Replica, operation: Callable[[Target], Awaitable[T]]) -> T:
+        """Send a request to a replica, tracking its load and health.
+
+        Errors reported by the server (McpError) don't count against the replica health,
+        the replica answered.
+
+        :param replica: The replica to send the request to
+        :param operation: Function that sends the request to a target
+        :return: Result of the operation
+        """
+        # Takes the trial request of a recovering replica, the result is ignored as
+        # ejected replicas are still used when all of them are
+        replica.circuit_breaker.allow_request()
+        replica.outstanding += 1
+        try:
+            result = await operation(replica.target)
+        except McpError:
+            replica.circuit_breaker.record_success()
+            raise
+        except Exception:
+            replica.circuit_breaker.record_failure()
+            if not replica.healthy:
+                logger.warning("Ejecting replica '%s' of '%s'", replica.target.name, self.name)
+            raise
+        finally:
+            replica.outstanding -= 1
+        replica.circuit_breaker.record_success()
+        return result
+
+    async def _with_failover(self, operation: Callable[[Target], Awaitable[T]]) -> T:
+        """Send a read-only request, trying the other replicas if it fails.
+
+        :param operation: Function that sends the request to a target
+        :return: Result of the first replica that succeeds
+        :raises Exception: The last error if every replica failed
+        """
+        tried: list[Replica] = []
+        while True:
+            replica = self._pick(exclude=tried)
+            tried.append(replica)
+            try:
+                return await self._send(replica, operation)
+            except McpError:
+                raise
+            except Exception:
+                if len(tried) == len(self.replicas):
+                    raise
+                logger.warning("Replica '%s' of '%s' failed, trying another one", replica.target.name, self.name)
+
+    async def _hedged_send(self, operation: Callable[[Target], Awaitable[T]]) -> T:
+        """Send a request, sending it to a second replica as well if it is slow.
+
+        :param operation: Function that sends the request to a target
+        :return: Result of the first replica that succeeds
+        :raises Exception: The error of the first replica if every replica failed
+        """
+        primary = self._pick()
+        delay = self._hedge_delay()
+        if delay is None or len(self.replicas) < 2:
+            return await self._timed_send(primary, operation)
+
+        first = asyncio.create_task(self._timed_send(primary, operation))
+        pending: set[asyncio.Task[T]] = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                logger.debug("Hedging call of '%s' after %.3fs", self.name, delay)
+                pending.add(asyncio.create_task(self._send(self._pick(exclude=[primary]), operation)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed_send(self, replica: Replica, operation: Callable[[Target], Awaitable[T]]) -> T:
+        """Send a request to a replica, observing its latency for the hedge delay.
+
+        The latency of a request cancelled because a hedged request answered first
+        is observed until its cancellation.
+
+        :param replica: The replica to send the request to
+        :param operation: Function that sends the request to a target
+        :return: Result of the operation
+        """
+        start = time.monotonic()
+        try:
+            return await self._send(replica, operation)
+        finally:
+            self._latencies.append(time.monotonic() - start)
+            self._new_latencies += 1
+
+    def _hedge_delay(self) -> float | None:
+        """Get the observed latency quantile after which a call is hedged.
+
+        :return: Delay in seconds, or None if not enough calls were observed yet
+        """
+        if self.hedging is None or len(self._latencies) < self.hedging.min_samples:
+            return None
+        if self._delay is None or self._new_latencies >= max(1, self.hedging.window // 100):
+            latencies = sorted(self._latencies)
+            self._delay = latencies[math.ceil(self.hedging.quantile * len(latencies)) - 1]
+            self._new_latencies = 0
+        return self._delay
+
+    @staticmethod
+    def _get_hedgeable_tools(tools: list[Tool]) -> set[str]:
+        """Get the names of the tools that are safe to send twice.
+
+        :param tools: Tool definitions
+        :return: Names of the tools annotated as idempotent or read only
+        """
+        return {
+            tool.name
+            for tool in tools
+            if tool.annotations is not None and (tool.annotations.idempotentHint or tool.annotations.readOnlyHint)
+        }
+
+    def _eject(self, replica: Replica) -> None:
+        """Eject a replica until its ejection time has passed.
+
+        :param replica: The replica to eject
+        """
+        for _ in range(replica.circuit_breaker.failure_threshold):
+            replica.circuit_breaker.record_failure()
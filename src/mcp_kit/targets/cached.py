@@ -0,0 +1,176 @@
+"""Cached target implementation that memoizes tool call results."""
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp.types import Content, GetPromptResult, Prompt, Tool
+from omegaconf import DictConfig
+from typing_extensions import Self
+
+from mcp_kit.cache import LruCache, hash_arguments
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.targets.interfaces import Target
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheConfig:
+    """Configuration for cached target behavior.
+
+    :param max_bytes: Maximum total size in bytes of the cached results
+    :param ttl: Optional time in seconds after which cached results expire
+    :param tool_ttls: Time to live per tool name, overriding `ttl` (0 disables caching of the tool)
+    :param cache_all_tools: Whether to cache all tools instead of only read only and idempotent ones
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: float | None = None
+    tool_ttls: dict[str, float] = field(default_factory=dict)
+    cache_all_tools: bool = False
+
+
+class CachedTarget(Target):
+    """Target that wraps another target and caches its tool call results.
+
+    Results are keyed on the tool name and a canonical hash of the arguments, and
+    kept in an LRU cache bounded by size in bytes. By default only the tools
+    annotated with `readOnlyHint` or `idempotentHint` are cached, as well as the
+    tools given an explicit TTL in `tool_ttls`, which are learned from the tool
+    listings, or by listing the tools on the first call. Tool and prompt listings
+    and prompts are not cached.
+    """
+
+    def __init__(self, target: Target, cache_config: CacheConfig | None = None) -> None:
+        """Initialize the cached target.
+
+        :param target: The base target to wrap
+        :param cache_config: Configuration for cache behavior
+        """
+        self.target = target
+        self.cache_config = cache_config or CacheConfig()
+        self.cache: LruCache[list[Content]] = LruCache(self.cache_config.max_bytes)
+        self._cacheable_tools: set[str] = set(self.cache_config.tool_ttls)
+        self._tools_listed = False
+
+    @property
+    def name(self) -> str:
+        """Get the target name with '_cached' suffix.
+
+        :return: The target name with cached indicator
+        """
+        return f"{self.target.name}_cached"
+
+    @property
+    def sub_targets(self) -> list[Target]:
+        """Get the targets this target depends on.
+
+        :return: The base target
+        """
+        return [self.target]
+
+    @classmethod
+    def from_config(cls, config: DictConfig) -> Self:
+        """Create CachedTarget from configuration.
+
+        :param config: Target configuration from OmegaConf
+        :return: CachedTarget instance
+        """
+        base_target = create_target_from_config(config.base_target)
+        cache_config = CacheConfig(
+            max_bytes=config.get("max_bytes", CacheConfig.max_bytes),
+            ttl=config.get("ttl"),
+            tool_ttls=dict(config.get("tool_ttls", {})),
+            cache_all_tools=config.get("cache_all_tools", False),
+        )
+        return cls(base_target, cache_config)
+
+    async def initialize(self) -> None:
+        """Initialize the base target."""
+        await self.target.initialize()
+
+    async def _learn_cacheable_tools(self) -> None:
+        """List the tools of the base target to learn which of them can be cached, unless they were listed.
+
+        A failure is logged and the tools are then only learned from the next listing.
+        """
+        if self._tools_listed:
+            return
+        self._tools_listed = True
+        try:
+            await self.list_tools()
+        except Exception as e:
+            logger.warning("Failed to list the tools of '%s' to learn which can be cached: %s", self.name, e)
+
+    async def list_tools(self) -> list[Tool]:
+        """List tools from the base target.
+
+        :return: List of available tools from the base target
+        """
+        tools = await self.target.list_tools()
+        self._tools_listed = True
+        self._cacheable_tools = set(self.cache_config.tool_ttls) | {
+            tool.name
+            for tool in tools
+            if tool.annotations is not None and (tool.annotations.readOnlyHint or tool.annotations.idempotentHint)
+        }
+        return tools
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> list[Content]:
+        """Call a tool, answering from the cache when the same call was already made.
+
+        :param name: Name of the tool to call
+        :param arguments: Arguments to pass to the tool
+        :return: List of content responses from the tool, copied from the cache so callers can modify them
+        """
+        if not self.cache_config.cache_all_tools and name not in self.cache_config.tool_ttls:
+            await self._learn_cacheable_tools()
+        ttl = self.cache_config.tool_ttls.get(name, self.cache_config.ttl)
+        if (ttl is not None and ttl <= 0) or not (self.cache_config.cache_all_tools or name in self._cacheable_tools):
+            return await self.target.call_tool(name, arguments)
+
+        key = hash_arguments(name, arguments)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug("Cache hit for tool %s", name)
+            return copy.deepcopy(cached)
+
+        result = await self.target.call_tool(name, arguments)
+        size = sum(len(content.model_dump_json().encode()) for content in result)
+        self.cache.put(key, copy.deepcopy(result), size, ttl)
+        return result
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List prompts from the base target.
+
+        :return: List of available prompts from the base target
+        """
+        return await self.target.list_prompts()
+
+    async def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, str] | None = None,
+    ) -> GetPromptResult:
+        """Get a prompt from the base target.
+
+        :param name: Name of the prompt to get
+        :param arguments: Arguments to pass to the prompt
+        :return: Prompt result from the base target
+        """
+        return await self.target.get_prompt(name, arguments)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached tool call results."""
+        self.cache.clear()
+
+    async def close(self) -> None:
+        """Close the base target and drop the cached results."""
+        self.invalidate_cache()
+        await self.target.close()
@@ -25,6 +25,14 @@ class Target(ConfigurableMixin):
         """
         ...
 
+    @property
+    def sub_targets(self) -> list["Target"]:
+        """Get the targets wrapped or combined by this target.
+
+        :return: The sub-targets, empty for targets that don't wrap other targets
+        """
+        return []
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize the target for use.
@@ -33,6 +41,29 @@ class Target(ConfigurableMixin):
         """
         ...
 
+    async def initialize_own(self, sub_target_errors: list[BaseException | None]) -> None:
+        """Initialize this wrapper target once its sub-targets were initialized.
+
+        Used instead of `initialize` to start a tree of targets from the leaves up,
+        each sub-target being initialized first. Only the own part of `initialize`
+        is done, by default failing with the first error of the sub-targets, so a
+        target overriding `sub_targets` overrides this method if it does more than
+        initialize them.
+
+        :param sub_target_errors: Error each sub-target failed to initialize with, None for the ready ones
+        :raises Exception: The first error of the sub-targets
+        """
+        for error in sub_target_errors:
+            if error is not None:
+                raise error
+
+    async def warm_catalog(self) -> list[Tool] | None:
+        """Fetch the tools ahead of their first listing, for targets that keep their catalog.
+
+        :return: The tools, or None if the target doesn't keep its catalog and warming it would be wasted
+        """
+        return None
+
     @abstractmethod
     async def list_tools(self) -> list[Tool]:
         """List all available tools for this target.
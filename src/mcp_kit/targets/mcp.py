@@ -1,23 +1,60 @@
 """MCP target implementation for connecting to MCP servers (hosted or with a spec)."""
 
-from contextlib import AsyncExitStack
-from typing import Any
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Literal, TypeVar, get_args
 
-from mcp import ClientSession, Tool
-from mcp.types import Content, GetPromptResult, Prompt
+from mcp import ClientSession, McpError, StdioServerParameters, Tool
+from mcp.shared.session import RequestResponder
+from mcp.types import (
+    ClientResult,
+    Content,
+    GetPromptResult,
+    Prompt,
+    PromptListChangedNotification,
+    ServerNotification,
+    ServerRequest,
+    ToolListChangedNotification,
+)
 from omegaconf import DictConfig
 from typing_extensions import Self
 
 from mcp_kit.factory import create_prompts_from_config, create_tools_from_config
-from mcp_kit.patch_mcp import http_streamable_session
+from mcp_kit.patch_mcp import http_streamable_session, sse_session, stdio_session
+from mcp_kit.resilience import CircuitBreaker, CircuitOpenError, ReconnectConfig
+from mcp_kit.session_pool import ClientSessionPool, OwnedSession, SessionPoolConfig
 from mcp_kit.targets.interfaces import Target
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+McpTransport = Literal["streamable_http", "sse", "stdio"]
+
 
 class McpTarget(Target):
     """Target implementation for connecting to MCP servers (hosted or with a spec).
 
     This target can connect to remote MCP servers or use predefined tools.
-    It supports HTTP connections with optional headers and authentication.
+    It supports streamable HTTP and SSE connections with optional headers and
+    authentication, and stdio servers spawned as subprocesses.
+
+    Tools and prompts listed from a remote server can be cached for `catalog_ttl`
+    seconds. The cache is also dropped when the server sends a tools or prompts
+    list_changed notification, or when invalidate_catalog_cache() is called.
+
+    With a `pool` configuration, requests are spread over a pool of sessions to the
+    remote server instead of a single one. For stdio servers every session is its
+    own subprocess, so a pool runs concurrent calls on several worker processes.
+
+    With a `reconnect` configuration, connection errors trigger a reconnect in the
+    background with exponential backoff. Requests for tools annotated with
+    `idempotentHint` (and catalog/prompt reads) wait for the reconnect and are
+    replayed once, and a circuit breaker makes requests fail fast while the server
+    keeps failing.
     """
 
     def __init__(
@@ -25,24 +62,61 @@ class McpTarget(Target):
         name: str,
         url: str | None = None,
         headers: dict[str, str] | None = None,
+        transport: McpTransport = "streamable_http",
+        command: str | None = None,
+        args: list[str] | None = None,
+        env: dict[str, str] | None = None,
+        cwd: str | None = None,
         tools: list[Tool] | None = None,
         prompts: list[Prompt] | None = None,
+        catalog_ttl: float | None = None,
+        pool: SessionPoolConfig | None = None,
+        reconnect: ReconnectConfig | None = None,
     ) -> None:
         """Initialize the MCP target.
 
         :param name: Name of the target
         :param url: Optional URL of the remote MCP server
         :param headers: Optional HTTP headers for server requests
+        :param transport: Transport used to reach the server ("streamable_http", "sse" or "stdio")
+        :param command: Executable of the stdio server (required for the stdio transport)
+        :param args: Optional command line arguments of the stdio server
+        :param env: Optional environment variables of the stdio server
+        :param cwd: Optional working directory of the stdio server
         :param tools: Optional predefined tools to use instead of remote server tools
         :param tools: Optional predefined prompts to use instead of remote server prompts
+        :param catalog_ttl: Optional time in seconds to cache remote tools and prompts (disabled if None)
+        :param pool: Optional configuration to use a pool of sessions instead of a single one
+        :param reconnect: Optional configuration to reconnect and replay requests after connection errors
+        :raises ValueError: If the transport is unknown or the stdio transport has no command
         """
+        if transport not in get_args(McpTransport):
+            raise ValueError(f"Unknown MCP transport '{transport}', expected one of {get_args(McpTransport)}")
+        if transport == "stdio" and command is None:
+            raise ValueError("The stdio MCP transport requires a 'command'")
         self._name = name
         self.url = url
         self.headers = headers
+        self.transport = transport
+        self.command = command
+        self.args = args
+        self.env = env
+        self.cwd = cwd
         self.tools = tools
         self.prompts = prompts
+        self.catalog_ttl = catalog_ttl
+        self.pool = pool
+        self.reconnect = reconnect
         self.target_mcp: ClientSession | None = None
         self.target_mcp_exit_stack: AsyncExitStack | None = None
+        self.target_mcp_session: OwnedSession | None = None
+        self.session_pool: ClientSessionPool | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
+        self._tools_cache: tuple[float, list[Tool]] | None = None
+        self._prompts_cache: tuple[float, list[Prompt]] | None = None
+        self._idempotent_tools: set[str] = self._get_idempotent_tools(tools or [])
+        self._reconnect_task: asyncio.Task[bool] | None = None
+        self._pending_replays = 0
 
     @property
     def name(self) -> str:
@@ -59,40 +133,250 @@ class McpTarget(Target):
         :param config: Target configuration from OmegaConf
         :return: McpTarget instance
         """
+        pool = None
+        pool_config = config.get("pool")
+        if pool_config is not None:
+            pool = SessionPoolConfig(
+                min_size=pool_config.get("min_size", 1),
+                max_size=pool_config.get("max_size", pool_config.get("min_size", 1)),
+                health_check_interval=pool_config.get("health_check_interval"),
+            )
+        reconnect = None
+        reconnect_config = config.get("reconnect")
+        if reconnect_config is not None:
+            reconnect = ReconnectConfig(**reconnect_config)
+        args = config.get("args")
+        env = config.get("env")
         return cls(
             name=config.name,
             url=config.get("url"),
             headers=config.get("headers"),
+            transport=config.get("transport", "streamable_http"),
+            command=config.get("command"),
+            args=list(args) if args is not None else None,
+            env=dict(env) if env is not None else None,
+            cwd=config.get("cwd"),
             tools=create_tools_from_config(config),
             prompts=create_prompts_from_config(config),
+            catalog_ttl=config.get("catalog_ttl"),
+            pool=pool,
+            reconnect=reconnect,
         )
 
+    @property
+    def _has_server(self) -> bool:
+        """Check whether a server to connect to is configured.
+
+        :return: True if there is a URL, or a command for the stdio transport
+        """
+        return self.command is not None if self.transport == "stdio" else self.url is not None
+
     async def initialize(self) -> None:
-        """Initialize the target by connecting to the MCP server if URL is provided.
+        """Initialize the target by connecting to the MCP server if one is configured.
+
+        Sets up the connection (or pool of connections) to the MCP server using the
+        configured transport. Reconnecting requires a pool, so a single session pool
+        is used when only `reconnect` is configured. Connections are opened and closed
+        by their own task, so the target can be initialized and closed from different tasks.
+        """
+        if self._has_server and (self.pool is not None or self.reconnect is not None):
+            self.session_pool = ClientSessionPool(self._open_session, self.pool or SessionPoolConfig())
+            if self.reconnect is not None:
+                self.circuit_breaker = CircuitBreaker(self.reconnect.failure_threshold, self.reconnect.reset_timeout)
+            await self.session_pool.start()
+        elif self._has_server:
+            self.target_mcp_session = await OwnedSession.open(self._open_session)
+            self.target_mcp = self.target_mcp_session.session
+            self.target_mcp_exit_stack = self.target_mcp_session.exit_stack
+
+    async def _open_session(self) -> tuple[ClientSession, AsyncExitStack]:
+        """Open a new session to the MCP server with the configured transport.
 
-        Sets up the HTTP connection to the remote MCP server using the configured
-        URL and headers.
+        :return: Tuple of (ClientSession, AsyncExitStack) for the connection
+        :raises ValueError: If no URL is configured for an HTTP transport
         """
-        if self.url is not None:
-            self.target_mcp, self.target_mcp_exit_stack = await http_streamable_session(
-                self.url,
-                self.headers,
+        if self.transport == "stdio":
+            if self.command is None:
+                raise ValueError("The stdio MCP transport requires a 'command'")
+            server_parameters = StdioServerParameters(
+                command=self.command,
+                args=self.args or [],
+                env=self.env,
+                cwd=self.cwd,
             )
+            return await stdio_session(server_parameters, message_handler=self._handle_message)
+        if self.url is None:
+            raise ValueError(f"The {self.transport} MCP transport requires a 'url'")
+        if self.transport == "sse":
+            return await sse_session(self.url, self.headers, message_handler=self._handle_message)
+        return await http_streamable_session(self.url, self.headers, message_handler=self._handle_message)
+
+    async def _handle_message(
+        self,
+        message: RequestResponder[ServerRequest, ClientResult] | ServerNotification | Exception,
+    ) -> None:
+        """Handle messages sent by the MCP server outside of a request.
+
+        Drops the cached tools or prompts when the server notifies that they changed.
+
+        :param message: Server request, notification or exception
+        """
+        if isinstance(message, ServerNotification):
+            if isinstance(message.root, ToolListChangedNotification):
+                self._tools_cache = None
+            elif isinstance(message.root, PromptListChangedNotification):
+                self._prompts_cache = None
+
+    @property
+    def _connected(self) -> bool:
+        """Check whether there is a session (or pool of sessions) to the remote server.
+
+        :return: True if requests can be sent to the remote server
+        """
+        return self.target_mcp is not None or self.session_pool is not None
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[ClientSession]:
+        """Get a session to send a request to the remote server.
+
+        :yield: The least busy pooled session, or the single session
+        :raises ValueError: If MCP client is not initialized
+        """
+        if self.session_pool is not None:
+            async with self.session_pool.acquire() as session:
+                yield session
+        elif self.target_mcp is not None:
+            yield self.target_mcp
+        else:
+            raise ValueError("MCP client is not initialized. Call initialize() first.")
+
+    async def _request(self, operation: Callable[[ClientSession], Awaitable[T]], *, replayable: bool) -> T:
+        """Send a request to the remote server, reconnecting on connection errors.
+
+        :param operation: Function that sends the request on a session
+        :param replayable: Whether the request can safely be sent again after a reconnect
+        :return: Result of the operation
+        :raises CircuitOpenError: If the circuit to the server is open
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(f"Circuit to MCP server '{self.name}' is open, failing fast.")
+        replayed = False
+        while True:
+            try:
+                async with self._session() as session:
+                    result = await operation(session)
+            except McpError:
+                # The server answered, so the connection is fine
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                raise
+            except ValueError:
+                raise
+            except Exception:
+                if self.reconnect is None or self.circuit_breaker is None:
+                    raise
+                self.circuit_breaker.record_failure()
+                reconnect_task = self._schedule_reconnect()
+                if not replayable or replayed or self._pending_replays >= self.reconnect.max_replays:
+                    raise
+                self._pending_replays += 1
+                try:
+                    reconnected = await asyncio.shield(reconnect_task)
+                finally:
+                    self._pending_replays -= 1
+                if not reconnected:
+                    raise
+                replayed = True
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return result
+
+    def _schedule_reconnect(self) -> asyncio.Task[bool]:
+        """Start reconnecting in the background unless a reconnect is already running.
+
+        :return: Task resolving to whether the reconnect succeeded
+        """
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+        return self._reconnect_task
+
+    async def _reconnect_loop(self) -> bool:
+        """Try to reopen sessions to the server with exponential backoff.
+
+        :return: True if the server could be reached again
+        """
+        if self.reconnect is None or self.session_pool is None or self.circuit_breaker is None:
+            return False
+        for attempt in range(self.reconnect.max_attempts):
+            await asyncio.sleep(self.reconnect.backoff(attempt))
+            try:
+                await self.session_pool.check_health()
+            except Exception:
+                logger.warning("Reconnect attempt %d to MCP server '%s' failed", attempt + 1, self.name, exc_info=True)
+                self.circuit_breaker.record_failure()
+                continue
+            logger.info("Reconnected to MCP server '%s'", self.name)
+            self.circuit_breaker.record_success()
+            self.invalidate_catalog_cache()
+            return True
+        logger.error(
+            "Giving up reconnecting to MCP server '%s' after %d attempts", self.name, self.reconnect.max_attempts
+        )
+        return False
+
+    @staticmethod
+    def _get_idempotent_tools(tools: list[Tool]) -> set[str]:
+        """Get the names of the tools annotated as idempotent.
+
+        :param tools: Tool definitions
+        :return: Names of the tools that can be safely replayed
+        """
+        return {tool.name for tool in tools if tool.annotations is not None and tool.annotations.idempotentHint}
+
+    def invalidate_catalog_cache(self) -> None:
+        """Drop the cached tools and prompts so they are listed again from the server."""
+        self._tools_cache = None
+        self._prompts_cache = None
+
+    def _is_fresh(self, cached_at: float) -> bool:
+        """Check whether a catalog cache entry is still within the TTL.
+
+        :param cached_at: Monotonic time at which the entry was cached
+        :return: True if the entry can be served
+        """
+        return self.catalog_ttl is not None and time.monotonic() - cached_at < self.catalog_ttl
 
     async def list_tools(self) -> list[Tool]:
         """List all available tools.
 
-        Returns predefined tools if available, otherwise queries the remote MCP server.
+        Returns predefined tools if available, otherwise queries the remote MCP server
+        (or serves the catalog cache when enabled and fresh).
 
         :return: List of available tools
         :raises ValueError: If no tools are available and MCP is not initialized
         """
         if self.tools is not None:
             return self.tools
-        if self.target_mcp is not None:
-            return (await self.target_mcp.list_tools()).tools
+        if self._connected:
+            if self._tools_cache is not None and self._is_fresh(self._tools_cache[0]):
+                return self._tools_cache[1]
+            tools = (await self._request(lambda session: session.list_tools(), replayable=True)).tools
+            self._idempotent_tools = self._get_idempotent_tools(tools)
+            if self.catalog_ttl is not None:
+                self._tools_cache = (time.monotonic(), tools)
+            return tools
         raise ValueError("No tools available. Initialize the MCP or provide tools.")
 
+    async def warm_catalog(self) -> list[Tool] | None:
+        """Fetch the tools of the remote server into the catalog cache.
+
+        :return: The tools, or None if the catalog cache is disabled
+        """
+        if self.tools is None and self.catalog_ttl is None:
+            return None
+        return await self.list_tools()
+
     async def call_tool(
         self,
         name: str,
@@ -104,23 +388,32 @@ class McpTarget(Target):
         :param arguments: Arguments to pass to the tool
         :return: List of content responses from the tool
         :raises ValueError: If MCP client is not initialized
+        :raises CircuitOpenError: If reconnecting is enabled and the circuit to the server is open
         """
-        if self.target_mcp is None:
-            raise ValueError("MCP client is not initialized. Call initialize() first.")
-        return (await self.target_mcp.call_tool(name=name, arguments=arguments)).content
+        result = await self._request(
+            lambda session: session.call_tool(name=name, arguments=arguments),
+            replayable=name in self._idempotent_tools,
+        )
+        return result.content
 
     async def list_prompts(self) -> list[Prompt]:
         """List all available prompts.
 
-        Returns predefined prompts if available, otherwise queries the remote MCP server.
+        Returns predefined prompts if available, otherwise queries the remote MCP server
+        (or serves the catalog cache when enabled and fresh).
 
         :return: List of available prompts
         :raises ValueError: If no prompts are available and MCP is not initialized
         """
         if self.prompts is not None:
             return self.prompts
-        if self.target_mcp is not None:
-            return (await self.target_mcp.list_prompts()).prompts
+        if self._connected:
+            if self._prompts_cache is not None and self._is_fresh(self._prompts_cache[0]):
+                return self._prompts_cache[1]
+            prompts = (await self._request(lambda session: session.list_prompts(), replayable=True)).prompts
+            if self.catalog_ttl is not None:
+                self._prompts_cache = (time.monotonic(), prompts)
+            return prompts
         raise ValueError("No prompts available. Initialize the MCP or provide prompts.")
 
     async def get_prompt(
@@ -134,14 +427,29 @@ class McpTarget(Target):
         :param arguments: Arguments to pass to the prompt
         :return: Prompt result with messages
         :raises ValueError: If MCP client is not initialized
+        :raises CircuitOpenError: If reconnecting is enabled and the circuit to the server is open
         """
-        if self.target_mcp is None:
-            raise ValueError("MCP client is not initialized. Call initialize() first.")
-        return await self.target_mcp.get_prompt(name=name, arguments=arguments)
+        return await self._request(
+            lambda session: session.get_prompt(name=name, arguments=arguments),
+            replayable=True,
+        )
 
     async def close(self) -> None:
         """Close the connection to the MCP server.
 
-        Cleans up the HTTP connection and releases resources.
+        Cleans up the HTTP connection (or pool of connections) and releases resources.
         """
-        return await self.target_mcp_exit_stack.aclose() if self.target_mcp_exit_stack else None
+        self.invalidate_catalog_cache()
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            await asyncio.gather(self._reconnect_task, return_exceptions=True)
+            self._reconnect_task = None
+        self.circuit_breaker = None
+        if self.session_pool is not None:
+            await self.session_pool.close()
+            self.session_pool = None
+        if self.target_mcp_session is not None:
+            await self.target_mcp_session.close()
+            self.target_mcp_session = None
+            self.target_mcp = None
+            self.target_mcp_exit_stack = None
@@ -8,6 +8,7 @@ from mcp.types import Content, GetPromptResult, Prompt, Tool
 from omegaconf import DictConfig
 from typing_extensions import Self
 
+from mcp_kit.cache import LruCache, hash_arguments
 from mcp_kit.factory import (
     create_prompt_engine_from_config,
     create_response_generator_from_config,
@@ -26,10 +27,13 @@ class MockConfig:
 
     :param tool_response_generator: The generator to use for creating mock responses
     :param prompt_engine: The engine to use for creating mock prompt responses
+    :param prompt_cache_max_bytes: Maximum total size in bytes of the prompt results cached
+        for deterministic prompt engines (0 disables the cache)
     """
 
     tool_response_generator: ToolResponseGenerator | None = None
     prompt_engine: PromptEngine | None = None
+    prompt_cache_max_bytes: int = 16 * 1024 * 1024
 
 
 class MockedTarget(Target):
@@ -48,6 +52,10 @@ class MockedTarget(Target):
         """
         self.target = target
         self.mock_config = mock_config
+        self._tools_index: dict[str, Tool] | None = None
+        self._prompts_index: dict[str, Prompt] | None = None
+        self._indexed_prompts: list[Prompt] | None = None
+        self.prompt_cache: LruCache[GetPromptResult] = LruCache(self.mock_config.prompt_cache_max_bytes)
 
     @property
     def name(self) -> str:
@@ -57,6 +65,14 @@ class MockedTarget(Target):
         """
         return f"{self.target.name}_mocked"
 
+    @property
+    def sub_targets(self) -> list[Target]:
+        """Get the targets this target depends on.
+
+        :return: The base target
+        """
+        return [self.target]
+
     @classmethod
     def from_config(cls, config: DictConfig) -> Self:
         """Create MockedTarget from configuration.
@@ -80,19 +96,76 @@ class MockedTarget(Target):
         mock_config = MockConfig(
             tool_response_generator=generator,
             prompt_engine=prompt_engine,
+            prompt_cache_max_bytes=config.get("prompt_cache_max_bytes", MockConfig.prompt_cache_max_bytes),
         )
         return cls(base_target, mock_config)
 
     async def initialize(self) -> None:
-        """Initialize the base target."""
+        """Initialize the base target and build the tool index used for mocking.
+
+        The prompt index is built the first time a prompt is generated.
+        """
         await self.target.initialize()
+        await self._build_tools_index()
+
+    async def initialize_own(self, sub_target_errors: list[BaseException | None]) -> None:
+        """Build the tool index used for mocking, once the base target is initialized.
+
+        :param sub_target_errors: Error the base target failed to initialize with, or None
+        :raises Exception: The error of the base target
+        """
+        await super().initialize_own(sub_target_errors)
+        await self._build_tools_index()
+
+    async def _build_tools_index(self) -> None:
+        """Build the tool index used for mocking from the base target.
+
+        A base target that can't list its tools yet doesn't fail the initialization,
+        the index is then built the first time a tool is called.
+        """
+        if self.mock_config.tool_response_generator is None:
+            return
+        try:
+            await self.list_tools()
+        except Exception as e:
+            logger.warning("Failed to list the tools of '%s', they will be listed on first call: %s", self.name, e)
 
     async def list_tools(self) -> list[Tool]:
         """List tools from the base target.
 
+        The name to tool index used by call_tool is rebuilt every time, so it
+        follows the changes of the tool definitions.
+
         :return: List of available tools from the base target
         """
-        return await self.target.list_tools()
+        tools = await self.target.list_tools()
+        self._tools_index = {tool.name: tool for tool in tools}
+        return tools
+
+    def invalidate_tools_index(self) -> None:
+        """Drop the tool index so it is rebuilt from the base target on next use."""
+        self._tools_index = None
+
+    async def _get_tool(self, name: str) -> Tool:
+        """Look up a tool by name in the tool index.
+
+        On a miss the tool list is fetched again from the base target, in case
+        it changed since the index was built.
+
+        :param name: Name of the tool
+        :return: The tool definition
+        :raises ValueError: If the tool is not found
+        """
+        if self._tools_index is not None:
+            tool = self._tools_index.get(name)
+            if tool is not None:
+                return tool
+        await self.list_tools()
+        if self._tools_index is not None and name in self._tools_index:
+            return self._tools_index[name]
+        raise ValueError(
+            f"Tool {name} not found in tools for server {self.target.name}",
+        )
 
     async def call_tool(
         self,
@@ -113,16 +186,11 @@ class MockedTarget(Target):
         if self.mock_config.tool_response_generator is not None:
             # Use tool response generator to generate mock response
             try:
-                tools = await self.list_tools()
-                for tool in tools:
-                    if tool.name == name:
-                        return await self.mock_config.tool_response_generator.generate(
-                            self.target.name,
-                            tool,
-                            arguments,
-                        )
-                raise ValueError(
-                    f"Tool {name} not found in tools for server {self.target.name}",
+                tool = await self._get_tool(name)
+                return await self.mock_config.tool_response_generator.generate(
+                    self.target.name,
+                    tool,
+                    arguments,
                 )
             except LlmAuthenticationError as e:
                 logger.exception(e)
@@ -140,9 +208,44 @@ class MockedTarget(Target):
     async def list_prompts(self) -> list[Prompt]:
         """List prompts from the base target.
 
+        The name to prompt index used by get_prompt is rebuilt every time, and the
+        cached prompt results are dropped when the prompt definitions changed.
+
         :return: List of available prompts from the base target
         """
-        return await self.target.list_prompts()
+        prompts = await self.target.list_prompts()
+        self._prompts_index = {prompt.name: prompt for prompt in prompts}
+        if self._indexed_prompts is not None and prompts != self._indexed_prompts:
+            self.prompt_cache.clear()
+        self._indexed_prompts = [prompt.model_copy(deep=True) for prompt in prompts]
+        return prompts
+
+    def invalidate_prompts_index(self) -> None:
+        """Drop the prompt index and the cached prompt results."""
+        self._prompts_index = None
+        self._indexed_prompts = None
+        self.prompt_cache.clear()
+
+    async def _get_prompt(self, name: str) -> Prompt:
+        """Look up a prompt by name in the prompt index.
+
+        On a miss the prompt list is fetched again from the base target, in case
+        it changed since the index was built.
+
+        :param name: Name of the prompt
+        :return: The prompt definition
+        :raises ValueError: If the prompt is not found
+        """
+        if self._prompts_index is not None:
+            prompt = self._prompts_index.get(name)
+            if prompt is not None:
+                return prompt
+        await self.list_prompts()
+        if self._prompts_index is not None and name in self._prompts_index:
+            return self._prompts_index[name]
+        raise ValueError(
+            f"Prompt {name} not found in prompts for server {self.target.name}",
+        )
 
     async def get_prompt(
         self,
@@ -151,26 +254,30 @@ class MockedTarget(Target):
     ) -> GetPromptResult:
         """Generate a mock response for the specified prompt.
 
-        If a prompt_engine is configured, generates a synthetic response.
+        If a prompt_engine is configured, generates a synthetic response. Results of
+        deterministic prompt engines are cached per prompt and arguments.
         Otherwise, delegates to the base target.
 
         :param name: Name of the prompt to get
         :param arguments: Arguments to pass to the prompt
         :return: Prompt result (generated or from base target)
+        :raises ValueError: If the specified prompt is not found
         """
-        if self.mock_config.prompt_engine is not None:
+        prompt_engine = self.mock_config.prompt_engine
+        if prompt_engine is not None:
             # Use prompt engine to generate mock response
-            prompts = await self.list_prompts()
-            for prompt in prompts:
-                if prompt.name == name:
-                    return await self.mock_config.prompt_engine.generate(
-                        self.target.name,
-                        prompt,
-                        arguments,
-                    )
-            raise ValueError(
-                f"Prompt {name} not found in prompts for server {self.target.name}",
-            )
+            key = None
+            if prompt_engine.deterministic and self.prompt_cache.max_bytes > 0:
+                key = hash_arguments(name, arguments)
+                cached = self.prompt_cache.get(key)
+                if cached is not None:
+                    return cached.model_copy(deep=True)
+
+            prompt = await self._get_prompt(name)
+            result = await prompt_engine.generate(self.target.name, prompt, arguments)
+            if key is not None:
+                self.prompt_cache.put(key, result.model_copy(deep=True), len(result.model_dump_json().encode()))
+            return result
         else:
             # Delegate to base target for now
             return await self.target.get_prompt(name, arguments)
@@ -1,7 +1,9 @@
 """Multiplex target implementation for combining multiple MCP targets."""
 
 import asyncio
-from typing import Any
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from mcp import ErrorData, McpError
 from mcp.types import Content, GetPromptResult, Prompt, Tool
@@ -11,6 +13,11 @@ from typing_extensions import Self
 from mcp_kit.factory import create_target_from_config
 from mcp_kit.targets.interfaces import Target
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+ItemT = TypeVar("ItemT", Tool, Prompt)
+
 
 class MultiplexTarget(Target):
     """Target that combines multiple targets into a single interface.
@@ -18,16 +25,43 @@ class MultiplexTarget(Target):
     This target implementation allows multiple MCP targets to be accessed
     through a single interface. Tools from different targets are namespaced
     to avoid conflicts.
+
+    Tools and prompts are listed from all targets concurrently. Each target can be
+    given a `timeout`, and with `partial_results` the targets that fail or time out
+    are skipped (and reported in `failed_tool_targets` and `failed_prompt_targets`)
+    instead of failing the listing.
+
+    Listing builds a routing table from namespaced names to the sub-target and the
+    original name, so calls are routed with a single dict lookup. The namespaced
+    tools and prompts of a sub-target are cached and only rebuilt when the catalog
+    returned by that sub-target changes.
     """
 
-    def __init__(self, name: str, *targets: Target) -> None:
+    def __init__(
+        self,
+        name: str,
+        *targets: Target,
+        timeout: float | None = None,
+        partial_results: bool = False,
+    ) -> None:
         """Initialize the multiplex target.
 
         :param name: Name of the multiplex target
         :param targets: Variable number of targets to multiplex
+        :param timeout: Optional time in seconds each target has to list its tools or prompts
+        :param partial_results: Whether to skip targets that fail to list instead of raising
         """
         self._name = name
         self._targets_dict = {target.name: target for target in targets}
+        self.timeout = timeout
+        self.partial_results = partial_results
+        self._failed_targets: dict[str, dict[str, Exception]] = {"tool": {}, "prompt": {}}
+        # Longest names first so that dotted target names resolve to the most specific target
+        self._target_names_by_length = sorted(self._targets_dict, key=len, reverse=True)
+        self._tool_routes: dict[str, tuple[Target, str]] = {}
+        self._prompt_routes: dict[str, tuple[Target, str]] = {}
+        self._namespaced_tools: dict[str, tuple[list[Tool], list[Tool]]] = {}
+        self._namespaced_prompts: dict[str, tuple[list[Prompt], list[Prompt]]] = {}
 
     @property
     def name(self) -> str:
@@ -37,6 +71,30 @@ class MultiplexTarget(Target):
         """
         return self._name
 
+    @property
+    def failed_tool_targets(self) -> dict[str, Exception]:
+        """Get the targets that failed the last tool listing.
+
+        :return: Errors of the targets that failed to list their tools, by target name
+        """
+        return self._failed_targets["tool"]
+
+    @property
+    def failed_prompt_targets(self) -> dict[str, Exception]:
+        """Get the targets that failed the last prompt listing.
+
+        :return: Errors of the targets that failed to list their prompts, by target name
+        """
+        return self._failed_targets["prompt"]
+
+    @property
+    def sub_targets(self) -> list[Target]:
+        """Get the targets this target depends on.
+
+        :return: The combined targets
+        """
+        return list(self._targets_dict.values())
+
     @classmethod
     def from_config(cls, config: DictConfig) -> Self:
         """Create MultiplexTarget from configuration.
@@ -48,10 +106,14 @@ class MultiplexTarget(Target):
         targets = []
         for sub_target_config in config.targets:
             # TODO validate that none of the sub-targets have the same name
-            # TODO validate that none of the sub-targets have "." in their name
             targets.append(create_target_from_config(sub_target_config))
 
-        return cls(config.name, *targets)
+        return cls(
+            config.name,
+            *targets,
+            timeout=config.get("timeout"),
+            partial_results=config.get("partial_results", False),
+        )
 
     async def initialize(self) -> None:
         """Initialize all sub-targets concurrently."""
@@ -68,19 +130,8 @@ class MultiplexTarget(Target):
         :return: List of all namespaced tools from all targets
         """
         tools = []
-        for target in self._targets_dict.values():
-            target_tools = await target.list_tools()
-            for tool in target_tools:
-                # Ensure unique tool names across targets
-                namespaced_tool_name = self._get_namespaced_name(target, tool.name)
-                tools.append(
-                    Tool(
-                        name=namespaced_tool_name,
-                        description=tool.description,
-                        inputSchema=tool.inputSchema,
-                        annotations=tool.annotations,
-                    ),
-                )
+        for target, target_tools in await self._list_from_targets(lambda target: target.list_tools(), "tool"):
+            tools.extend(self._namespace_items(target, target_tools, self._namespaced_tools, self._tool_routes))
         return tools
 
     async def call_tool(
@@ -98,15 +149,8 @@ class MultiplexTarget(Target):
         :return: List of content responses from the tool
         :raises McpError: If the tool name is invalid or target not found
         """
-        target_name = self._get_namespace_from_name(name, "tool")
-        if target_name not in self._targets_dict:
-            raise McpError(
-                ErrorData(
-                    code=400,
-                    message=f"Tool '{name}' not found",
-                ),
-            )
-        return await self._targets_dict[target_name].call_tool(name, arguments)
+        target, tool_name = self._tool_routes.get(name) or self._resolve_route(name, "tool")
+        return await target.call_tool(tool_name, arguments)
 
     async def list_prompts(self) -> list[Prompt]:
         """List all prompts from all targets with namespace prefixes.
@@ -117,18 +161,10 @@ class MultiplexTarget(Target):
         :return: List of all namespaced prompts from all targets
         """
         prompts = []
-        for target in self._targets_dict.values():
-            target_prompts = await target.list_prompts()
-            for prompt in target_prompts:
-                # Ensure unique prompt names across targets
-                namespaced_prompt_name = self._get_namespaced_name(target, prompt.name)
-                prompts.append(
-                    Prompt(
-                        name=namespaced_prompt_name,
-                        description=prompt.description,
-                        arguments=prompt.arguments,
-                    ),
-                )
+        for target, target_prompts in await self._list_from_targets(lambda target: target.list_prompts(), "prompt"):
+            prompts.extend(
+                self._namespace_items(target, target_prompts, self._namespaced_prompts, self._prompt_routes),
+            )
         return prompts
 
     async def get_prompt(
@@ -146,15 +182,108 @@ class MultiplexTarget(Target):
         :return: Prompt result from the target
         :raises McpError: If the prompt name is invalid or target not found
         """
-        target_name = self._get_namespace_from_name(name, "prompt")
+        target, prompt_name = self._prompt_routes.get(name) or self._resolve_route(name, "prompt")
+        return await target.get_prompt(prompt_name, arguments)
+
+    async def _list_from_targets(
+        self,
+        list_items: Callable[[Target], Awaitable[list[T]]],
+        item_type: str,
+    ) -> list[tuple[Target, list[T]]]:
+        """List tools or prompts from all targets concurrently.
+
+        :param list_items: Function that lists the items of a target
+        :param item_type: Type of item ("tool" or "prompt") for error messages
+        :return: Targets that listed successfully with their items, in target order
+        :raises Exception: The first target error, unless partial results are enabled
+        """
+        targets = list(self._targets_dict.values())
+        results = await asyncio.gather(
+            *[self._list_from_target(target, list_items, item_type) for target in targets],
+            return_exceptions=True,
+        )
+        listed = []
+        failures: dict[str, Exception] = {}
+        for target, result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                failures[target.name] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                listed.append((target, result))
+        self._failed_targets[item_type] = failures
+        if failures and not self.partial_results:
+            raise next(iter(failures.values()))
+        for target_name, error in failures.items():
+            logger.warning("Skipping %ss of target '%s': %s", item_type, target_name, error)
+        return listed
+
+    async def _list_from_target(
+        self,
+        target: Target,
+        list_items: Callable[[Target], Awaitable[list[T]]],
+        item_type: str,
+    ) -> list[T]:
+        """List tools or prompts from a single target within the timeout.
+
+        :param target: The target to list from
+        :param list_items: Function that lists the items of a target
+        :param item_type: Type of item ("tool" or "prompt") for error messages
+        :return: The items of the target
+        :raises TimeoutError: If the target doesn't answer within the timeout
+        """
+        try:
+            return await asyncio.wait_for(list_items(target), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Listing {item_type}s of target '{target.name}' timed out after {self.timeout}s",
+            ) from None
+
+    def _namespace_items(
+        self,
+        target: Target,
+        items: list[ItemT],
+        namespaced_cache: dict[str, tuple[list[ItemT], list[ItemT]]],
+        routes: dict[str, tuple[Target, str]],
+    ) -> list[ItemT]:
+        """Get the namespaced tools or prompts of a target, updating the routing table if they changed.
+
+        :param target: The target that owns the items
+        :param items: Tools or prompts as listed by the target
+        :param namespaced_cache: Cache of listed and namespaced items per target name
+        :param routes: Routing table from namespaced names to the target and original name
+        :return: Items with namespaced names
+        """
+        cached = namespaced_cache.get(target.name)
+        if cached is not None and (cached[0] is items or cached[0] == items):
+            return cached[1]
+
+        namespaced = [item.model_copy(update={"name": self._get_namespaced_name(target, item.name)}) for item in items]
+        if cached is not None:
+            for item in cached[1]:
+                routes.pop(item.name, None)
+        for item, namespaced_item in zip(items, namespaced, strict=True):
+            routes[namespaced_item.name] = (target, item.name)
+        namespaced_cache[target.name] = (items, namespaced)
+        return namespaced
+
+    def _resolve_route(self, name: str, item_type: str) -> tuple[Target, str]:
+        """Resolve a namespaced name that is not in the routing table yet.
+
+        :param name: Namespaced name
+        :param item_type: Type of item ("tool" or "prompt") for error messages
+        :return: Tuple of (target, original name)
+        :raises McpError: If the name format is invalid or the target is not found
+        """
+        target_name = self._get_namespace_from_name(name, item_type)
         if target_name not in self._targets_dict:
             raise McpError(
                 ErrorData(
                     code=400,
-                    message=f"Prompt '{name}' not found",
+                    message=f"{item_type.capitalize()} '{name}' not found",
                 ),
             )
-        return await self._targets_dict[target_name].get_prompt(name, arguments)
+        return self._targets_dict[target_name], name[len(target_name) + 1 :]
 
     def _get_namespaced_name(self, target: Target, name: str) -> str:
         """Create a namespaced name for tools or prompts.
@@ -170,7 +299,7 @@ class MultiplexTarget(Target):
 
         :param name: Namespaced name
         :param item_type: Type of item ("tool" or "prompt") for error messages
-        :return: Target name
+        :return: Target name (the longest matching one for dotted target names)
         :raises McpError: If the name format is invalid
         """
         if "." not in name:
@@ -180,6 +309,9 @@ class MultiplexTarget(Target):
                     message=f"Invalid {item_type} name '{name}', expected format 'target_name.{item_type}_name'",
                 ),
             )
+        for target_name in self._target_names_by_length:
+            if name.startswith(target_name + "."):
+                return target_name
         return name.split(".")[0]
 
     async def close(self) -> None:
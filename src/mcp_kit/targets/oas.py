@@ -1,10 +1,16 @@
 """OpenAPI Specification (OAS) target implementation."""
 
 import asyncio
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import ModuleType
 from typing import Any
 
 import click
+import httpx
 import uvicorn
+import yaml  # type: ignore[import-untyped]
 from mcp import Tool
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import Context
@@ -13,8 +19,10 @@ from mcp.shared.context import LifespanContextT
 from mcp.types import Content, GetPromptResult, Prompt
 from omegaconf import DictConfig
 from openapi_mcp import create_mcp_server  # type: ignore[import-untyped]
+from openapi_mcp import http_tools as openapi_mcp_http_tools
 from typing_extensions import Self
 
+from mcp_kit.spec_cache import CachedSpec, SpecCache
 from mcp_kit.targets.interfaces import Target
 
 
@@ -23,21 +31,30 @@ class OasTarget(Target):
 
     This target creates MCP tools from OpenAPI specifications, allowing
     interaction with REST APIs through the MCP protocol.
+
+    With a spec cache, the specification is only downloaded again when it
+    changed, and the tools built from it are cached by its digest. When they are,
+    the specification is only parsed on the first tool call.
     """
 
     def __init__(
         self,
         name: str,
         spec_url: str,
+        spec_cache: SpecCache | None = None,
     ) -> None:
         """Initialize the OAS target.
 
         :param name: Name of the target
         :param spec_url: URL of the OpenAPI specification
+        :param spec_cache: Optional cache of the specification and of the tools built from it
         """
         self._name = name
         self._spec_url = spec_url
+        self.spec_cache = spec_cache
         self._fast_mcp: FastMCP | None = None
+        self._spec: CachedSpec | None = None
+        self._tools: list[Tool] | None = None
 
     @property
     def name(self) -> str:
@@ -54,15 +71,56 @@ class OasTarget(Target):
         :param config: Target configuration from OmegaConf
         :return: OasTarget instance
         """
-        return cls(name=config.name, spec_url=config.spec_url)
+        spec_cache = None
+        cache_config = config.get("cache")
+        if cache_config is not None:
+            spec_cache = SpecCache(
+                path=cache_config.get("path", ".mcp_kit/oas_cache"),
+                max_age=cache_config.get("max_age", 0.0),
+            )
+        return cls(name=config.name, spec_url=config.spec_url, spec_cache=spec_cache)
 
     async def initialize(self) -> None:
         """Initialize the target by creating MCP server from OpenAPI spec.
 
         Downloads and parses the OpenAPI specification to create the underlying
-        FastMCP server with tools for each API endpoint.
+        FastMCP server with tools for each API endpoint. With a spec cache, the
+        cached specification is revalidated instead, and the server is only
+        created on the first tool call if the tools built from it are cached.
+        """
+        if self.spec_cache is None:
+            self._set_server(create_mcp_server(self._spec_url))
+            return
+
+        self._fast_mcp = None
+        self._spec = await self.spec_cache.fetch(self._spec_url)
+        self._tools = self.spec_cache.load_catalog(self._spec.digest)
+        if self._tools is None:
+            fast_mcp = self._create_server()
+            self._tools = await fast_mcp.list_tools()
+            self.spec_cache.save_catalog(self._spec.digest, self._tools)
+
+    def _create_server(self) -> FastMCP:
+        """Create the FastMCP server from the cached specification.
+
+        :return: The FastMCP server
+        :raises ValueError: If the target is not initialized
+        """
+        if self._spec is None:
+            raise ValueError(
+                "OasTarget server is not initialized. Call initialize() first.",
+            )
+        if self._fast_mcp is None:
+            self._set_server(create_mcp_server_from_spec(parse_spec(self._spec.content), self._spec.url))
+        assert self._fast_mcp is not None
+        return self._fast_mcp
+
+    def _set_server(self, fast_mcp: FastMCP) -> None:
+        """Use a FastMCP server created from the specification for the tool calls.
+
+        :param fast_mcp: The FastMCP server
         """
-        self._fast_mcp = create_mcp_server(self._spec_url)
+        self._fast_mcp = fast_mcp
         call_tool = self._fast_mcp._tool_manager.call_tool
 
         async def call_tool_with_kwargs(
@@ -88,6 +146,8 @@ class OasTarget(Target):
         :return: List of tools corresponding to API endpoints
         :raises ValueError: If the target is not initialized
         """
+        if self._tools is not None:
+            return self._tools
         if self._fast_mcp is None:
             raise ValueError(
                 "OasTarget server is not initialized. Call initialize() first.",
@@ -106,6 +166,8 @@ class OasTarget(Target):
         :return: List of content responses from the API call
         :raises ValueError: If the target is not initialized
         """
+        if self._fast_mcp is None and self._spec is not None:
+            self._create_server()
         if self._fast_mcp is None:
             raise ValueError(
                 "OasTarget server is not initialized. Call initialize() first.",
@@ -140,6 +202,90 @@ class OasTarget(Target):
     async def close(self) -> None:
         """Clean up the target by releasing the FastMCP server."""
         self._fast_mcp = None
+        self._spec = None
+        self._tools = None
+
+
+def parse_spec(content: bytes) -> dict[str, Any]:
+    """Parse an OpenAPI specification in JSON or YAML.
+
+    :param content: Raw content of the specification
+    :return: The specification
+    :raises ValueError: If the content is not a JSON or YAML object
+    """
+    try:
+        spec = json.loads(content)
+    except ValueError:
+        try:
+            spec = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid OpenAPI spec: {e}") from e
+    if not isinstance(spec, dict):
+        raise ValueError("Invalid OpenAPI spec: expected an object")
+    return spec
+
+
+def create_mcp_server_from_spec(spec: dict[str, Any], spec_url: str) -> FastMCP:
+    """Create a FastMCP server with a tool per operation of an already downloaded OpenAPI specification.
+
+    openapi-mcp only builds tools from a specification it downloads itself, so
+    `create_mcp_server` is handed the specification by the stand-in of its HTTP
+    client instead of downloading it again, and builds the same tools.
+
+    :param spec: The OpenAPI specification
+    :param spec_url: URL the specification was downloaded from
+    :return: The FastMCP server
+    """
+    with _serving_spec(spec):
+        fast_mcp: FastMCP = create_mcp_server(spec_url)
+    return fast_mcp
+
+
+class _SpecClient(ModuleType):
+    """Stand-in for the httpx module of openapi-mcp, answering the download of a specification."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        """Initialize the stand-in.
+
+        :param spec: The specification to answer with
+        """
+        super().__init__("httpx")
+        self.spec = spec
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Answer the download of the specification.
+
+        :param url: URL of the specification
+        :param kwargs: Ignored request options
+        :return: Response with the specification
+        """
+        return httpx.Response(200, json=self.spec, request=httpx.Request("GET", url))
+
+    def __getattr__(self, name: str) -> Any:
+        """Get the other attributes from httpx.
+
+        :param name: Name of the attribute
+        :return: The httpx attribute
+        """
+        return getattr(httpx, name)
+
+
+@contextmanager
+def _serving_spec(spec: dict[str, Any]) -> Iterator[None]:
+    """Make openapi-mcp download the given specification while it builds tools.
+
+    The server is built synchronously on the event loop, so nothing else uses
+    openapi-mcp while the stand-in is in place.
+
+    :param spec: The specification to answer with
+    :yield: None, while openapi-mcp is served the specification
+    """
+    original = openapi_mcp_http_tools.httpx
+    openapi_mcp_http_tools.httpx = _SpecClient(spec)
+    try:
+        yield
+    finally:
+        openapi_mcp_http_tools.httpx = original
 
 
 # TODO delete once we have a single main entry point with click
@@ -0,0 +1,168 @@
+"""Recording target implementation that logs the traffic of another target."""
+
+import time
+from typing import Any
+
+from mcp.types import Content, GetPromptResult, Prompt, Tool
+from omegaconf import DictConfig
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from mcp_kit.cache import hash_arguments
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.record_log import RecordLog
+from mcp_kit.targets.interfaces import Target
+
+
+class RecordingTarget(Target):
+    """Target that wraps another target and records its traffic.
+
+    Every tool call and prompt request answered by the base target is appended
+    to a JSONL log with its response, along with the tool and prompt listings
+    whenever they change. The records are written by a background task, so
+    recording doesn't block the event loop. The log can be served back by a ReplayTarget. The
+    recording target keeps the name of the base target, so recorded traffic is
+    replayed under the same name.
+    """
+
+    def __init__(
+        self,
+        target: Target,
+        path: str,
+        max_bytes: int | None = None,
+        backup_count: int | None = None,
+    ) -> None:
+        """Initialize the recording target.
+
+        :param target: The base target to wrap
+        :param path: Path of the log file to append the records to
+        :param max_bytes: Optional size in bytes after which the log file is rotated
+        :param backup_count: Optional number of rotated log files to keep
+        """
+        self.target = target
+        self.log = RecordLog(path, max_bytes=max_bytes, backup_count=backup_count)
+        self._recorded_tools: list[Tool] | None = None
+        self._recorded_prompts: list[Prompt] | None = None
+
+    @property
+    def name(self) -> str:
+        """Get the name of the base target.
+
+        :return: The base target name
+        """
+        return self.target.name
+
+    @property
+    def sub_targets(self) -> list[Target]:
+        """Get the targets this target depends on.
+
+        :return: The base target
+        """
+        return [self.target]
+
+    @classmethod
+    def from_config(cls, config: DictConfig) -> Self:
+        """Create RecordingTarget from configuration.
+
+        :param config: Target configuration from OmegaConf
+        :return: RecordingTarget instance
+        """
+        base_target = create_target_from_config(config.base_target)
+        return cls(
+            base_target,
+            config.path,
+            max_bytes=config.get("max_bytes"),
+            backup_count=config.get("backup_count"),
+        )
+
+    async def initialize(self) -> None:
+        """Initialize the base target."""
+        await self.target.initialize()
+
+    async def list_tools(self) -> list[Tool]:
+        """List tools from the base target, recording the listing if it changed.
+
+        :return: List of available tools from the base target
+        """
+        tools = await self.target.list_tools()
+        if tools != self._recorded_tools:
+            self.log.append_nowait({"type": "tools", "tools": [_dump(tool) for tool in tools]})
+            self._recorded_tools = list(tools)
+        return tools
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> list[Content]:
+        """Call a tool on the base target and record the call and its result.
+
+        :param name: Name of the tool to call
+        :param arguments: Arguments to pass to the tool
+        :return: List of content responses from the tool
+        """
+        start = time.perf_counter()
+        result = await self.target.call_tool(name, arguments)
+        self.log.append_nowait(
+            {
+                "type": "call_tool",
+                "name": name,
+                "arguments": arguments or {},
+                "key": hash_arguments(name, arguments),
+                "duration": time.perf_counter() - start,
+                "result": [_dump(content) for content in result],
+            }
+        )
+        return result
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List prompts from the base target, recording the listing if it changed.
+
+        :return: List of available prompts from the base target
+        """
+        prompts = await self.target.list_prompts()
+        if prompts != self._recorded_prompts:
+            self.log.append_nowait({"type": "prompts", "prompts": [_dump(prompt) for prompt in prompts]})
+            self._recorded_prompts = list(prompts)
+        return prompts
+
+    async def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, str] | None = None,
+    ) -> GetPromptResult:
+        """Get a prompt from the base target and record the request and its result.
+
+        :param name: Name of the prompt to get
+        :param arguments: Arguments to pass to the prompt
+        :return: Prompt result from the base target
+        """
+        start = time.perf_counter()
+        result = await self.target.get_prompt(name, arguments)
+        self.log.append_nowait(
+            {
+                "type": "get_prompt",
+                "name": name,
+                "arguments": arguments or {},
+                "key": hash_arguments(name, arguments),
+                "duration": time.perf_counter() - start,
+                "result": _dump(result),
+            }
+        )
+        return result
+
+    async def close(self) -> None:
+        """Close the base target and the log file, once the queued records are written."""
+        try:
+            await self.target.close()
+        finally:
+            await self.log.aclose()
+
+
+def _dump(model: BaseModel) -> dict[str, Any]:
+    """Dump an MCP model to a JSON compatible record.
+
+    :param model: The MCP model
+    :return: JSON compatible dictionary, without the unset optional fields
+    """
+    return model.model_dump(mode="json", exclude_none=True)
@@ -0,0 +1,173 @@
+"""Replay target implementation that serves responses recorded by a recording target."""
+
+import asyncio
+import copy
+import logging
+from typing import Any
+
+from mcp import ErrorData, McpError
+from mcp.types import Content, GetPromptResult, Prompt, Tool
+from omegaconf import DictConfig
+from pydantic import TypeAdapter
+from typing_extensions import Self
+
+from mcp_kit.record_log import read_records
+from mcp_kit.replay_index import MatchConfig, ReplayIndex
+from mcp_kit.targets.interfaces import Target
+
+logger = logging.getLogger(__name__)
+
+_contents_adapter: TypeAdapter[list[Content]] = TypeAdapter(list[Content])
+
+
+class ReplayTarget(Target):
+    """Target that serves the tool calls and prompts recorded by a RecordingTarget.
+
+    The log, including its rotated files, is read once on initialization, from a
+    worker thread, into an index of the parsed responses per tool and prompt. The match configuration
+    chooses how calls are matched to recorded ones: by identical arguments, by
+    arguments identical except for some ignored paths (like timestamps), or by
+    nearest arguments. Tool and prompt listings are the last recorded ones.
+    Calls without a matching recorded call raise an McpError.
+    """
+
+    def __init__(self, name: str, path: str, match_config: MatchConfig | None = None) -> None:
+        """Initialize the replay target.
+
+        :param name: Name of the target
+        :param path: Path of the log file written by the recording target
+        :param match_config: How calls are matched to recorded calls (identical arguments by default)
+        """
+        self._name = name
+        self.path = path
+        self.match_config = match_config or MatchConfig()
+        self._tools: list[Tool] = []
+        self._prompts: list[Prompt] = []
+        self._tool_responses: dict[str, ReplayIndex[list[Content]]] = {}
+        self._prompt_responses: dict[str, ReplayIndex[GetPromptResult]] = {}
+
+    @property
+    def name(self) -> str:
+        """Get the target name.
+
+        :return: The target name
+        """
+        return self._name
+
+    @classmethod
+    def from_config(cls, config: DictConfig) -> Self:
+        """Create ReplayTarget from configuration.
+
+        :param config: Target configuration from OmegaConf
+        :return: ReplayTarget instance
+        """
+        match = config.get("match")
+        match_config = None
+        if match is not None:
+            match_config = MatchConfig(
+                strategy=match.get("strategy", "exact"),
+                ignore_paths=list(match.get("ignore_paths", [])),
+                min_similarity=match.get("min_similarity", 0.0),
+            )
+        return cls(config.name, config.path, match_config)
+
+    async def initialize(self) -> None:
+        """Read the recorded log into the response indexes, without blocking the event loop."""
+        await asyncio.to_thread(self._load)
+
+    def _load(self) -> None:
+        """Read the recorded log into new response indexes, replacing the current ones once read."""
+        tools: list[Tool] = []
+        prompts: list[Prompt] = []
+        tool_responses: dict[str, ReplayIndex[list[Content]]] = {}
+        prompt_responses: dict[str, ReplayIndex[GetPromptResult]] = {}
+        count = 0
+        for record in read_records(self.path):
+            record_type = record.get("type")
+            if record_type == "tools":
+                tools = [Tool.model_validate(tool) for tool in record["tools"]]
+            elif record_type == "prompts":
+                prompts = [Prompt.model_validate(prompt) for prompt in record["prompts"]]
+            elif record_type == "call_tool":
+                self._index(tool_responses, record["name"]).add(
+                    record["arguments"], _contents_adapter.validate_python(record["result"])
+                )
+            elif record_type == "get_prompt":
+                self._index(prompt_responses, record["name"]).add(
+                    record["arguments"], GetPromptResult.model_validate(record["result"])
+                )
+            else:
+                continue
+            count += 1
+        self._tools, self._prompts = tools, prompts
+        self._tool_responses, self._prompt_responses = tool_responses, prompt_responses
+        logger.debug("Loaded %d records from %s", count, self.path)
+
+    async def list_tools(self) -> list[Tool]:
+        """List the last recorded tools.
+
+        :return: List of recorded tools
+        """
+        return list(self._tools)
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> list[Content]:
+        """Serve the recorded result of a tool call.
+
+        :param name: Name of the tool to call
+        :param arguments: Arguments to pass to the tool
+        :return: A copy of the recorded list of content responses
+        :raises McpError: If no recorded call matches
+        """
+        responses = self._tool_responses.get(name)
+        result = responses.get(arguments) if responses is not None else None
+        if result is None:
+            raise McpError(ErrorData(code=400, message=f"No recorded response for tool '{name}' with these arguments"))
+        return copy.deepcopy(result)
+
+    async def list_prompts(self) -> list[Prompt]:
+        """List the last recorded prompts.
+
+        :return: List of recorded prompts
+        """
+        return list(self._prompts)
+
+    async def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, str] | None = None,
+    ) -> GetPromptResult:
+        """Serve the recorded result of a prompt request.
+
+        :param name: Name of the prompt to get
+        :param arguments: Arguments to pass to the prompt
+        :return: A copy of the recorded prompt result
+        :raises McpError: If no recorded request matches
+        """
+        responses = self._prompt_responses.get(name)
+        result = responses.get(arguments) if responses is not None else None
+        if result is None:
+            raise McpError(
+                ErrorData(code=400, message=f"No recorded response for prompt '{name}' with these arguments")
+            )
+        return result.model_copy(deep=True)
+
+    def _index(self, indexes: dict[str, ReplayIndex[Any]], name: str) -> ReplayIndex[Any]:
+        """Get the index of a tool or prompt, creating it on first use.
+
+        :param indexes: Indexes of the tools or of the prompts, by name
+        :param name: Name of the tool or prompt
+        :return: The index of its recorded calls
+        """
+        index = indexes.get(name)
+        if index is None:
+            index = indexes[name] = self.match_config.create_index()
+        return index
+
+    async def close(self) -> None:
+        """Drop the response indexes."""
+        self._tool_responses.clear()
+        self._prompt_responses.clear()
@@ -168,6 +168,29 @@ class TestLangGraphMultiServerMCPClient:
         # Should still call close
         mock_target.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_session_with_start(self, mock_target, monkeypatch):
+        """Test the target is started with the given start function instead of initialize."""
+        import builtins
+
+        original_import = builtins.__import__
+
+        def patched_import(name, *args, **kwargs):
+            if name == "langchain_mcp_adapters.tools":
+                return MagicMock(load_mcp_tools=AsyncMock())
+            return original_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", patched_import)
+        start = AsyncMock()
+
+        client = LangGraphMultiServerMCPClient(mock_target, start)
+
+        async with client.session("test-langgraph-target"):
+            start.assert_called_once()
+            mock_target.initialize.assert_not_called()
+        await client.get_tools()
+        assert start.call_count == 2
+
     @pytest.mark.asyncio
     async def test_session_exception_during_context(self, mock_target, monkeypatch):
         """Test session cleanup when exception occurs during context execution."""
@@ -0,0 +1,235 @@
+"""Tests for the LRU cache and argument hashing helpers."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from mcp_kit.cache import LruCache, SqliteCache, hash_arguments
+
+
+class TestHashArguments:
+    """Test cases for hash_arguments."""
+
+    def test_key_order_does_not_matter(self):
+        """Test arguments hash the same regardless of their order."""
+        assert hash_arguments("tool", {"a": 1, "b": {"c": 2, "d": 3}}) == hash_arguments(
+            "tool", {"b": {"d": 3, "c": 2}, "a": 1}
+        )
+
+    def test_name_and_values_matter(self):
+        """Test different names or values hash differently."""
+        assert hash_arguments("tool", {"a": 1}) != hash_arguments("other", {"a": 1})
+        assert hash_arguments("tool", {"a": 1}) != hash_arguments("tool", {"a": "1"})
+
+    def test_no_arguments(self):
+        """Test missing arguments hash like empty arguments."""
+        assert hash_arguments("tool", None) == hash_arguments("tool", {})
+
+
+class TestLruCache:
+    """Test cases for LruCache."""
+
+    def test_get_and_put(self):
+        """Test cached values are returned and the size is tracked."""
+        cache: LruCache[str] = LruCache(max_bytes=100)
+        cache.put("a", "value", 10)
+
+        assert cache.get("a") == "value"
+        assert cache.get("b") is None
+        assert cache.size == 10
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used values are evicted to stay under max_bytes."""
+        cache: LruCache[str] = LruCache(max_bytes=30)
+        cache.put("a", "a", 10)
+        cache.put("b", "b", 10)
+        cache.put("c", "c", 10)
+        cache.get("a")
+
+        cache.put("d", "d", 15)
+
+        assert cache.get("b") is None
+        assert cache.get("c") is None
+        assert cache.get("a") == "a"
+        assert cache.get("d") == "d"
+        assert cache.size == 25
+
+    def test_replace_value(self):
+        """Test putting an existing key replaces its value and size."""
+        cache: LruCache[str] = LruCache(max_bytes=100)
+        cache.put("a", "old", 10)
+        cache.put("a", "new", 20)
+
+        assert cache.get("a") == "new"
+        assert cache.size == 20
+        assert len(cache) == 1
+
+    def test_value_larger_than_cache(self):
+        """Test values larger than the whole cache are not cached."""
+        cache: LruCache[str] = LruCache(max_bytes=10)
+        cache.put("a", "a", 5)
+        cache.put("b", "b", 20)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+
+    def test_ttl(self):
+        """Test values expire after their time to live."""
+        cache: LruCache[str] = LruCache(max_bytes=100)
+        with patch("mcp_kit.cache.time.monotonic", return_value=100.0):
+            cache.put("a", "a", 10, ttl=30)
+            cache.put("b", "b", 10)
+
+        with patch("mcp_kit.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == "b"
+        assert cache.size == 10
+
+    def test_clear(self):
+        """Test clear removes all values."""
+        cache: LruCache[str] = LruCache(max_bytes=100)
+        cache.put("a", "a", 10)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestSqliteCache:
+    """Test cases for SqliteCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a SQLite cache in a temporary directory."""
+        cache = SqliteCache(tmp_path / "cache.sqlite", max_bytes=30)
+        yield cache
+        cache.close()
+
+    def test_get_and_put(self, cache):
+        """Test cached values are returned and the size is tracked."""
+        cache.put("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("b") is None
+        assert cache.size == 5
+
+    def test_persistent(self, tmp_path):
+        """Test values survive reopening the database."""
+        path = tmp_path / "nested" / "cache.sqlite"
+        cache = SqliteCache(path, max_bytes=100)
+        cache.put("a", "value")
+        cache.close()
+
+        reopened = SqliteCache(path, max_bytes=100)
+        assert reopened.get("a") == "value"
+        reopened.close()
+
+    def test_opened_on_first_use(self, tmp_path):
+        """Test the database is only created once the cache is used."""
+        path = tmp_path / "nested" / "cache.sqlite"
+        cache = SqliteCache(path, max_bytes=100)
+        assert not path.parent.exists()
+
+        assert cache.get("a") is None
+        assert path.exists()
+        cache.close()
+        cache.close()
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test the least recently used values are evicted to stay under max_bytes."""
+        with patch("mcp_kit.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+            cache.put("a", "a" * 10)
+            cache.put("b", "b" * 10)
+            cache.put("c", "c" * 10)
+            cache.get("a")
+            cache.put("d", "d" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a" * 10
+        assert cache.get("c") == "c" * 10
+        assert cache.get("d") == "d" * 10
+        assert cache.size == 30
+
+    def test_total_size_tracked(self, cache):
+        """Test the running total size follows inserts, replacements, evictions and clears."""
+
+        def entries_size() -> int:
+            (size,) = cache._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return size
+
+        for key, value in [("a", "a" * 10), ("b", "b" * 5), ("a", "a" * 3), ("c", "c" * 20), ("d", "d" * 15)]:
+            cache.put(key, value)
+            assert cache.size == entries_size()
+        assert cache.size <= 30
+
+        cache.clear()
+        assert cache.size == entries_size() == 0
+
+    def test_total_size_of_existing_database(self, tmp_path):
+        """Test a database created without the totals table starts from the size of its entries."""
+        path = tmp_path / "cache.sqlite"
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE entries "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("INSERT INTO entries VALUES ('a', 'value', 5, 1.0)")
+        connection.commit()
+        connection.close()
+
+        cache = SqliteCache(path, max_bytes=100)
+        cache.put("b", "other")
+
+        assert cache.size == 10
+        cache.close()
+
+    def test_access_times_written_in_batches(self, tmp_path):
+        """Test reads only write their access times once a batch is full, or with the next write."""
+        path = tmp_path / "cache.sqlite"
+        cache = SqliteCache(path, max_bytes=1000)
+
+        def accessed_at(key: str) -> float:
+            with sqlite3.connect(path) as connection:
+                return connection.execute("SELECT accessed_at FROM entries WHERE key = ?", (key,)).fetchone()[0]
+
+        with patch("mcp_kit.cache.time.time", return_value=1.0):
+            cache.put("a", "a")
+        with patch("mcp_kit.cache.time.time", return_value=2.0):
+            cache.get("a")
+        assert accessed_at("a") == 1.0
+
+        with patch("mcp_kit.cache.time.time", return_value=3.0):
+            cache.put("b", "b")
+        assert accessed_at("a") == 2.0
+
+        keys = [f"key{n}" for n in range(SqliteCache.ACCESS_BATCH_SIZE)]
+        for key in keys:
+            cache.put(key, "v")
+        with patch("mcp_kit.cache.time.time", return_value=4.0):
+            for key in keys[:-1]:
+                cache.get(key)
+            assert accessed_at(keys[0]) != 4.0
+            cache.get(keys[-1])
+        assert accessed_at(keys[0]) == accessed_at(keys[-1]) == 4.0
+
+        with patch("mcp_kit.cache.time.time", return_value=5.0):
+            cache.get("a")
+        cache.close()
+        assert accessed_at("a") == 5.0
+
+    def test_value_larger_than_cache(self, cache):
+        """Test values larger than the whole cache are not cached."""
+        cache.put("a", "a" * 31)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache):
+        """Test clear removes all values."""
+        cache.put("a", "a")
+
+        cache.clear()
+
+        assert len(cache) == 0
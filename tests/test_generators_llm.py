@@ -1,13 +1,18 @@
 """Tests for LLM response generator."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from litellm.exceptions import AuthenticationError
 from mcp import Tool
 from mcp.types import TextContent
 from omegaconf import OmegaConf
 
-from mcp_kit.generators.llm import LlmAuthenticationError, LlmResponseGenerator
+from mcp_kit.cache import SqliteCache
+from mcp_kit.generators.llm import LlmAuthenticationError, LlmCacheMissError, LlmResponseGenerator
+from mcp_kit.progress import progress_reporting
 
 
 class TestLlmResponseGenerator:
@@ -227,3 +232,407 @@ class TestLlmResponseGenerator:
             assert "test_target" in user_content
             assert "message_test" in user_content
             assert "test" in user_content
+
+
+def llm_response(content: str) -> MagicMock:
+    """Create a mock LLM response with the given content."""
+    response = MagicMock()
+    choice = MagicMock()
+    choice.message.content = content
+    response.choices = [choice]
+    return response
+
+
+class TestLlmResponseGeneratorCache:
+    """Test cases for the persistent cache of LlmResponseGenerator."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a SQLite cache in a temporary directory."""
+        cache = SqliteCache(tmp_path / "llm_cache.sqlite", max_bytes=1024)
+        yield cache
+        cache.close()
+
+    def test_from_config_with_cache(self, tmp_path):
+        """Test the cache and replay mode are read from the configuration."""
+        path = tmp_path / "cache" / "llm.sqlite"
+        config = OmegaConf.create(
+            {"model": "gpt-4", "cache": {"path": str(path), "max_bytes": 2048, "replay": True}}
+        )
+
+        generator = LlmResponseGenerator.from_config(config)
+
+        assert generator.cache is not None
+        assert generator.cache.path == path
+        assert generator.cache.max_bytes == 2048
+        assert generator.replay
+        assert not path.exists()
+        generator.cache.close()
+
+    def test_replay_requires_cache(self):
+        """Test replay mode can't be enabled without a cache."""
+        with pytest.raises(ValueError, match="requires a cache"):
+            LlmResponseGenerator("gpt-4", replay=True)
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_are_generated_once(self, cache):
+        """Test identical tool calls are answered from the cache."""
+        generator = LlmResponseGenerator("gpt-4", cache=cache)
+        tool = Tool(name="test_tool", description="A test tool", inputSchema={})
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion", side_effect=[llm_response("first"), llm_response("second")]
+        ) as mock_completion:
+            first = await generator.generate("test_target", tool, {"param": "value"})
+            again = await generator.generate("test_target", tool, {"param": "value"})
+            other = await generator.generate("test_target", tool, {"param": "other"})
+
+        assert [first[0].text, again[0].text, other[0].text] == ["first", "first", "second"]
+        assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_model(self, cache):
+        """Test responses of another model are not reused."""
+        tool = Tool(name="test_tool", inputSchema={})
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion", side_effect=[llm_response("gpt"), llm_response("claude")]
+        ):
+            gpt = await LlmResponseGenerator("gpt-4", cache=cache).generate("test_target", tool)
+            claude = await LlmResponseGenerator("claude", cache=cache).generate("test_target", tool)
+
+        assert [gpt[0].text, claude[0].text] == ["gpt", "claude"]
+
+    @pytest.mark.asyncio
+    async def test_replay(self, cache):
+        """Test replay mode answers from the cache without calling the LLM."""
+        tool = Tool(name="test_tool", inputSchema={})
+        with patch("mcp_kit.generators.llm.acompletion", return_value=llm_response("recorded")):
+            await LlmResponseGenerator("gpt-4", cache=cache).generate("test_target", tool, {"a": 1})
+
+        generator = LlmResponseGenerator("gpt-4", cache=cache, replay=True)
+        with patch("mcp_kit.generators.llm.acompletion") as mock_completion:
+            result = await generator.generate("test_target", tool, {"a": 1})
+            with pytest.raises(LlmCacheMissError, match="test_tool"):
+                await generator.generate("test_target", tool, {"a": 2})
+
+        assert result[0].text == "recorded"
+        mock_completion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache):
+        """Test empty responses are not cached."""
+        generator = LlmResponseGenerator("gpt-4", cache=cache)
+        tool = Tool(name="test_tool", inputSchema={})
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion", side_effect=[llm_response(""), llm_response("ok")]
+        ):
+            with pytest.raises(ValueError, match="empty"):
+                await generator.generate("test_target", tool)
+            result = await generator.generate("test_target", tool)
+
+        assert result[0].text == "ok"
+        assert len(cache) == 1
+
+
+class TestLlmResponseGeneratorLimits:
+    """Test cases for the concurrency limits and request coalescing of LlmResponseGenerator."""
+
+    def test_from_config_with_limits(self):
+        """Test the limits are read from the configuration."""
+        config = OmegaConf.create(
+            {"model": "gpt-4", "max_concurrency": 4, "requests_per_minute": 60, "tokens_per_minute": 6000}
+        )
+
+        generator = LlmResponseGenerator.from_config(config)
+
+        assert generator._semaphore is not None
+        assert generator._requests_bucket is not None and generator._requests_bucket.capacity == 60
+        assert generator._tokens_bucket is not None and generator._tokens_bucket.capacity == 6000
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """Test at most max_concurrency LLM calls run at the same time."""
+        generator = LlmResponseGenerator("gpt-4", max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def completion(model, messages):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return llm_response("ok")
+
+        with patch("mcp_kit.generators.llm.acompletion", side_effect=completion):
+            await asyncio.gather(
+                *[generator.generate("test_target", Tool(name=f"tool{i}", inputSchema={})) for i in range(6)]
+            )
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limits(self):
+        """Test LLM calls acquire requests and estimated tokens, corrected with the actual usage."""
+        generator = LlmResponseGenerator("gpt-4", requests_per_minute=60, tokens_per_minute=10000)
+        response = llm_response("ok")
+        response.usage.total_tokens = 500
+
+        with (
+            patch("mcp_kit.generators.llm.acompletion", return_value=response),
+            patch("mcp_kit.generators.llm.token_counter", return_value=300),
+            patch.object(generator._requests_bucket, "acquire") as acquire_request,
+            patch.object(generator._tokens_bucket, "acquire") as acquire_tokens,
+            patch.object(generator._tokens_bucket, "consume") as consume_tokens,
+        ):
+            await generator.generate("test_target", Tool(name="test_tool", inputSchema={}))
+
+        acquire_request.assert_called_once_with()
+        acquire_tokens.assert_called_once_with(300)
+        consume_tokens.assert_called_once_with(200)
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self):
+        """Test identical requests in flight share one LLM call."""
+        generator = LlmResponseGenerator("gpt-4")
+        tool = Tool(name="test_tool", inputSchema={})
+
+        async def completion(model, messages):
+            await asyncio.sleep(0.01)
+            return llm_response("shared")
+
+        with patch("mcp_kit.generators.llm.acompletion", side_effect=completion) as mock_completion:
+            results = await asyncio.gather(
+                *[generator.generate("test_target", tool, {"a": 1}) for _ in range(5)],
+                generator.generate("test_target", tool, {"a": 2}),
+            )
+
+        assert {result[0].text for result in results} == {"shared"}
+        assert mock_completion.call_count == 2
+        assert generator._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_errors_are_shared(self):
+        """Test an error of the shared LLM call is raised to every caller, and not kept."""
+        generator = LlmResponseGenerator("gpt-4")
+        tool = Tool(name="test_tool", inputSchema={})
+
+        async def completion(model, messages):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider error")
+
+        with patch("mcp_kit.generators.llm.acompletion", side_effect=completion) as mock_completion:
+            results = await asyncio.gather(
+                *[generator.generate("test_target", tool) for _ in range(3)], return_exceptions=True
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert mock_completion.call_count == 1
+        assert generator._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one caller doesn't cancel the shared LLM call."""
+        generator = LlmResponseGenerator("gpt-4")
+        tool = Tool(name="test_tool", inputSchema={})
+
+        async def completion(model, messages):
+            await asyncio.sleep(0.02)
+            return llm_response("shared")
+
+        with patch("mcp_kit.generators.llm.acompletion", side_effect=completion):
+            cancelled = asyncio.create_task(generator.generate("test_target", tool))
+            waiting = asyncio.create_task(generator.generate("test_target", tool))
+            await asyncio.sleep(0.005)
+            cancelled.cancel()
+            result = await waiting
+
+        assert result[0].text == "shared"
+
+
+class TestLlmResponseGeneratorBatching:
+    """Test cases for the micro-batching mode of LlmResponseGenerator."""
+
+    @staticmethod
+    def tools(count: int) -> list[Tool]:
+        """Create distinct tools so their generation requests are not coalesced."""
+        return [Tool(name=f"tool{i}", inputSchema={}) for i in range(count)]
+
+    def test_from_config_with_batch(self):
+        """Test the batching mode is read from the configuration."""
+        config = OmegaConf.create({"model": "gpt-4", "batch": {"max_size": 5, "max_wait": 0.05}})
+
+        generator = LlmResponseGenerator.from_config(config)
+
+        assert generator.batch_size == 5
+        assert generator.batch_wait == 0.05
+
+    def test_invalid_batch_size(self):
+        """Test the batch size must be positive."""
+        with pytest.raises(ValueError, match="Invalid batch size"):
+            LlmResponseGenerator("gpt-4", batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_requests_are_batched(self):
+        """Test concurrent requests are sent as one batch and the responses fanned out."""
+        generator = LlmResponseGenerator("gpt-4", batch_size=10, batch_wait=0.01)
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion", return_value=llm_response('["zero", "one", "two"]')
+        ) as mock_completion:
+            results = await asyncio.gather(*[generator.generate("test_target", tool) for tool in self.tools(3)])
+
+        assert [result[0].text for result in results] == ["zero", "one", "two"]
+        mock_completion.assert_called_once()
+        messages = mock_completion.call_args[1]["messages"]
+        prompts = json.loads(messages[1]["content"])
+        assert len(prompts) == 3
+        assert "Tool Name: tool1" in prompts[1]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_immediately(self):
+        """Test a batch is sent as soon as batch_size requests are waiting."""
+        generator = LlmResponseGenerator("gpt-4", batch_size=2, batch_wait=60)
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion", return_value=llm_response('["a", "b"]')
+        ) as mock_completion:
+            results = await asyncio.wait_for(
+                asyncio.gather(*[generator.generate("test_target", tool) for tool in self.tools(4)]), timeout=1
+            )
+
+        assert [result[0].text for result in results] == ["a", "b", "a", "b"]
+        assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_single_request_uses_regular_prompt(self):
+        """Test a batch of one request is sent with the regular prompt."""
+        generator = LlmResponseGenerator("gpt-4", batch_size=10, batch_wait=0.001)
+
+        with patch("mcp_kit.generators.llm.acompletion", return_value=llm_response("alone")) as mock_completion:
+            result = await generator.generate("test_target", Tool(name="test_tool", inputSchema={}))
+
+        assert result[0].text == "alone"
+        assert mock_completion.call_args[1]["messages"][0] == generator.messages[0]
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_response_falls_back(self):
+        """Test the requests are generated one by one when the batched response is invalid."""
+        generator = LlmResponseGenerator("gpt-4", batch_size=2, batch_wait=0.01)
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion",
+            side_effect=[llm_response('["only one"]'), llm_response("first"), llm_response("second")],
+        ) as mock_completion:
+            results = await asyncio.gather(*[generator.generate("test_target", tool) for tool in self.tools(2)])
+
+        assert [result[0].text for result in results] == ["first", "second"]
+        assert mock_completion.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_error_is_raised_to_every_caller(self):
+        """Test an error of the batched LLM call is raised to all the callers of the batch."""
+        generator = LlmResponseGenerator("gpt-4", batch_size=3, batch_wait=0.01)
+
+        with patch("mcp_kit.generators.llm.acompletion", side_effect=RuntimeError("provider error")):
+            results = await asyncio.gather(
+                *[generator.generate("test_target", tool) for tool in self.tools(3)], return_exceptions=True
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def llm_stream(*chunks: str) -> AsyncMock:
+    """Create a mock streamed LLM response yielding the given chunks."""
+
+    async def stream():
+        for chunk in chunks:
+            streamed = MagicMock()
+            streamed.choices[0].delta.content = chunk
+            yield streamed
+
+    return AsyncMock(side_effect=lambda **kwargs: stream())
+
+
+class TestLlmResponseGeneratorStreaming:
+    """Test cases for the streaming mode of LlmResponseGenerator."""
+
+    def test_from_config_with_stream(self):
+        """Test the streaming mode is read from the configuration."""
+        generator = LlmResponseGenerator.from_config(OmegaConf.create({"model": "gpt-4", "stream": True}))
+
+        assert generator.stream
+
+    def test_stream_and_batch(self):
+        """Test streaming can't be combined with batching."""
+        with pytest.raises(ValueError, match="can't be combined"):
+            LlmResponseGenerator("gpt-4", stream=True, batch_size=2)
+
+    @pytest.mark.asyncio
+    async def test_generate_stream(self):
+        """Test generate_stream yields the non empty chunks of the completion."""
+        generator = LlmResponseGenerator("gpt-4")
+
+        with patch("mcp_kit.generators.llm.acompletion", llm_stream("Hel", "", "lo")) as mock_completion:
+            chunks = [chunk async for chunk in generator.generate_stream("test_target", Tool(name="t", inputSchema={}))]
+
+        assert chunks == ["Hel", "lo"]
+        assert mock_completion.call_args[1]["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_reported_as_progress(self):
+        """Test the chunks are reported as progress and the full text is returned."""
+        generator = LlmResponseGenerator("gpt-4", stream=True)
+        callback = AsyncMock()
+
+        with (
+            patch("mcp_kit.generators.llm.acompletion", llm_stream(" Hello", ", ", "world ")),
+            progress_reporting(callback),
+        ):
+            result = await generator.generate("test_target", Tool(name="t", inputSchema={}))
+
+        assert result[0].text == "Hello, world"
+        assert callback.await_args_list == [((1, " Hello"),), ((2, ", "),), ((3, "world "),)]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_get_progress(self):
+        """Test every caller sharing a streamed call gets its progress, even when another caller's callback fails."""
+        generator = LlmResponseGenerator("gpt-4", stream=True)
+        tool = Tool(name="t", inputSchema={})
+        failing = AsyncMock(side_effect=ConnectionError("client gone"))
+        callback = AsyncMock()
+
+        async def generate(progress_callback):
+            with progress_reporting(progress_callback):
+                return await generator.generate("test_target", tool)
+
+        with patch("mcp_kit.generators.llm.acompletion", llm_stream("Hel", "lo")) as mock_completion:
+            results = await asyncio.gather(generate(failing), generate(callback))
+
+        assert [result[0].text for result in results] == ["Hello", "Hello"]
+        assert mock_completion.call_count == 1
+        assert failing.await_count == 2
+        assert callback.await_args_list == [((1, "Hel"),), ((2, "lo"),)]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self):
+        """Test an empty streamed response raises an error."""
+        generator = LlmResponseGenerator("gpt-4", stream=True)
+
+        with patch("mcp_kit.generators.llm.acompletion", llm_stream()):
+            with pytest.raises(ValueError, match="empty"):
+                await generator.generate("test_target", Tool(name="t", inputSchema={}))
+
+    @pytest.mark.asyncio
+    async def test_stream_authentication_error(self):
+        """Test authentication errors are raised when streaming."""
+        generator = LlmResponseGenerator("gpt-4", stream=True)
+
+        with patch(
+            "mcp_kit.generators.llm.acompletion",
+            side_effect=AuthenticationError("Invalid API key", "openai", "gpt-4"),
+        ):
+            with pytest.raises(LlmAuthenticationError):
+                await generator.generate("test_target", Tool(name="t", inputSchema={}))
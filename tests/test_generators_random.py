@@ -1,5 +1,6 @@
 """Tests for random response generator."""
 
+import random
 import string
 
 import pytest
@@ -7,7 +8,7 @@ from mcp import Tool
 from mcp.types import TextContent
 from omegaconf import OmegaConf
 
-from mcp_kit.generators.random import RandomResponseGenerator
+from mcp_kit.generators.random import LengthDistribution, RandomResponseGenerator
 
 
 class TestRandomResponseGenerator:
@@ -176,3 +177,126 @@ class TestRandomResponseGenerator:
         assert elapsed_time < 1.0, (
             f"Random generation took too long: {elapsed_time:.2f}s"
         )
+
+
+class TestSeededRandomResponseGenerator:
+    """Test cases for the seeded streams and length distributions of RandomResponseGenerator."""
+
+    def test_from_config(self):
+        """Test the seed, length distribution and pool size are read from the configuration."""
+        config = OmegaConf.create(
+            {
+                "type": "random",
+                "seed": 42,
+                "length": {"distribution": "normal", "mean": 50, "stddev": 10, "min_length": 1},
+                "pool_size": 1024,
+            }
+        )
+
+        generator = RandomResponseGenerator.from_config(config)
+
+        assert generator.seed == 42
+        assert generator.length == LengthDistribution(distribution="normal", mean=50, stddev=10, min_length=1)
+        assert len(generator._pool) == 1024
+
+    def test_from_config_fixed_length(self):
+        """Test a number as length gives fixed length responses."""
+        generator = RandomResponseGenerator.from_config(OmegaConf.create({"length": 20}))
+
+        assert generator.length == LengthDistribution(mean=20)
+
+    @pytest.mark.asyncio
+    async def test_seed_is_deterministic_regardless_of_order(self):
+        """Test responses with the same seed don't depend on the order of the calls of different tools."""
+        tools = [Tool(name=f"tool{i}", inputSchema={}) for i in range(3)]
+        first = RandomResponseGenerator(seed=7)
+        second = RandomResponseGenerator(seed=7)
+
+        async def texts(generator, ordered_tools):
+            result = {}
+            for tool in ordered_tools:
+                result[tool.name] = [(await generator.generate("target", tool, {"a": 1}))[0].text for _ in range(2)]
+            return result
+
+        first_texts = await texts(first, tools)
+        second_texts = await texts(second, reversed(tools))
+
+        assert first_texts == second_texts
+        assert first_texts["tool0"][0] != first_texts["tool0"][1]
+
+    @pytest.mark.asyncio
+    async def test_arguments_have_their_own_stream(self):
+        """Test calls with other arguments don't change the stream of a call."""
+        tool = Tool(name="tool", inputSchema={})
+        first = RandomResponseGenerator(seed=7)
+        second = RandomResponseGenerator(seed=7)
+
+        await second.generate("target", tool, {"a": 2})
+
+        assert await first.generate("target", tool, {"a": 1, "b": 2}) == await second.generate(
+            "target", tool, {"b": 2, "a": 1}
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_bounded(self):
+        """Test only the streams of the most recently used calls are kept."""
+        tool = Tool(name="tool", inputSchema={})
+        generator = RandomResponseGenerator(seed=7, max_streams=2)
+
+        first = await generator.generate("target", tool, {"a": 1})
+        await generator.generate("target", tool, {"a": 2})
+        await generator.generate("target", tool, {"a": 3})
+
+        assert len(generator._calls) == 2
+        assert await generator.generate("target", tool, {"a": 1}) == first
+
+    def test_invalid_max_streams(self):
+        """Test a number of streams that isn't positive is rejected."""
+        with pytest.raises(ValueError, match="Invalid number of random streams"):
+            RandomResponseGenerator(max_streams=0)
+
+    @pytest.mark.asyncio
+    async def test_different_seeds(self):
+        """Test different seeds give different responses."""
+        tool = Tool(name="tool", inputSchema={})
+
+        assert await RandomResponseGenerator(seed=1).generate("target", tool) != await RandomResponseGenerator(
+            seed=2
+        ).generate("target", tool)
+
+    @pytest.mark.asyncio
+    async def test_response_longer_than_pool(self):
+        """Test responses longer than the pool wrap around it."""
+        generator = RandomResponseGenerator(seed=1, length=LengthDistribution(mean=50), pool_size=8)
+
+        text = (await generator.generate("target", Tool(name="tool", inputSchema={})))[0].text
+
+        assert len(text) == 50
+        assert set(text) <= set(generator._pool)
+
+    @pytest.mark.parametrize(
+        "distribution",
+        [
+            LengthDistribution(distribution="uniform", min_length=5, max_length=10),
+            LengthDistribution(distribution="normal", mean=20, stddev=30, min_length=1, max_length=40),
+            LengthDistribution(distribution="exponential", mean=10, max_length=60),
+        ],
+    )
+    def test_length_distributions(self, distribution):
+        """Test sampled lengths stay within the bounds."""
+        rng = random.Random(0)
+
+        lengths = [distribution.sample(rng) for _ in range(500)]
+
+        assert min(lengths) >= distribution.min_length
+        assert max(lengths) <= distribution.max_length
+        assert len(set(lengths)) > 1
+
+    def test_invalid_length_distributions(self):
+        """Test invalid length distributions are rejected."""
+        with pytest.raises(ValueError, match="Unknown length distribution"):
+            LengthDistribution(distribution="poisson")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="needs a max_length"):
+            LengthDistribution(distribution="uniform")
+        with pytest.raises(ValueError, match="Invalid length bounds"):
+            LengthDistribution(min_length=10, max_length=5)
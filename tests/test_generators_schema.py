@@ -0,0 +1,230 @@
+"""Tests for schema response generator."""
+
+import json
+import random
+from unittest.mock import patch
+
+import jsonschema
+import pytest
+from mcp import Tool
+from mcp.types import TextContent
+from omegaconf import OmegaConf
+
+from mcp_kit.factory import create_response_generator_from_config
+from mcp_kit.generators.schema import SchemaResponseGenerator, compile_schema
+
+ORDER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "format": "uuid"},
+        "status": {"enum": ["pending", "shipped", "delivered"]},
+        "total": {"type": "number", "minimum": 0, "maximum": 500},
+        "quantity": {"type": "integer", "minimum": 1, "exclusiveMaximum": 10},
+        "gift": {"type": "boolean"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "customer": {"$ref": "#/$defs/customer"},
+        "items": {
+            "type": "array",
+            "minItems": 1,
+            "maxItems": 3,
+            "items": {"type": "object", "properties": {"sku": {"type": "string", "minLength": 4, "maxLength": 8}}, "required": ["sku"]},
+        },
+        "note": {"type": ["string", "null"]},
+        "discount": {"oneOf": [{"type": "null"}, {"type": "integer", "minimum": 5, "maximum": 20}]},
+    },
+    "required": ["id", "status", "total", "quantity", "gift", "created_at", "customer", "items", "note", "discount"],
+    "$defs": {
+        "customer": {
+            "allOf": [
+                {"type": "object", "properties": {"email": {"type": "string", "format": "email"}}, "required": ["email"]},
+                {"properties": {"since": {"type": "string", "format": "date"}}, "required": ["since"]},
+            ]
+        }
+    },
+}
+
+
+class TestCompileSchema:
+    """Test cases for compile_schema."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_values_match_schema(self, seed):
+        """Test generated values are valid against the schema."""
+        value = compile_schema(ORDER_SCHEMA)(random.Random(seed))
+
+        jsonschema.validate(value, ORDER_SCHEMA, format_checker=jsonschema.FormatChecker())
+        assert value["customer"]["email"].endswith("@example.com")
+
+    def test_const_and_empty_schema(self):
+        """Test const values and empty schemas."""
+        rng = random.Random(0)
+        assert compile_schema({"const": 42})(rng) == 42
+        assert compile_schema({})(rng) is None
+
+    def test_recursive_ref(self):
+        """Test recursive schemas terminate."""
+        schema = {
+            "$ref": "#/$defs/node",
+            "$defs": {
+                "node": {
+                    "type": "object",
+                    "properties": {"children": {"type": "array", "items": {"$ref": "#/$defs/node"}}},
+                    "required": ["children"],
+                }
+            },
+        }
+
+        value = compile_schema(schema)(random.Random(0))
+
+        assert isinstance(value["children"], list)
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"type": "integer", "maximum": -5},
+            {"type": "integer", "minimum": 0.5, "maximum": 3.5},
+            {"type": "integer", "minimum": 2, "exclusiveMinimum": True, "maximum": 4, "exclusiveMaximum": True},
+            {"type": "integer", "exclusiveMinimum": 1.5, "exclusiveMaximum": 3},
+            {"type": "number", "minimum": 0.001, "maximum": 0.004},
+            {"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 0.001},
+            {"type": "number", "maximum": -2000},
+        ],
+    )
+    def test_numbers_within_bounds(self, schema):
+        """Test generated numbers are within inclusive, exclusive and OpenAPI 3.0 boolean exclusive bounds."""
+        generate = compile_schema(schema)
+        rng = random.Random(0)
+        boolean_bounds = isinstance(schema.get("exclusiveMinimum"), bool)
+        validator = (jsonschema.Draft4Validator if boolean_bounds else jsonschema.Draft202012Validator)(schema)
+
+        for _ in range(200):
+            validator.validate(generate(rng))
+
+    def test_integer_bounds_rounded_inwards(self):
+        """Test fractional bounds of integers are rounded inwards."""
+        generate = compile_schema({"type": "integer", "minimum": 0.5, "maximum": 2.5})
+        assert {generate(random.Random(seed)) for seed in range(50)} == {1, 2}
+
+        schema = {"type": "integer", "minimum": 2, "exclusiveMinimum": True, "maximum": 4, "exclusiveMaximum": True}
+        assert compile_schema(schema)(random.Random(0)) == 3
+
+    def test_empty_bounds(self):
+        """Test schemas without a value between their bounds are rejected."""
+        with pytest.raises(ValueError, match="No integer between the bounds"):
+            compile_schema({"type": "integer", "minimum": 0.2, "maximum": 0.8})
+        with pytest.raises(ValueError, match="No number between the bounds"):
+            compile_schema({"type": "number", "minimum": 1, "exclusiveMaximum": 1})
+
+    def test_required_without_property_schema(self):
+        """Test required properties missing from the properties are generated."""
+        schema = {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}},
+            "required": ["id", "name"],
+            "additionalProperties": {"type": "string"},
+        }
+
+        value = compile_schema(schema)(random.Random(0))
+
+        assert isinstance(value["name"], str)
+        jsonschema.validate(value, schema)
+        assert "extra" in compile_schema({"type": "object", "required": ["extra"]})(random.Random(0))
+
+    def test_unresolvable_ref(self):
+        """Test unresolvable and remote references are rejected."""
+        with pytest.raises(ValueError, match="Can't resolve"):
+            compile_schema({"$ref": "#/$defs/missing"})
+        with pytest.raises(ValueError, match="Only local"):
+            compile_schema({"$ref": "https://example.com/schema.json"})
+
+
+class TestSchemaResponseGenerator:
+    """Test cases for SchemaResponseGenerator."""
+
+    def test_from_config(self):
+        """Test SchemaResponseGenerator.from_config and resolution by the factory."""
+        config = OmegaConf.create(
+            {
+                "type": "schema",
+                "seed": 7,
+                "schemas": {"get_order": ORDER_SCHEMA},
+                "default_schema": {"type": "object", "properties": {"ok": {"const": True}}, "required": ["ok"]},
+            }
+        )
+
+        generator = create_response_generator_from_config(config)
+
+        assert isinstance(generator, SchemaResponseGenerator)
+        assert generator.schemas == {"get_order": ORDER_SCHEMA}
+        assert generator.default_schema["required"] == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_generate_from_configured_schema(self):
+        """Test responses are JSON matching the schema configured for the tool."""
+        generator = SchemaResponseGenerator(schemas={"get_order": ORDER_SCHEMA})
+
+        result = await generator.generate("target", Tool(name="get_order", inputSchema={}), {"id": "1"})
+
+        assert len(result) == 1
+        assert isinstance(result[0], TextContent)
+        jsonschema.validate(json.loads(result[0].text), ORDER_SCHEMA)
+
+    @pytest.mark.asyncio
+    async def test_generate_from_output_schema(self):
+        """Test the output schema declared by the tool is used when none is configured."""
+        generator = SchemaResponseGenerator()
+        tool = Tool(name="get_order", inputSchema={}, outputSchema={"type": "array", "items": {"type": "integer"}})
+
+        result = await generator.generate("target", tool)
+
+        values = json.loads(result[0].text)
+        assert isinstance(values, list)
+        assert all(isinstance(value, int) for value in values)
+
+    @pytest.mark.asyncio
+    async def test_generate_with_default_schema(self):
+        """Test tools without a schema get an empty object by default."""
+        generator = SchemaResponseGenerator()
+
+        result = await generator.generate("target", Tool(name="other", inputSchema={}))
+
+        assert json.loads(result[0].text) == {}
+
+    @pytest.mark.asyncio
+    async def test_seed(self):
+        """Test generators with the same seed generate the same responses."""
+        tool = Tool(name="get_order", inputSchema={})
+        first = SchemaResponseGenerator(schemas={"get_order": ORDER_SCHEMA}, seed=3)
+        second = SchemaResponseGenerator(schemas={"get_order": ORDER_SCHEMA}, seed=3)
+
+        assert [await first.generate("target", tool) for _ in range(3)] == [
+            await second.generate("target", tool) for _ in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_schema_is_compiled_once(self):
+        """Test each schema is compiled once and reused."""
+        generator = SchemaResponseGenerator(schemas={"get_order": ORDER_SCHEMA})
+        tool = Tool(name="get_order", inputSchema={})
+
+        with patch("mcp_kit.generators.schema.compile_schema", wraps=compile_schema) as mock_compile:
+            for _ in range(5):
+                await generator.generate("target", tool)
+
+        mock_compile.assert_called_once_with(ORDER_SCHEMA)
+
+    @pytest.mark.asyncio
+    async def test_tools_of_same_name_on_several_targets(self):
+        """Test tools of the same name on several targets keep their own compiled schema."""
+        generator = SchemaResponseGenerator()
+        first_schema = {"type": "object", "properties": {"a": {"const": 1}}, "required": ["a"]}
+        second_schema = {"type": "object", "properties": {"b": {"const": 2}}, "required": ["b"]}
+        first = Tool(name="get", inputSchema={}, outputSchema=first_schema)
+        second = Tool(name="get", inputSchema={}, outputSchema=second_schema)
+
+        with patch("mcp_kit.generators.schema.compile_schema", wraps=compile_schema) as mock_compile:
+            for _ in range(3):
+                assert json.loads((await generator.generate("first", first))[0].text) == {"a": 1}
+                assert json.loads((await generator.generate("second", second))[0].text) == {"b": 2}
+
+        assert mock_compile.call_count == 2
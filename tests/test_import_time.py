@@ -0,0 +1,83 @@
+"""Import time regression tests.
+
+Each test imports MCP Kit in a fresh interpreter, so the modules imported by
+other tests don't hide an eager import of a heavy dependency.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+HEAVY_MODULES = ["litellm", "openapi_mcp", "fastapi", "agents", "langchain_mcp_adapters"]
+
+
+def run_isolated(code: str) -> dict:
+    """Run code in a fresh interpreter and report its duration and the heavy modules it imported."""
+    script = textwrap.dedent(
+        f"""
+        import json, sys, time
+        start = time.perf_counter()
+        {textwrap.indent(textwrap.dedent(code), "        ").strip()}
+        elapsed = time.perf_counter() - start
+        print(json.dumps({{"elapsed": elapsed, "modules": sorted(set(sys.modules) & set({HEAVY_MODULES!r}))}}))
+        """
+    )
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """Test cases for the modules imported with MCP Kit."""
+
+    def test_import_package_imports_nothing_heavy(self):
+        """Test importing the package doesn't import the proxy or any dependency."""
+        result = run_isolated(
+            """
+            import mcp_kit
+            assert "mcp_kit.proxy" not in sys.modules
+            assert "mcp" not in sys.modules
+            """
+        )
+        assert result["modules"] == []
+
+    def test_proxy_with_light_config_imports_nothing_heavy(self, tmp_path):
+        """Test a proxy for an MCP target mocked with random responses doesn't import heavy dependencies."""
+        config = tmp_path / "config.yaml"
+        config.write_text(
+            textwrap.dedent(
+                """
+                target:
+                  type: mocked
+                  base_target:
+                    type: mcp
+                    name: server
+                    url: http://localhost:8080/mcp
+                  tool_response_generator:
+                    type: random
+                """
+            )
+        )
+
+        result = run_isolated(
+            f"""
+            from mcp_kit import ProxyMCP
+            ProxyMCP.from_config({str(config)!r})
+            """
+        )
+
+        print(f"Proxy import and creation took {result['elapsed']:.3f}s")
+        assert result["modules"] == []
+
+    @pytest.mark.parametrize(
+        ("code", "module"),
+        [
+            ("from mcp_kit.generators import LlmResponseGenerator", "litellm"),
+            ("from mcp_kit.targets import OasTarget", "openapi_mcp"),
+        ],
+    )
+    def test_heavy_dependencies_imported_on_use(self, code, module):
+        """Test heavy dependencies are still imported when the component using them is used."""
+        assert module in run_isolated(code)["modules"]
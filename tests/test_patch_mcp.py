@@ -4,9 +4,9 @@ from contextlib import AsyncExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from mcp import ClientSession
+from mcp import ClientSession, StdioServerParameters
 
-from mcp_kit.patch_mcp import http_streamable_session
+from mcp_kit.patch_mcp import http_streamable_session, sse_session, stdio_session
 
 
 class TestHttpStreamableSession:
@@ -52,7 +52,9 @@ class TestHttpStreamableSession:
             mock_streamable_client.assert_called_once_with(
                 url="http://test.com", headers={"Authorization": "Bearer token"}
             )
-            mock_client_session_class.assert_called_once_with(mock_read, mock_write)
+            mock_client_session_class.assert_called_once_with(
+                mock_read, mock_write, message_handler=None
+            )
             mock_session.initialize.assert_called_once()
 
     @pytest.mark.asyncio
@@ -159,3 +161,74 @@ class TestHttpStreamableSession:
 
             with pytest.raises(RuntimeError, match="Initialize failed"):
                 await http_streamable_session(url="http://test.com", headers=None)
+
+
+class TestSseAndStdioSessions:
+    """Test cases for sse_session and stdio_session functions."""
+
+    @pytest.mark.asyncio
+    async def test_sse_session_success(self):
+        """Test successful creation of SSE session."""
+        mock_read = MagicMock()
+        mock_write = MagicMock()
+        mock_session = MagicMock(spec=ClientSession)
+        mock_session.initialize = AsyncMock()
+        message_handler = AsyncMock()
+
+        with (
+            patch("mcp_kit.patch_mcp.sse_client") as mock_sse_client,
+            patch("mcp_kit.patch_mcp.ClientSession") as mock_client_session_class,
+        ):
+            mock_sse_client.return_value.__aenter__ = AsyncMock(
+                return_value=(mock_read, mock_write)
+            )
+            mock_sse_client.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_client_session_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_session
+            )
+            mock_client_session_class.return_value.__aexit__ = AsyncMock(
+                return_value=None
+            )
+
+            session, exit_stack = await sse_session(
+                url="http://test.com/sse", headers=None, message_handler=message_handler
+            )
+
+            assert session == mock_session
+            assert isinstance(exit_stack, AsyncExitStack)
+            mock_sse_client.assert_called_once_with(url="http://test.com/sse", headers=None)
+            mock_client_session_class.assert_called_once_with(
+                mock_read, mock_write, message_handler=message_handler
+            )
+            mock_session.initialize.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stdio_session_success(self):
+        """Test successful creation of stdio session."""
+        mock_read = MagicMock()
+        mock_write = MagicMock()
+        mock_session = MagicMock(spec=ClientSession)
+        mock_session.initialize = AsyncMock()
+        server_parameters = StdioServerParameters(command="server", args=["--flag"])
+
+        with (
+            patch("mcp_kit.patch_mcp.stdio_client") as mock_stdio_client,
+            patch("mcp_kit.patch_mcp.ClientSession") as mock_client_session_class,
+        ):
+            mock_stdio_client.return_value.__aenter__ = AsyncMock(
+                return_value=(mock_read, mock_write)
+            )
+            mock_stdio_client.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_client_session_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_session
+            )
+            mock_client_session_class.return_value.__aexit__ = AsyncMock(
+                return_value=None
+            )
+
+            session, exit_stack = await stdio_session(server_parameters)
+
+            assert session == mock_session
+            assert isinstance(exit_stack, AsyncExitStack)
+            mock_stdio_client.assert_called_once_with(server_parameters)
+            mock_session.initialize.assert_called_once()
@@ -0,0 +1,66 @@
+"""Tests for progress reporting helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_kit.progress import ProgressFanOut, is_progress_reported, progress_reporting, report_progress
+
+
+class TestProgressReporting:
+    """Test cases for progress reporting."""
+
+    @pytest.mark.asyncio
+    async def test_report_without_callback(self):
+        """Test reporting progress without a callback does nothing."""
+        assert not is_progress_reported()
+        await report_progress(1, "ignored")
+
+    @pytest.mark.asyncio
+    async def test_report_to_callback(self):
+        """Test progress is sent to the callback installed in the context, and only there."""
+        callback = AsyncMock()
+
+        with progress_reporting(callback):
+            assert is_progress_reported()
+            await report_progress(1, "first")
+            await report_progress(2)
+
+        await report_progress(3, "after")
+        assert callback.await_args_list == [((1, "first"),), ((2, None),)]
+
+    @pytest.mark.asyncio
+    async def test_callbacks_are_isolated_between_tasks(self):
+        """Test concurrent tool calls report progress to their own callback."""
+        callbacks = [AsyncMock(), AsyncMock()]
+
+        async def handle(index):
+            with progress_reporting(callbacks[index]):
+                await asyncio.sleep(0)
+                await report_progress(index)
+
+        await asyncio.gather(handle(0), handle(1))
+
+        callbacks[0].assert_awaited_once_with(0, None)
+        callbacks[1].assert_awaited_once_with(1, None)
+
+
+class TestProgressFanOut:
+    """Test cases for ProgressFanOut."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out(self):
+        """Test progress is sent to every callback, despite failing ones, until they are discarded."""
+        fan_out = ProgressFanOut()
+        failing = AsyncMock(side_effect=ConnectionError("client gone"))
+        callback = AsyncMock()
+        fan_out.add(failing)
+        fan_out.add(callback)
+
+        await fan_out(1, "first")
+        fan_out.discard(failing)
+        await fan_out(2)
+
+        failing.assert_awaited_once_with(1, "first")
+        assert callback.await_args_list == [((1, "first"),), ((2, None),)]
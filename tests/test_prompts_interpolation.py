@@ -4,7 +4,7 @@ import pytest
 from mcp.types import GetPromptResult, Prompt, PromptMessage, TextContent
 from omegaconf import OmegaConf
 
-from mcp_kit.prompts.interpolation import InterpolationPromptEngine, InterpolationPrompt
+from mcp_kit.prompts.interpolation import InterpolationPromptEngine, InterpolationPrompt, PromptTemplate
 
 
 class TestInterpolationPromptEngine:
@@ -501,3 +501,64 @@ class TestInterpolationPromptEngine:
 
         engine = InterpolationPromptEngine.from_config(config)
         assert len(engine.prompts) == 0
+
+    def test_from_config_invalid_text(self):
+        """Test from_config raises error when the text is not a valid template."""
+        config = OmegaConf.create({
+            "type": "interpolation",
+            "prompts": {
+                "unbalanced": {"text": "Hello {name"},
+            }
+        })
+        with pytest.raises(ValueError, match="Invalid text for prompt 'unbalanced'"):
+            InterpolationPromptEngine.from_config(config)
+
+    def test_prompt_is_compiled(self):
+        """Test prompts are compiled into a template with their required arguments."""
+        prompt = InterpolationPrompt(text="Hello {name}, welcome to {service}, {name}!", defaults={"service": "us"})
+
+        assert prompt.template.arguments == ("name", "service")
+        assert prompt.required_arguments == ("name",)
+        assert prompt.render({"name": "Ada"}) == "Hello Ada, welcome to us, Ada!"
+
+    @pytest.mark.asyncio
+    async def test_generate_format_specs(self):
+        """Test format specifications and conversions behave like str.format."""
+        text = "[{name:>6}] [{name!r}] [{name:^{width}}] {{literal}}"
+        engine = InterpolationPromptEngine({"aligned": InterpolationPrompt(text=text, defaults={"width": "7"})})
+
+        prompt = Prompt(name="aligned", description="Aligned")
+        result = await engine.generate("test", prompt, {"name": "Ada"})
+
+        assert result.messages[0].content.text == text.format(name="Ada", width="7")
+
+
+class TestPromptTemplate:
+    """Test cases for PromptTemplate."""
+
+    def test_segments(self):
+        """Test templates are parsed into literal and field segments."""
+        template = PromptTemplate("Hi {name}! {{escaped}} {count}")
+
+        assert [segment if isinstance(segment, str) else segment.name for segment in template.segments] == [
+            "Hi ", "name", "! {", "escaped}", " ", "count"
+        ]
+        assert template.arguments == ("name", "count")
+        assert template.render({"name": "Ada", "count": 3}) == "Hi Ada! {escaped} 3"
+
+    def test_render_defaults(self):
+        """Test arguments take precedence over defaults."""
+        template = PromptTemplate("{greeting} {name}")
+
+        assert template.render({"name": "Ada"}, {"greeting": "Hi", "name": "you"}) == "Hi Ada"
+
+    def test_render_missing_argument(self):
+        """Test rendering without an argument raises a KeyError."""
+        with pytest.raises(KeyError, match="name"):
+            PromptTemplate("Hi {name}").render({})
+
+    @pytest.mark.parametrize("text", ["{}", "{0}", "{name} {1}"])
+    def test_positional_fields_rejected(self, text):
+        """Test positional placeholders are rejected when parsing."""
+        with pytest.raises(ValueError, match="Positional placeholder"):
+            PromptTemplate(text)
@@ -9,6 +9,7 @@ import pytest
 import yaml
 from mcp import Tool
 from mcp.server import Server
+from mcp.shared.memory import create_connected_server_and_client_session
 from mcp.types import TextContent
 
 from mcp_kit.adapters import (
@@ -17,6 +18,7 @@ from mcp_kit.adapters import (
     OpenAIMCPServerAdapter,
 )
 from mcp_kit import ProxyMCP
+from mcp_kit.progress import report_progress
 from mcp_kit.targets.interfaces import Target
 
 
@@ -184,6 +186,31 @@ class TestProxyMCP:
         # Should still call close even if exception occurred
         mock_target.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_official_mcp_server_progress_notifications(self, proxy_mcp, mock_target):
+        """Test progress reported by the target is sent to the client as notifications."""
+        mock_target.list_tools.return_value = [Tool(name="test_tool", inputSchema={})]
+
+        async def call_tool(name, arguments):
+            await report_progress(1, "Hel")
+            await report_progress(2, "lo")
+            return [TextContent(type="text", text="Hello")]
+
+        mock_target.call_tool.side_effect = call_tool
+        progress = []
+
+        async def progress_callback(value, total, message=None):
+            progress.append((value, message))
+
+        async with proxy_mcp.official_mcp_server() as server:
+            async with create_connected_server_and_client_session(server) as client:
+                result = await client.call_tool("test_tool", {}, progress_callback=progress_callback)
+                without_progress = await client.call_tool("test_tool", {})
+
+        assert result.content[0].text == "Hello"
+        assert without_progress.content[0].text == "Hello"
+        assert progress == [(1, "Hel"), (2, "lo")]
+
     def test_langgraph_multi_server_mcp_client(self, proxy_mcp, mock_target):
         """Test langgraph_multi_server_mcp_client method."""
         client = proxy_mcp.langgraph_multi_server_mcp_client()
@@ -0,0 +1,82 @@
+"""Tests for token bucket rate limiting."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mcp_kit.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock advanced by the patched asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock():
+    """Patch time and sleep of the rate limit module with a fake clock."""
+    fake_clock = FakeClock()
+    with (
+        patch("mcp_kit.rate_limit.time.monotonic", fake_clock.monotonic),
+        patch("mcp_kit.rate_limit.asyncio.sleep", fake_clock.sleep),
+    ):
+        yield fake_clock
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_invalid(self):
+        """Test the rate and capacity must be positive."""
+        with pytest.raises(ValueError, match="Invalid token bucket"):
+            TokenBucket(rate=0, capacity=1)
+
+    def test_per_minute(self):
+        """Test per_minute allows a minute worth of tokens at once."""
+        bucket = TokenBucket.per_minute(120)
+
+        assert bucket.rate == 2
+        assert bucket.capacity == 120
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self, clock):
+        """Test acquiring waits once the bucket is empty."""
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        for _ in range(4):
+            await bucket.acquire()
+
+        assert clock.now == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_more_than_capacity(self, clock):
+        """Test amounts larger than the capacity wait for a full bucket and go negative."""
+        bucket = TokenBucket(rate=1, capacity=10)
+
+        await bucket.acquire(25)
+        assert clock.now == 0
+        assert bucket.tokens == -15
+
+        await bucket.acquire(1)
+        assert clock.now == pytest.approx(16.0)
+
+    @pytest.mark.asyncio
+    async def test_consume(self, clock):
+        """Test consume adjusts the balance without waiting and is capped by the capacity."""
+        bucket = TokenBucket(rate=1, capacity=10)
+
+        bucket.consume(4)
+        assert bucket.tokens == 6
+        bucket.consume(-10)
+        assert bucket.tokens == 10
+        assert clock.sleeps == []
@@ -0,0 +1,91 @@
+"""Tests for the append-only record log."""
+
+import json
+
+import pytest
+
+from mcp_kit.record_log import RecordLog, log_segments, read_records
+
+
+class TestRecordLog:
+    """Test cases for RecordLog and read_records."""
+
+    def test_append_and_read(self, tmp_path):
+        """Test records are appended as JSON lines and read back in order."""
+        path = tmp_path / "logs" / "calls.jsonl"
+        log = RecordLog(path)
+        log.append({"n": 1})
+        log.append({"n": 2, "text": "é"})
+        log.close()
+
+        assert path.read_text(encoding="utf-8").splitlines() == ['{"n":1}', '{"n":2,"text":"é"}']
+        assert list(read_records(path)) == [{"n": 1}, {"n": 2, "text": "é"}]
+
+    def test_append_to_existing_log(self, tmp_path):
+        """Test a new log appends to an existing log file."""
+        path = tmp_path / "calls.jsonl"
+        for n in range(2):
+            log = RecordLog(path)
+            log.append({"n": n})
+            log.close()
+
+        assert list(read_records(path)) == [{"n": 0}, {"n": 1}]
+
+    def test_rotation(self, tmp_path):
+        """Test the log file is rotated into numbered segments once full."""
+        path = tmp_path / "calls.jsonl"
+        log = RecordLog(path, max_bytes=20)
+        for n in range(5):
+            log.append({"n": n})
+        log.close()
+
+        assert [segment.name for segment in log_segments(path)] == [
+            "calls.000001.jsonl",
+            "calls.000002.jsonl",
+            "calls.jsonl",
+        ]
+        assert [record["n"] for record in read_records(path)] == [0, 1, 2, 3, 4]
+
+    def test_rotation_keeps_backup_count_segments(self, tmp_path):
+        """Test only the last backup_count rotated segments are kept."""
+        path = tmp_path / "calls.jsonl"
+        log = RecordLog(path, max_bytes=8, backup_count=2)
+        for n in range(5):
+            log.append({"n": n})
+        log.close()
+
+        assert [segment.name for segment in log_segments(path)] == [
+            "calls.000003.jsonl",
+            "calls.000004.jsonl",
+            "calls.jsonl",
+        ]
+        assert [record["n"] for record in read_records(path)] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_append_nowait(self, tmp_path):
+        """Test queued records are appended in order by the writer task, with rotation."""
+        path = tmp_path / "calls.jsonl"
+        log = RecordLog(path, max_bytes=20)
+        record = {"n": 0}
+        log.append_nowait(record)
+        record["n"] = -1
+        assert not path.exists()
+
+        await log.flush()
+        for n in range(1, 5):
+            log.append_nowait({"n": n})
+        await log.aclose()
+
+        assert len(log_segments(path)) == 3
+        assert [record["n"] for record in read_records(path)] == [0, 1, 2, 3, 4]
+
+    def test_read_skips_truncated_last_line(self, tmp_path):
+        """Test a partially written last record is ignored."""
+        path = tmp_path / "calls.jsonl"
+        path.write_text(json.dumps({"n": 1}) + '\n{"n": ', encoding="utf-8")
+
+        assert list(read_records(path)) == [{"n": 1}]
+
+    def test_read_missing_log(self, tmp_path):
+        """Test reading a log that doesn't exist yields no records."""
+        assert list(read_records(tmp_path / "missing.jsonl")) == []
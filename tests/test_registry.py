@@ -0,0 +1,106 @@
+"""Tests for the registries of configurable types."""
+
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+import pytest
+from omegaconf import OmegaConf
+
+from mcp_kit.factory import create_target_from_config, target_registry
+from mcp_kit.registry import Registry
+from mcp_kit.targets import McpTarget, Target
+from mcp_kit.targets.replay import ReplayTarget
+
+
+class PluginTarget(ReplayTarget):
+    """Target provided by a plugin."""
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with a built-in type."""
+    return Registry("target", "mcp_kit.test_targets", {"mcp": "mcp_kit.targets.mcp:McpTarget"})
+
+
+def plugin_entry_points(*entry_points: EntryPoint):
+    """Patch the entry points found by the registries."""
+    return patch("mcp_kit.registry.entry_points", side_effect=lambda group: list(entry_points))
+
+
+class TestRegistry:
+    """Test cases for Registry class."""
+
+    def test_resolve_builtin(self, registry):
+        """Test built-in types are imported on first use and cached."""
+        with patch("mcp_kit.registry.import_module", wraps=__import__("importlib").import_module) as import_module:
+            assert registry.resolve("mcp") is McpTarget
+            assert registry.resolve("mcp") is McpTarget
+
+        import_module.assert_called_once_with("mcp_kit.targets.mcp")
+
+    def test_resolve_unknown(self, registry):
+        """Test unknown types raise a ValueError listing the known types."""
+        with plugin_entry_points(), pytest.raises(ValueError, match="Unknown target type 'nope'. Known target types: mcp"):
+            registry.resolve("nope")
+
+    def test_resolve_missing_class(self, registry):
+        """Test a path to a class that doesn't exist raises a ValueError."""
+        registry.register("broken", "mcp_kit.targets.mcp:MissingTarget")
+
+        with pytest.raises(ValueError, match="Class 'MissingTarget' not found in module"):
+            registry.resolve("broken")
+
+    def test_resolve_missing_module(self, registry):
+        """Test a path to a module that doesn't exist raises a ValueError."""
+        with pytest.raises(ValueError, match="Unknown target type 'missing_package.targets:Target'. No module found"):
+            registry.resolve("missing_package.targets:Target")
+
+    def test_register(self, registry):
+        """Test types can be registered as classes or paths, replacing existing types."""
+        registry.register("plugin", PluginTarget)
+        registry.register("mcp", f"{__name__}:PluginTarget")
+
+        assert registry.resolve("plugin") is PluginTarget
+        assert registry.resolve("mcp") is PluginTarget
+
+    def test_resolve_path(self, registry):
+        """Test a "module:Class" path can be used as a type."""
+        assert registry.resolve(f"{__name__}:PluginTarget") is PluginTarget
+
+    def test_entry_points(self, registry):
+        """Test plugin types are loaded from entry points, without overriding other types."""
+        entry_points = [
+            EntryPoint("plugin", f"{__name__}:PluginTarget", "mcp_kit.test_targets"),
+            EntryPoint("mcp", f"{__name__}:PluginTarget", "mcp_kit.test_targets"),
+        ]
+        with plugin_entry_points(*entry_points) as found:
+            assert registry.resolve("plugin") is PluginTarget
+            assert registry.resolve("mcp") is McpTarget
+            assert registry.names() == ["mcp", "plugin"]
+
+        found.assert_called_once_with(group="mcp_kit.test_targets")
+
+
+class TestFactoryRegistry:
+    """Test cases for the factory registries."""
+
+    def test_builtin_target_types(self):
+        """Test all built-in target types resolve to targets."""
+        for name in ["balanced", "cached", "mcp", "mocked", "multiplex", "oas", "recording", "replay"]:
+            assert issubclass(target_registry.resolve(name), Target)
+
+    def test_create_plugin_target(self):
+        """Test targets of plugin types are created from config."""
+        entry_point = EntryPoint("test_plugin", f"{__name__}:PluginTarget", "mcp_kit.targets")
+        config = OmegaConf.create({"type": "test_plugin", "name": "plugin", "path": "calls.jsonl"})
+
+        with (
+            patch.object(target_registry, "_entry_points_loaded", False),
+            patch.dict(target_registry._paths),
+            patch.dict(target_registry._classes),
+            plugin_entry_points(entry_point),
+        ):
+            target = create_target_from_config(config)
+
+        assert isinstance(target, PluginTarget)
+        assert target.name == "plugin"
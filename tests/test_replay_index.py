@@ -0,0 +1,151 @@
+"""Tests for replay indexes matching calls to recorded responses."""
+
+import time
+
+import pytest
+
+from mcp_kit.replay_index import ExactIndex, MatchConfig, NearestIndex
+
+
+class TestMatchConfig:
+    """Test cases for MatchConfig."""
+
+    def test_create_index(self):
+        """Test each strategy creates the matching index."""
+        assert type(MatchConfig().create_index()) is ExactIndex
+        assert type(MatchConfig(strategy="ignore_paths", ignore_paths=["ts"]).create_index()) is ExactIndex
+        assert type(MatchConfig(strategy="nearest").create_index()) is NearestIndex
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"strategy": "fuzzy"},
+            {"strategy": "ignore_paths"},
+            {"strategy": "exact", "ignore_paths": ["ts"]},
+            {"strategy": "nearest", "min_similarity": 1.5},
+        ],
+    )
+    def test_invalid(self, kwargs):
+        """Test inconsistent configurations are rejected."""
+        with pytest.raises(ValueError):
+            MatchConfig(**kwargs)
+
+
+class TestExactIndex:
+    """Test cases for ExactIndex."""
+
+    def test_exact_match(self):
+        """Test only identical arguments match, whatever their order."""
+        index = ExactIndex()
+        index.add({"a": 1, "b": [1, 2]}, "first")
+        index.add(None, "empty")
+
+        assert index.get({"b": [1, 2], "a": 1}) == "first"
+        assert index.get({}) == "empty"
+        assert index.get({"a": 2, "b": [1, 2]}) is None
+        assert len(index) == 2
+
+    def test_repeated_calls_cycle(self):
+        """Test responses recorded for the same arguments are served in turn."""
+        index = ExactIndex()
+        index.add({"a": 1}, "first")
+        index.add({"a": 1}, "second")
+
+        assert [index.get({"a": 1}) for _ in range(3)] == ["first", "second", "first"]
+        assert len(index) == 1
+
+    def test_ignore_paths(self):
+        """Test ignored paths, including wildcards and nested paths, don't prevent matches."""
+        index = ExactIndex(["timestamp", "options.request_id", "items.*.id"])
+        index.add(
+            {"q": "x", "timestamp": 1, "options": {"request_id": "a", "limit": 5}, "items": [{"id": 1, "v": "a"}]},
+            "recorded",
+        )
+
+        call = {"q": "x", "timestamp": 2, "options": {"request_id": "b", "limit": 5}, "items": [{"id": 7, "v": "a"}]}
+        assert index.get(call) == "recorded"
+        assert index.get({**call, "options": {"request_id": "b", "limit": 6}}) is None
+        assert call["timestamp"] == 2  # arguments are not modified
+
+
+class TestNearestIndex:
+    """Test cases for NearestIndex."""
+
+    def test_exact_match_first(self):
+        """Test identical arguments are matched exactly."""
+        index = NearestIndex()
+        index.add({"q": "cats", "page": 1}, "cats 1")
+        index.add({"q": "cats", "page": 2}, "cats 2")
+
+        assert index.get({"q": "cats", "page": 2}) == "cats 2"
+
+    def test_nearest_match(self):
+        """Test calls are matched to the recorded arguments sharing the most distinctive values."""
+        index = NearestIndex()
+        index.add({"q": "cats", "lang": "en", "ts": 100}, "cats")
+        index.add({"q": "dogs", "lang": "en", "ts": 200}, "dogs")
+        index.add({"q": "birds", "lang": "fr", "ts": 300}, "birds")
+
+        assert index.get({"q": " Dogs ", "lang": "en", "ts": 999}) == "dogs"
+        assert index.get({"q": "fish", "lang": "fr"}) == "birds"
+        assert index.get({"q": "cats", "lang": "fr", "ts": 100}) == "cats"
+
+    def test_numbers_match_by_magnitude(self):
+        """Test numbers that differ are matched to numbers of the same order of magnitude."""
+        index = NearestIndex()
+        index.add({"limit": 5}, "small")
+        index.add({"limit": 5000}, "large")
+
+        assert index.get({"limit": 7000}) == "large"
+        assert index.get({"limit": 3}) == "small"
+
+    def test_min_similarity(self):
+        """Test calls not similar enough to any recorded call don't match."""
+        index = NearestIndex(min_similarity=0.3)
+        index.add({"q": "cats", "lang": "en"}, "cats")
+        index.add({"q": "dogs", "lang": "fr"}, "dogs")
+
+        assert index.get({"q": "cats", "lang": "de"}) == "cats"
+        assert index.get({"q": "fish", "lang": "de"}) is None
+
+    def test_empty_index(self):
+        """Test nothing matches when nothing was recorded."""
+        assert NearestIndex().get({"q": "cats"}) is None
+
+    def test_ignore_paths(self):
+        """Test ignored paths don't influence the nearest match."""
+        index = NearestIndex(["session"])
+        index.add({"q": "cats", "session": "s1"}, "cats")
+        index.add({"q": "dogs", "session": "s2"}, "dogs")
+
+        assert index.get({"q": "dogs", "session": "s1"}) == "dogs"
+
+    def test_lookup_is_fast_with_many_calls(self):
+        """Test lookups only visit the recorded calls sharing distinctive values."""
+        index = NearestIndex()
+        for n in range(20_000):
+            index.add({"user": f"user{n}", "kind": "profile", "ts": n}, n)
+
+        start = time.perf_counter()
+        for n in range(100):
+            assert index.get({"user": f"user{n}", "kind": "profile", "ts": -1}) == n
+        assert (time.perf_counter() - start) / 100 < 0.001
+
+    def test_no_shared_value(self):
+        """Test calls sharing no argument value with the recorded calls don't match."""
+        index = NearestIndex()
+        index.add({"q": "cats"}, "cats")
+
+        assert index.get({"q": "dogs"}) is None
+        assert index.get({}) is None
+
+    def test_lookup_is_fast_with_frequent_values(self):
+        """Test lookups of calls only sharing values with many recorded calls take a bounded time."""
+        index = NearestIndex()
+        for n in range(100_000):
+            index.add({"user": f"user{n}", "kind": "profile", "lang": "en" if n % 2 else "fr"}, n)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            assert index.get({"user": "unknown", "kind": "profile", "lang": "en"}) == 1
+        assert (time.perf_counter() - start) / 20 < 0.005
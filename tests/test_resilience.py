@@ -0,0 +1,123 @@
+"""Tests for reconnect and circuit breaker helpers."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mcp_kit.resilience import CircuitBreaker, CircuitOpenError, CircuitState, ReconnectConfig
+
+
+class TestReconnectConfig:
+    """Test cases for ReconnectConfig."""
+
+    def test_exponential_backoff(self):
+        """Test the backoff grows exponentially up to max_backoff."""
+        config = ReconnectConfig(initial_backoff=1.0, max_backoff=5.0, backoff_multiplier=2.0, jitter=False)
+
+        assert [config.backoff(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_backoff_with_jitter(self):
+        """Test the jittered backoff stays between zero and the exponential delay."""
+        config = ReconnectConfig(initial_backoff=1.0, max_backoff=5.0)
+
+        for attempt in range(5):
+            assert 0 <= config.backoff(attempt) <= min(5.0, 2.0**attempt)
+
+    def test_circuit_open_error_is_connection_error(self):
+        """Test CircuitOpenError can be handled as a connection error."""
+        assert issubclass(CircuitOpenError, ConnectionError)
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test the circuit opens after consecutive failures reach the threshold."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failures(self):
+        """Test a success resets the consecutive failure count."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_after_reset_timeout(self):
+        """Test the circuit lets a trial request through after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert not breaker.allow_request()
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=131.0):
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert breaker.allow_request()
+
+    @pytest.mark.parametrize("succeeds,expected", [(True, CircuitState.CLOSED), (False, CircuitState.OPEN)])
+    def test_half_open_trial(self, succeeds, expected):
+        """Test the trial request closes the circuit on success and re-opens it on failure."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0)
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=0.0):
+            if succeeds:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            breaker.reset_timeout = 30
+            assert breaker.state is expected
+
+    @pytest.mark.asyncio
+    async def test_half_open_single_trial(self):
+        """Test a half-open circuit lets a single trial request through until it completes."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        with patch("mcp_kit.resilience.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        trial_done = asyncio.Event()
+
+        async def request() -> bool:
+            if not breaker.allow_request():
+                return False
+            await trial_done.wait()
+            breaker.record_success()
+            return True
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=131.0):
+            requests = [asyncio.create_task(request()) for _ in range(10)]
+            await asyncio.sleep(0)
+            assert breaker.state is CircuitState.HALF_OPEN
+            assert not breaker.available
+            trial_done.set()
+            allowed = await asyncio.gather(*requests)
+
+        assert allowed.count(True) == 1
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_half_open_trial_given_up(self):
+        """Test another trial request is let through once the pending one took longer than the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        with patch("mcp_kit.resilience.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=131.0):
+            assert breaker.allow_request()
+            assert not breaker.allow_request()
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=161.0):
+            assert breaker.allow_request()
@@ -0,0 +1,232 @@
+"""Tests for the MCP client session pool."""
+
+import asyncio
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp import ClientSession, ErrorData, McpError
+
+from mcp_kit.session_pool import ClientSessionPool, SessionPoolConfig
+
+
+class FakeSessionFactory:
+    """Session factory that records opened and closed sessions."""
+
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+
+    async def __call__(self):
+        session = MagicMock(spec=ClientSession)
+        session.send_ping = AsyncMock()
+        exit_stack = AsyncExitStack()
+        exit_stack.callback(self.closed.append, session)
+        self.opened.append(session)
+        return session, exit_stack
+
+
+@pytest.fixture
+def factory():
+    """Create a fake session factory."""
+    return FakeSessionFactory()
+
+
+class TestSessionPoolConfig:
+    """Test cases for SessionPoolConfig."""
+
+    def test_defaults(self):
+        """Test the default pool holds a single session."""
+        config = SessionPoolConfig()
+        assert config.min_size == 1
+        assert config.max_size == 1
+        assert config.health_check_interval is None
+
+    @pytest.mark.parametrize("min_size,max_size", [(0, 1), (3, 2)])
+    def test_invalid_sizes(self, min_size, max_size):
+        """Test invalid pool sizes are rejected."""
+        with pytest.raises(ValueError, match="Invalid session pool sizes"):
+            SessionPoolConfig(min_size=min_size, max_size=max_size)
+
+
+class TestClientSessionPool:
+    """Test cases for ClientSessionPool."""
+
+    @pytest.mark.asyncio
+    async def test_start_opens_min_size_sessions(self, factory):
+        """Test start opens min_size sessions."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=3, max_size=5))
+        await pool.start()
+
+        assert pool.size == 3
+        assert len(factory.opened) == 3
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_selects_least_in_flight(self, factory):
+        """Test acquire prefers idle sessions over busy ones."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=2, max_size=2))
+        await pool.start()
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                assert first is not second
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_grows_lazily_up_to_max_size(self, factory):
+        """Test the pool only grows when all sessions are busy, and never past max_size."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=1, max_size=2))
+        await pool.start()
+
+        async with pool.acquire():
+            pass
+        assert pool.size == 1
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                await asyncio.sleep(0.01)
+                async with pool.acquire() as third:
+                    async with pool.acquire():
+                        await asyncio.sleep(0.01)
+                        assert pool.size == 2
+                        assert len(factory.opened) == 2
+                        assert second is first
+                        assert third is not first
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_grows_in_the_background(self):
+        """Test a request doesn't wait for a new session when every session is busy."""
+        release = asyncio.Event()
+        inner = FakeSessionFactory()
+
+        async def slow_factory():
+            if inner.opened:
+                await release.wait()
+            return await inner()
+
+        pool = ClientSessionPool(slow_factory, SessionPoolConfig(min_size=1, max_size=2))
+        await pool.start()
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                assert second is first
+                assert pool.size == 1
+
+            release.set()
+            await asyncio.sleep(0.01)
+            assert pool.size == 2
+            async with pool.acquire() as third:
+                assert third is inner.opened[1]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_background_growth_failure_reuses_busy_session(self, factory):
+        """Test a failure to grow the pool is logged and requests keep using the busy session."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=1, max_size=2))
+        await pool.start()
+        pool._session_factory = AsyncMock(side_effect=ConnectionError("Failed to connect"))
+
+        async with pool.acquire() as first:
+            async with pool.acquire() as second:
+                await asyncio.sleep(0.01)
+                assert second is first
+                assert pool.size == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_error_drops_session(self, factory):
+        """Test a non-MCP error drops the session and a new one is opened on demand."""
+        pool = ClientSessionPool(factory, SessionPoolConfig())
+        await pool.start()
+
+        with pytest.raises(ConnectionError):
+            async with pool.acquire():
+                raise ConnectionError("Connection lost")
+        await asyncio.sleep(0)
+
+        assert pool.size == 0
+        assert factory.closed == factory.opened[:1]
+
+        async with pool.acquire() as session:
+            assert session is factory.opened[1]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_mcp_error_keeps_session(self, factory):
+        """Test an error reported by the server keeps the session in the pool."""
+        pool = ClientSessionPool(factory, SessionPoolConfig())
+        await pool.start()
+
+        with pytest.raises(McpError):
+            async with pool.acquire():
+                raise McpError(ErrorData(code=400, message="Bad request"))
+
+        assert pool.size == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_check_health_replaces_failing_sessions(self, factory):
+        """Test sessions that fail the ping are dropped and replaced up to min_size."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=2, max_size=2))
+        await pool.start()
+        factory.opened[0].send_ping.side_effect = ConnectionError("Connection lost")
+
+        await pool.check_health()
+        await asyncio.sleep(0)
+
+        assert pool.size == 2
+        assert factory.closed == factory.opened[:1]
+        assert len(factory.opened) == 3
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_check_health_pings_busy_sessions(self, factory):
+        """Test a dead session is dropped even while a request is using it."""
+        pool = ClientSessionPool(factory, SessionPoolConfig())
+        await pool.start()
+        factory.opened[0].send_ping.side_effect = ConnectionError("Connection lost")
+
+        async with pool.acquire():
+            await pool.check_health()
+            await asyncio.sleep(0)
+
+            assert factory.closed == factory.opened[:1]
+            assert pool.size == 1
+            assert len(factory.opened) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_loop(self, factory):
+        """Test the periodic health check pings the sessions."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(health_check_interval=0.01))
+        await pool.start()
+
+        await asyncio.sleep(0.05)
+
+        assert factory.opened[0].send_ping.await_count >= 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_start_failure_raises(self):
+        """Test start raises when sessions can't be opened."""
+        factory = AsyncMock(side_effect=ConnectionError("Failed to connect"))
+        pool = ClientSessionPool(factory, SessionPoolConfig())
+
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            await pool.start()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_sessions(self, factory):
+        """Test close closes every session and rejects new requests."""
+        pool = ClientSessionPool(factory, SessionPoolConfig(min_size=2, max_size=2))
+        await pool.start()
+
+        await pool.close()
+
+        assert pool.size == 0
+        assert set(map(id, factory.closed)) == set(map(id, factory.opened))
+        with pytest.raises(ValueError, match="Session pool is closed"):
+            async with pool.acquire():
+                pass
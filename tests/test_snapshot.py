@@ -0,0 +1,206 @@
+"""Tests for compiled config snapshots."""
+
+import pytest
+import yaml
+from omegaconf import OmegaConf
+
+from mcp_kit import ProxyMCP
+from mcp_kit.cli import main
+from mcp_kit.factory import create_tools_from_config
+from mcp_kit.snapshot import (
+    SNAPSHOT_MAGIC,
+    compile_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
+from mcp_kit.targets import McpTarget, MockedTarget, MultiplexTarget
+
+
+def tool_config(index: int) -> dict:
+    """Create the config of a tool."""
+    return {
+        "name": f"tool_{index}",
+        "description": f"Tool number {index}",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"query": {"type": "string", "default": None}},
+            "required": ["query"],
+        },
+        "annotations": {"readOnlyHint": True},
+    }
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Write a config with catalogs in nested targets."""
+    monkeypatch.setenv("SNAPSHOT_TEST_TOKEN", "secret")
+    config = {
+        "target": {
+            "type": "multiplex",
+            "name": "combined",
+            "targets": [
+                {
+                    "type": "mocked",
+                    "base_target": {
+                        "type": "mcp",
+                        "name": "first",
+                        "headers": {"Authorization": "${oc.env:SNAPSHOT_TEST_TOKEN}"},
+                        "tools": [tool_config(i) for i in range(3)],
+                        "prompts": [
+                            {"name": "greet", "arguments": [{"name": "who", "required": True}]},
+                        ],
+                    },
+                    "tool_response_generator": {"type": "random"},
+                },
+                {
+                    "type": "mcp",
+                    "name": "second",
+                    "tools": [tool_config(3)],
+                },
+            ],
+        },
+    }
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return path
+
+
+class TestSnapshot:
+    """Test cases for compiling and loading snapshots."""
+
+    def test_compile_prebuilds_catalogs(self, config_file):
+        """Test the catalogs of MCP targets are prebuilt and removed from the config."""
+        snapshot = compile_snapshot(config_file)
+
+        assert len(snapshot.catalogs) == 2
+        assert snapshot.tool_count == 4
+        assert snapshot.prompt_count == 1
+        first = snapshot.config["target"]["targets"][0]["base_target"]
+        assert "tools" not in first
+        assert "prompts" not in first
+        assert first["_snapshot_catalog"] == 0
+        # Interpolations are resolved when the snapshot is loaded
+        assert first["headers"]["Authorization"] == "${oc.env:SNAPSHOT_TEST_TOKEN}"
+
+    def test_from_snapshot_matches_from_config(self, config_file, tmp_path):
+        """Test a proxy loaded from a snapshot has the same targets as one loaded from the config."""
+        snapshot_file = tmp_path / "config.snapshot"
+        compile_snapshot(config_file, snapshot_file)
+
+        expected = ProxyMCP.from_config(config_file).target
+        target = ProxyMCP.from_snapshot(snapshot_file).target
+
+        assert isinstance(target, MultiplexTarget)
+        assert list(target._targets_dict) == list(expected._targets_dict)
+        mocked = target._targets_dict["first_mocked"]
+        assert isinstance(mocked, MockedTarget)
+        assert isinstance(mocked.target, McpTarget)
+        assert mocked.target.tools == expected._targets_dict["first_mocked"].target.tools
+        assert mocked.target.prompts == expected._targets_dict["first_mocked"].target.prompts
+        assert mocked.target.headers == {"Authorization": "secret"}
+        assert target._targets_dict["second"].tools == expected._targets_dict["second"].tools
+
+    def test_snapshot_is_compact(self, tmp_path):
+        """Test large catalogs are compressed."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            yaml.dump({"target": {"type": "mcp", "name": "big", "tools": [tool_config(i) for i in range(1000)]}})
+        )
+        snapshot_file = tmp_path / "config.snapshot"
+
+        compile_snapshot(config_file, snapshot_file)
+
+        assert snapshot_file.stat().st_size < config_file.stat().st_size / 5
+        assert read_snapshot(snapshot_file).tool_count == 1000
+
+    def test_compile_without_side_effects(self, tmp_path):
+        """Test compiling a config doesn't create the caches and logs it declares."""
+        config_file = tmp_path / "config.yaml"
+        base_target = {"type": "mcp", "name": "server", "tools": [tool_config(0)]}
+        generator = {"type": "llm", "model": "openai/gpt-4.1-nano", "cache": {"path": str(tmp_path / "llm.sqlite")}}
+        recording = {
+            "type": "recording",
+            "path": str(tmp_path / "recordings" / "server.jsonl"),
+            "base_target": base_target,
+        }
+        config_file.write_text(
+            yaml.dump({"target": {"type": "mocked", "base_target": recording, "tool_response_generator": generator}})
+        )
+
+        compile_snapshot(config_file, tmp_path / "config.snapshot")
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["config.snapshot", "config.yaml"]
+
+    def test_compile_invalid_config(self, tmp_path):
+        """Test compiling an invalid config raises a ValueError."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"target": {"type": "nope", "name": "broken"}}))
+
+        with pytest.raises(ValueError, match="Unknown target type 'nope'"):
+            compile_snapshot(config_file)
+
+    def test_compile_config_without_target(self, tmp_path):
+        """Test compiling a config without target raises a ValueError."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"targets": []}))
+
+        with pytest.raises(ValueError, match="must define a 'target'"):
+            compile_snapshot(config_file)
+
+    def test_read_not_a_snapshot(self, config_file):
+        """Test reading a file that isn't a snapshot raises a ValueError."""
+        with pytest.raises(ValueError, match="is not an MCP Kit snapshot"):
+            read_snapshot(config_file)
+
+    def test_read_corrupted_snapshot(self, tmp_path):
+        """Test reading a corrupted snapshot raises a ValueError."""
+        snapshot_file = tmp_path / "config.snapshot"
+        snapshot_file.write_bytes(SNAPSHOT_MAGIC + b"garbage")
+
+        with pytest.raises(ValueError, match="Invalid snapshot"):
+            read_snapshot(snapshot_file)
+
+    def test_read_other_format(self, config_file, tmp_path):
+        """Test reading a snapshot of another format asks to compile again."""
+        snapshot = compile_snapshot(config_file)
+        snapshot.format = 0
+        snapshot_file = tmp_path / "config.snapshot"
+        write_snapshot(snapshot, snapshot_file)
+
+        with pytest.raises(ValueError, match="compile the config again"):
+            read_snapshot(snapshot_file)
+
+    def test_catalog_reference_outside_snapshot(self):
+        """Test a catalog reference can't be used without loading its snapshot."""
+        config = OmegaConf.create({"type": "mcp", "name": "server", "_snapshot_catalog": 0})
+
+        with pytest.raises(ValueError, match="load the config with from_snapshot"):
+            create_tools_from_config(config)
+
+
+class TestCli:
+    """Test cases for the command line interface."""
+
+    def test_compile(self, config_file, capsys):
+        """Test the compile command writes the snapshot next to the config by default."""
+        assert main(["compile", str(config_file)]) == 0
+
+        snapshot_file = config_file.with_suffix(".snapshot")
+        assert read_snapshot(snapshot_file).tool_count == 4
+        assert "2 catalogs, 4 tools, 1 prompts" in capsys.readouterr().out
+
+    def test_compile_output(self, config_file, tmp_path):
+        """Test the compile command writes the snapshot to the given output."""
+        snapshot_file = tmp_path / "out" / "proxy.snapshot"
+        snapshot_file.parent.mkdir()
+
+        assert main(["compile", str(config_file), "-o", str(snapshot_file)]) == 0
+        assert snapshot_file.exists()
+
+    def test_compile_invalid_config(self, tmp_path, capsys):
+        """Test the compile command reports invalid configs."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"target": {"type": "nope", "name": "broken"}}))
+
+        assert main(["compile", str(config_file)]) == 1
+        assert "mcp-kit compile: error: Unknown target type 'nope'" in capsys.readouterr().err
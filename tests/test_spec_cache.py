@@ -0,0 +1,167 @@
+"""Tests for the cache of OpenAPI specifications."""
+
+import hashlib
+import json
+import time
+from functools import partial
+from unittest.mock import patch
+
+import httpx
+import pytest
+from mcp import Tool
+
+from mcp_kit.spec_cache import SpecCache
+
+SPEC_URL = "http://example.com/openapi.json"
+SPEC = json.dumps({"openapi": "3.0.0", "paths": {}}).encode()
+
+
+class SpecServer:
+    """Fake server of a specification, supporting conditional requests."""
+
+    def __init__(self, content: bytes = SPEC) -> None:
+        self.content = content
+        self.requests: list[httpx.Request] = []
+        self.error: Exception | None = None
+        self.not_modified_headers = True
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        etag = f'"{hashlib.sha256(self.content).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag} if self.not_modified_headers else {})
+        return httpx.Response(
+            200, content=self.content, headers={"ETag": etag, "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+
+
+@pytest.fixture
+def server():
+    """Serve the specification through a mock transport."""
+    server = SpecServer()
+    client = partial(httpx.AsyncClient, transport=httpx.MockTransport(server.handle))
+    with patch("mcp_kit.spec_cache.httpx.AsyncClient", client):
+        yield server
+
+
+class TestSpecCache:
+    """Test cases for SpecCache class."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_stores_spec_by_digest(self, server, tmp_path):
+        """Test a downloaded specification is stored by the digest of its content."""
+        cache = SpecCache(tmp_path)
+
+        spec = await cache.fetch(SPEC_URL)
+
+        assert spec.content == SPEC
+        assert spec.digest == hashlib.sha256(SPEC).hexdigest()
+        assert (tmp_path / "specs" / spec.digest).read_bytes() == SPEC
+
+    @pytest.mark.asyncio
+    async def test_fetch_revalidates(self, server, tmp_path):
+        """Test a cached specification is revalidated with its ETag and Last-Modified date."""
+        cache = SpecCache(tmp_path)
+        await cache.fetch(SPEC_URL)
+
+        spec = await SpecCache(tmp_path).fetch(SPEC_URL)
+
+        assert spec.content == SPEC
+        assert len(server.requests) == 2
+        assert "If-None-Match" not in server.requests[0].headers
+        assert server.requests[1].headers["If-None-Match"] == f'"{hashlib.sha256(SPEC).hexdigest()[:16]}"'
+        assert server.requests[1].headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_not_modified_without_validators(self, server, tmp_path):
+        """Test the validators are kept when a 304 response doesn't repeat them."""
+        server.not_modified_headers = False
+        cache = SpecCache(tmp_path)
+        await cache.fetch(SPEC_URL)
+        await cache.fetch(SPEC_URL)
+
+        await cache.fetch(SPEC_URL)
+
+        etag = f'"{hashlib.sha256(SPEC).hexdigest()[:16]}"'
+        assert [request.headers.get("If-None-Match") for request in server.requests] == [None, etag, etag]
+        assert server.requests[2].headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_fetch_changed_spec(self, server, tmp_path):
+        """Test a changed specification is downloaded again."""
+        cache = SpecCache(tmp_path)
+        first = await cache.fetch(SPEC_URL)
+        server.content = json.dumps({"openapi": "3.1.0", "paths": {}}).encode()
+
+        second = await cache.fetch(SPEC_URL)
+
+        assert second.content == server.content
+        assert second.digest != first.digest
+
+    @pytest.mark.asyncio
+    async def test_fetch_within_max_age(self, server, tmp_path):
+        """Test a specification downloaded less than max_age ago is not revalidated."""
+        cache = SpecCache(tmp_path, max_age=60)
+        await cache.fetch(SPEC_URL)
+
+        await cache.fetch(SPEC_URL)
+        assert len(server.requests) == 1
+
+        with patch("mcp_kit.spec_cache.time.time", return_value=time.time() + 61):
+            await cache.fetch(SPEC_URL)
+        assert len(server.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_unreachable_uses_cached_copy(self, server, tmp_path):
+        """Test the cached specification is used when the server can't be reached."""
+        cache = SpecCache(tmp_path)
+        await cache.fetch(SPEC_URL)
+        server.error = httpx.ConnectError("Connection refused")
+
+        spec = await cache.fetch(SPEC_URL)
+
+        assert spec.content == SPEC
+
+    @pytest.mark.asyncio
+    async def test_fetch_unreachable_without_cached_copy(self, server, tmp_path):
+        """Test fetching an uncached specification from an unreachable server raises a ValueError."""
+        server.error = httpx.ConnectError("Connection refused")
+
+        with pytest.raises(ValueError, match="Failed to fetch OpenAPI spec"):
+            await SpecCache(tmp_path).fetch(SPEC_URL)
+
+    @pytest.mark.asyncio
+    async def test_fetch_corrupted_spec_downloaded_again(self, server, tmp_path):
+        """Test a cached specification that was corrupted is downloaded again, without validators."""
+        cache = SpecCache(tmp_path)
+        spec = await cache.fetch(SPEC_URL)
+        (tmp_path / "specs" / spec.digest).write_bytes(b"corrupted")
+
+        assert (await cache.fetch(SPEC_URL)).content == SPEC
+        assert "If-None-Match" not in server.requests[1].headers
+
+    def test_catalog(self, tmp_path):
+        """Test tool catalogs are stored by specification digest."""
+        cache = SpecCache(tmp_path)
+        tools = [Tool(name="get_pets", description="List pets", inputSchema={"type": "object"})]
+
+        assert cache.load_catalog("digest") is None
+        cache.save_catalog("digest", tools)
+
+        assert SpecCache(tmp_path).load_catalog("digest") == tools
+        assert SpecCache(tmp_path).load_catalog("other") is None
+
+    def test_invalid_catalog_ignored(self, tmp_path):
+        """Test an invalid cached catalog is ignored."""
+        cache = SpecCache(tmp_path)
+        cache.save_catalog("digest", [])
+        next((tmp_path / "catalogs").iterdir()).write_text("[{}]")
+
+        assert cache.load_catalog("digest") is None
+
+    def test_negative_max_age(self, tmp_path):
+        """Test a negative max_age is rejected."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            SpecCache(tmp_path, max_age=-1)
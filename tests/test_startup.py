@@ -0,0 +1,244 @@
+"""Tests for the startup orchestration of target trees."""
+
+import asyncio
+import logging
+import sys
+import textwrap
+from typing import Any
+
+import pytest
+from mcp.types import Content, GetPromptResult, Prompt, TextContent, Tool
+
+from mcp_kit import ProxyMCP
+from mcp_kit.generators import RandomResponseGenerator
+from mcp_kit.startup import StartupConfig, StartupTimeoutError, start_target
+from mcp_kit.targets import BalancedTarget, McpTarget, MockedTarget, MultiplexTarget, Target
+from mcp_kit.targets.mocked import MockConfig
+
+
+class SlowTarget(Target):
+    """Target taking some time to initialize."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception | None = None) -> None:
+        self._name = name
+        self.delay = delay
+        self.error = error
+        self.initialize_count = 0
+        self.initialize_tasks: list[asyncio.Task[Any] | None] = []
+        self.list_tools_count = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @classmethod
+    def from_config(cls, config):
+        raise NotImplementedError
+
+    async def initialize(self) -> None:
+        self.initialize_count += 1
+        self.initialize_tasks.append(asyncio.current_task())
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+    async def list_tools(self) -> list[Tool]:
+        self.list_tools_count += 1
+        return [Tool(name=f"{self._name}_tool", inputSchema={"type": "object"})]
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> list[Content]:
+        return [TextContent(type="text", text=name)]
+
+    async def list_prompts(self) -> list[Prompt]:
+        return []
+
+    async def get_prompt(self, name: str, arguments: dict[str, str] | None = None) -> GetPromptResult:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class CatalogTarget(SlowTarget):
+    """Target keeping its tool catalog once listed."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._tools: list[Tool] | None = None
+
+    async def list_tools(self) -> list[Tool]:
+        if self._tools is None:
+            self._tools = await super().list_tools()
+        return self._tools
+
+    async def warm_catalog(self) -> list[Tool] | None:
+        return await self.list_tools()
+
+
+def nested_tree(first: SlowTarget, second: SlowTarget) -> MockedTarget:
+    """Create a mocked target of a multiplex target of a mocked target and a target."""
+    inner = MockedTarget(first, MockConfig())
+    return MockedTarget(MultiplexTarget("combined", inner, second), MockConfig())
+
+
+class TestStartTarget:
+    """Test cases for start_target."""
+
+    @pytest.mark.asyncio
+    async def test_initializes_each_target_once(self):
+        """Test every target of a nested tree is initialized exactly once."""
+        first, second = SlowTarget("first"), SlowTarget("second")
+
+        report = await start_target(nested_tree(first, second))
+
+        assert first.initialize_count == 1
+        assert second.initialize_count == 1
+        assert [(depth, node.name) for depth, node in report.root.walk()] == [
+            (0, "combined_mocked"),
+            (1, "combined"),
+            (2, "first_mocked"),
+            (3, "first"),
+            (2, "second"),
+        ]
+        assert all(node.elapsed is not None and node.error is None for _, node in report.root.walk())
+
+    @pytest.mark.asyncio
+    async def test_initializes_in_caller_task(self):
+        """Test a chain of wrapped targets is initialized in the task of the caller."""
+        leaf = SlowTarget("leaf")
+
+        await start_target(MockedTarget(MockedTarget(leaf, MockConfig()), MockConfig()), StartupConfig(timeout=1))
+
+        assert leaf.initialize_tasks == [asyncio.current_task()]
+
+    @pytest.mark.asyncio
+    async def test_shared_target_initialized_once(self):
+        """Test a target shared by several wrappers is initialized once."""
+        shared = SlowTarget("shared", delay=0.01)
+
+        await start_target(MultiplexTarget("combined", MockedTarget(shared, MockConfig()), shared))
+
+        assert shared.initialize_count == 1
+
+    @pytest.mark.asyncio
+    async def test_leaves_start_concurrently(self):
+        """Test the targets of a tree start at the same time."""
+        targets = [SlowTarget(f"target_{i}", delay=0.1) for i in range(5)]
+        tree = MockedTarget(
+            MultiplexTarget("combined", MockedTarget(targets[0], MockConfig()), *targets[1:]), MockConfig()
+        )
+
+        report = await start_target(tree)
+
+        assert report.elapsed < 0.3
+        assert report.root.own is not None and report.root.own < 0.05
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test a target not initializing in time fails the targets depending on it."""
+        slow, fast = SlowTarget("slow", delay=1), SlowTarget("fast")
+
+        with pytest.raises(StartupTimeoutError, match="Target 'slow' did not initialize within 0.05s"):
+            await start_target(nested_tree(slow, fast), StartupConfig(timeout=0.05))
+
+    @pytest.mark.asyncio
+    async def test_failed_replica_reported(self):
+        """Test failures tolerated by a wrapper are reported without failing the startup."""
+        broken = SlowTarget("replica", error=RuntimeError("Connection refused"))
+        healthy = SlowTarget("replica")
+
+        report = await start_target(BalancedTarget("balanced", broken, healthy))
+
+        replicas = report.root.sub_targets
+        assert isinstance(replicas[0].error, RuntimeError)
+        assert replicas[1].error is None
+        assert "failed after" in report.format()
+
+    @pytest.mark.asyncio
+    async def test_failure_raised(self, caplog):
+        """Test the error of the root target is raised, with the report logged."""
+        broken = SlowTarget("broken", error=RuntimeError("Connection refused"))
+
+        with caplog.at_level(logging.WARNING), pytest.raises(RuntimeError, match="Connection refused"):
+            await start_target(MockedTarget(broken, MockConfig()))
+
+        assert "broken (SlowTarget): failed after" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_warm_catalogs(self):
+        """Test the catalogs of the leaf targets keeping them are warmed before their wrappers list them."""
+        first, second = CatalogTarget("first"), SlowTarget("second")
+        inner = MockedTarget(first, MockConfig(tool_response_generator=RandomResponseGenerator()))
+
+        report = await start_target(MultiplexTarget("combined", inner, second), StartupConfig(warm_catalogs=True))
+
+        assert first.list_tools_count == 1
+        assert second.list_tools_count == 0
+        leaves = [node for _, node in report.root.walk() if not node.sub_targets]
+        assert [(node.name, node.tool_count) for node in leaves] == [("first", 1), ("second", None)]
+        assert "first (CatalogTarget): ready in" in report.format()
+        assert "1 tools warmed in" in report.format()
+
+    def test_invalid_timeout(self):
+        """Test a timeout that isn't positive is rejected."""
+        with pytest.raises(ValueError, match="Startup timeout must be positive"):
+            StartupConfig(timeout=0)
+
+
+class TestProxyStartup:
+    """Test cases for the startup of the proxy targets."""
+
+    @pytest.mark.asyncio
+    async def test_adapter_starts_target_tree(self):
+        """Test opening an adapter starts the tree and keeps the report."""
+        first, second = SlowTarget("first"), SlowTarget("second")
+        proxy = ProxyMCP(nested_tree(first, second), StartupConfig(warm_catalogs=True))
+
+        async with proxy.client_session_adapter():
+            assert first.initialize_count == 1
+            assert proxy.startup_report is not None
+            assert proxy.startup_report.root.name == "combined_mocked"
+
+    @pytest.mark.asyncio
+    async def test_stdio_target_opened_and_closed(self, tmp_path):
+        """Test stdio servers started through the proxy are closed without errors."""
+        server_script = tmp_path / "server.py"
+        server_script.write_text(
+            textwrap.dedent(
+                """
+                from mcp.server.fastmcp import FastMCP
+
+                mcp = FastMCP("echo")
+
+
+                @mcp.tool()
+                def echo(text: str) -> str:
+                    return text
+
+
+                mcp.run()
+                """
+            )
+        )
+
+        def server(name: str) -> McpTarget:
+            return McpTarget(name=name, transport="stdio", command=sys.executable, args=[str(server_script)])
+
+        tree = MockedTarget(MultiplexTarget("combined", server("first"), server("second")), MockConfig())
+        proxy = ProxyMCP(tree, StartupConfig(timeout=30))
+
+        async with proxy.client_session_adapter() as session:
+            result = await session.call_tool("first.echo", {"text": "hello"})
+            assert result.content[0].text == "hello"
+        for target in tree.target.sub_targets:
+            assert isinstance(target, McpTarget)
+            assert target.target_mcp is None
+
+    def test_startup_from_config(self, tmp_path):
+        """Test the startup section of the configuration is read."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("target:\n  type: mcp\n  name: server\nstartup:\n  timeout: 5\n  warm_catalogs: true\n")
+
+        proxy = ProxyMCP.from_config(config_file)
+
+        assert proxy.startup == StartupConfig(timeout=5, warm_catalogs=True)
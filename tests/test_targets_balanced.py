@@ -0,0 +1,398 @@
+"""Tests for balanced target implementation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp import McpError, Tool
+from mcp.types import ErrorData, TextContent, ToolAnnotations
+from omegaconf import OmegaConf
+
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.targets.balanced import BalancedTarget, HedgingConfig
+from mcp_kit.targets.interfaces import Target
+
+
+def make_replica(name: str) -> MagicMock:
+    """Create a mock replica target answering with its own name."""
+    target = MagicMock(spec=Target)
+    target.name = name
+    target.initialize = AsyncMock()
+    target.close = AsyncMock()
+    target.list_tools = AsyncMock(return_value=[Tool(name="tool", inputSchema={})])
+    target.call_tool = AsyncMock(return_value=[TextContent(type="text", text=name)])
+    target.list_prompts = AsyncMock(return_value=[])
+    target.get_prompt = AsyncMock()
+    return target
+
+
+@pytest.fixture
+def replicas():
+    """Create three mock replicas."""
+    return [make_replica(f"replica{i}") for i in range(3)]
+
+
+async def served_by(target: BalancedTarget) -> str:
+    """Call a tool and return the name of the replica that served it."""
+    result = await target.call_tool("tool", {})
+    return result[0].text
+
+
+class TestBalancedTarget:
+    """Test cases for BalancedTarget class."""
+
+    def test_init(self, replicas):
+        """Test BalancedTarget initialization."""
+        target = BalancedTarget("balanced", *replicas, strategy="least_outstanding")
+
+        assert target.name == "balanced"
+        assert target.strategy == "least_outstanding"
+        assert [replica.target for replica in target.replicas] == replicas
+
+    def test_init_invalid(self, replicas):
+        """Test BalancedTarget rejects unknown strategies and empty replica lists."""
+        with pytest.raises(ValueError, match="Unknown balancing strategy"):
+            BalancedTarget("balanced", *replicas, strategy="random")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="at least one replica"):
+            BalancedTarget("balanced")
+
+    def test_from_config(self):
+        """Test BalancedTarget.from_config and resolution by the factory."""
+        config = OmegaConf.create(
+            {
+                "type": "balanced",
+                "name": "config-balanced",
+                "strategy": "power_of_two",
+                "failure_threshold": 2,
+                "ejection_time": 5,
+                "targets": [
+                    {"type": "mcp", "name": "replica1", "url": "http://replica1.example.com/mcp"},
+                    {"type": "mcp", "name": "replica2", "url": "http://replica2.example.com/mcp"},
+                ],
+            }
+        )
+
+        target = create_target_from_config(config)
+
+        assert isinstance(target, BalancedTarget)
+        assert target.name == "config-balanced"
+        assert target.strategy == "power_of_two"
+        assert [replica.target.name for replica in target.replicas] == ["replica1", "replica2"]
+        assert target.replicas[0].circuit_breaker.failure_threshold == 2
+        assert target.replicas[0].circuit_breaker.reset_timeout == 5
+
+    @pytest.mark.asyncio
+    async def test_round_robin(self, replicas):
+        """Test replicas take turns with the round robin strategy."""
+        target = BalancedTarget("balanced", *replicas)
+
+        served = [await served_by(target) for _ in range(6)]
+
+        assert served == ["replica0", "replica1", "replica2"] * 2
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding(self, replicas):
+        """Test calls go to the replicas with the fewest requests in flight."""
+        release = asyncio.Event()
+
+        async def slow_call(name, arguments):
+            await release.wait()
+            return [TextContent(type="text", text="replica0")]
+
+        replicas[0].call_tool = AsyncMock(side_effect=slow_call)
+        target = BalancedTarget("balanced", *replicas, strategy="least_outstanding")
+
+        slow = asyncio.create_task(target.call_tool("tool", {}))
+        await asyncio.sleep(0)
+        assert target.replicas[0].outstanding == 1
+
+        assert await served_by(target) == "replica1"
+        assert await served_by(target) == "replica1"
+
+        release.set()
+        await slow
+        assert target.replicas[0].outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_power_of_two(self, replicas):
+        """Test the less busy of the two sampled replicas is picked."""
+        target = BalancedTarget("balanced", *replicas, strategy="power_of_two")
+        target.replicas[0].outstanding = 5
+
+        with patch("mcp_kit.targets.balanced.random.sample", return_value=target.replicas[:2]):
+            assert await served_by(target) == "replica1"
+
+    @pytest.mark.asyncio
+    async def test_failing_replica_is_ejected(self, replicas):
+        """Test a replica is ejected after consecutive failures."""
+        replicas[0].call_tool.side_effect = ConnectionError("Connection refused")
+        target = BalancedTarget("balanced", *replicas, failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await target.call_tool("tool", {})
+            await served_by(target)
+            await served_by(target)
+
+        assert not target.replicas[0].healthy
+        served = {await served_by(target) for _ in range(4)}
+        assert served == {"replica1", "replica2"}
+
+    @pytest.mark.asyncio
+    async def test_server_errors_do_not_eject(self, replicas):
+        """Test errors reported by the server don't count against the replica health."""
+        replicas[0].call_tool.side_effect = McpError(ErrorData(code=-32602, message="Invalid params"))
+        target = BalancedTarget("balanced", *replicas, strategy="least_outstanding", failure_threshold=1)
+
+        with pytest.raises(McpError):
+            await target.call_tool("tool", {})
+
+        assert target.replicas[0].healthy
+
+    @pytest.mark.asyncio
+    async def test_recovering_replica_gets_single_trial(self, replicas):
+        """Test a single call is sent to an ejected replica once its ejection time has passed."""
+        recovered = asyncio.Event()
+
+        async def slow_call(name, arguments):
+            await recovered.wait()
+            return [TextContent(type="text", text="replica0")]
+
+        target = BalancedTarget("balanced", *replicas, failure_threshold=1, ejection_time=30)
+        with patch("mcp_kit.resilience.time.monotonic", return_value=100.0):
+            target._eject(target.replicas[0])
+        replicas[0].call_tool.side_effect = slow_call
+
+        with patch("mcp_kit.resilience.time.monotonic", return_value=131.0):
+            calls = [asyncio.create_task(served_by(target)) for _ in range(6)]
+            await asyncio.sleep(0)
+            assert replicas[0].call_tool.await_count == 1
+            recovered.set()
+            served = await asyncio.gather(*calls)
+
+        assert served.count("replica0") == 1
+        assert target.replicas[0].healthy
+
+    @pytest.mark.asyncio
+    async def test_all_ejected_uses_all_replicas(self, replicas):
+        """Test calls are still served when every replica is ejected."""
+        target = BalancedTarget("balanced", *replicas)
+        for replica in target.replicas:
+            target._eject(replica)
+
+        assert await served_by(target) == "replica0"
+
+    @pytest.mark.asyncio
+    async def test_list_tools_fails_over(self, replicas):
+        """Test listing is retried on another replica."""
+        replicas[0].list_tools.side_effect = ConnectionError("Connection refused")
+        target = BalancedTarget("balanced", *replicas)
+
+        tools = await target.list_tools()
+
+        assert [tool.name for tool in tools] == ["tool"]
+        assert replicas[1].list_tools.call_count + replicas[2].list_tools.call_count == 1
+        assert target.replicas[0].circuit_breaker.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_list_tools_all_replicas_fail(self, replicas):
+        """Test listing raises once every replica failed."""
+        for replica in replicas:
+            replica.list_tools.side_effect = ConnectionError("Connection refused")
+        target = BalancedTarget("balanced", *replicas)
+
+        with pytest.raises(ConnectionError):
+            await target.list_tools()
+
+        for replica in replicas:
+            replica.list_tools.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_initialize_ejects_failing_replicas(self, replicas):
+        """Test replicas that fail to initialize are ejected."""
+        replicas[1].initialize.side_effect = ConnectionError("Connection refused")
+        target = BalancedTarget("balanced", *replicas)
+
+        await target.initialize()
+
+        assert [replica.healthy for replica in target.replicas] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_initialize_all_replicas_fail(self, replicas):
+        """Test initialization fails when no replica could be initialized."""
+        for replica in replicas:
+            replica.initialize.side_effect = ConnectionError("Connection refused")
+        target = BalancedTarget("balanced", *replicas)
+
+        with pytest.raises(ConnectionError):
+            await target.initialize()
+
+    @pytest.mark.asyncio
+    async def test_close(self, replicas):
+        """Test all replicas are closed."""
+        target = BalancedTarget("balanced", *replicas)
+
+        await target.close()
+
+        for replica in replicas:
+            replica.close.assert_called_once()
+
+
+class TestBalancedTargetHedging:
+    """Test cases for hedged calls of BalancedTarget."""
+
+    @staticmethod
+    def make_target(replicas, delay: float) -> BalancedTarget:
+        """Create a balanced target hedging after the given observed latency."""
+        target = BalancedTarget(
+            "balanced", *replicas, strategy="least_outstanding", hedging=HedgingConfig(min_samples=1)
+        )
+        target._latencies.append(delay)
+        target._hedgeable_tools = {"tool"}
+        return target
+
+    def test_invalid_config(self):
+        """Test HedgingConfig rejects invalid quantiles and sample counts."""
+        with pytest.raises(ValueError, match="Invalid hedging configuration"):
+            HedgingConfig(quantile=1.5)
+        with pytest.raises(ValueError, match="Invalid hedging configuration"):
+            HedgingConfig(window=10, min_samples=20)
+
+    def test_from_config(self):
+        """Test the hedging configuration is read from the target configuration."""
+        config = OmegaConf.create(
+            {
+                "type": "balanced",
+                "name": "config-balanced",
+                "hedging": {"quantile": 0.9, "min_samples": 10},
+                "targets": [{"type": "mcp", "name": "replica1", "url": "http://replica1.example.com/mcp"}],
+            }
+        )
+
+        target = BalancedTarget.from_config(config)
+
+        assert target.hedging == HedgingConfig(quantile=0.9, min_samples=10)
+
+    def test_hedge_delay_is_observed_quantile(self, replicas):
+        """Test the hedge delay is the configured quantile of the observed latencies."""
+        target = BalancedTarget("balanced", *replicas, hedging=HedgingConfig(quantile=0.95, min_samples=20))
+        target._latencies.extend(i / 100 for i in range(1, 20))
+        assert target._hedge_delay() is None
+
+        target._latencies.extend(i / 100 for i in range(20, 101))
+        assert target._hedge_delay() == 0.95
+
+    def test_hedge_delay_refreshed_periodically(self, replicas):
+        """Test the hedge delay is only computed again once enough latencies are new."""
+        target = BalancedTarget("balanced", *replicas, hedging=HedgingConfig(window=1000, min_samples=1))
+        target._latencies.append(1.0)
+        assert target._hedge_delay() == 1.0
+
+        target._latencies.extend([5.0] * 9)
+        target._new_latencies = 9
+        assert target._hedge_delay() == 1.0
+
+        target._latencies.append(5.0)
+        target._new_latencies += 1
+        assert target._hedge_delay() == 5.0
+
+    @pytest.mark.asyncio
+    async def test_latency_observed_for_every_call(self, replicas):
+        """Test the latency of calls to tools that aren't hedged is observed too."""
+        target = self.make_target(replicas, delay=1)
+
+        await target.call_tool("create", {})
+        await target.call_tool("tool", {})
+
+        assert len(target._latencies) == 3
+
+    @pytest.mark.asyncio
+    async def test_list_tools_records_hedgeable_tools(self, replicas):
+        """Test only idempotent and read only tools are hedged."""
+        replicas[0].list_tools.return_value = [
+            Tool(name="read", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=True)),
+            Tool(name="put", inputSchema={}, annotations=ToolAnnotations(idempotentHint=True)),
+            Tool(name="create", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=False)),
+            Tool(name="other", inputSchema={}),
+        ]
+        target = BalancedTarget("balanced", *replicas, hedging=HedgingConfig())
+
+        await target.list_tools()
+
+        assert target._hedgeable_tools == {"read", "put"}
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self, replicas):
+        """Test a slow call is sent to a second replica and the first answer wins."""
+        cancelled = asyncio.Event()
+
+        async def slow_call(name, arguments):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        replicas[0].call_tool = AsyncMock(side_effect=slow_call)
+        target = self.make_target(replicas, delay=0.01)
+
+        assert await served_by(target) == "replica1"
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert [replica.outstanding for replica in target.replicas] == [0, 0, 0]
+        assert len(target._latencies) == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self, replicas):
+        """Test a call answering before the hedge delay is sent to a single replica."""
+        target = self.make_target(replicas, delay=1)
+
+        assert await served_by(target) == "replica0"
+
+        replicas[1].call_tool.assert_not_called()
+        replicas[2].call_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_tool_is_not_hedged(self, replicas):
+        """Test calls to tools that are not idempotent are never hedged."""
+        async def slow_call(name, arguments):
+            await asyncio.sleep(0.05)
+            return [TextContent(type="text", text="replica0")]
+
+        replicas[0].call_tool = AsyncMock(side_effect=slow_call)
+        target = self.make_target(replicas, delay=0.001)
+
+        result = await target.call_tool("create", {})
+
+        assert result[0].text == "replica0"
+        replicas[1].call_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hedge_failure_waits_for_primary(self, replicas):
+        """Test the primary answer is used when the hedged call fails."""
+
+        async def slow_call(name, arguments):
+            await asyncio.sleep(0.05)
+            return [TextContent(type="text", text="replica0")]
+
+        replicas[0].call_tool = AsyncMock(side_effect=slow_call)
+        replicas[1].call_tool.side_effect = ConnectionError("Connection refused")
+        target = self.make_target(replicas, delay=0.001)
+
+        assert await served_by(target) == "replica0"
+        assert target.replicas[1].circuit_breaker.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_all_hedged_calls_fail(self, replicas):
+        """Test the primary error is raised when every hedged call failed."""
+
+        async def slow_failure(name, arguments):
+            await asyncio.sleep(0.05)
+            raise TimeoutError("primary")
+
+        replicas[0].call_tool = AsyncMock(side_effect=slow_failure)
+        replicas[1].call_tool.side_effect = ConnectionError("hedge")
+        target = self.make_target(replicas, delay=0.001)
+
+        with pytest.raises(TimeoutError, match="primary"):
+            await target.call_tool("tool", {})
@@ -0,0 +1,202 @@
+"""Tests for cached target implementation."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp import Tool
+from mcp.types import GetPromptResult, TextContent, ToolAnnotations
+from omegaconf import OmegaConf
+
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.targets.cached import CacheConfig, CachedTarget
+from mcp_kit.targets.interfaces import Target
+
+
+@pytest.fixture
+def base_target():
+    """Create a mock base target with read only, idempotent and other tools."""
+    target = MagicMock(spec=Target)
+    target.name = "base"
+    target.initialize = AsyncMock()
+    target.close = AsyncMock()
+    target.list_tools = AsyncMock(
+        return_value=[
+            Tool(name="lookup", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=True)),
+            Tool(name="upsert", inputSchema={}, annotations=ToolAnnotations(idempotentHint=True)),
+            Tool(name="send", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=False)),
+        ]
+    )
+    target.call_tool = AsyncMock(side_effect=lambda name, arguments: [TextContent(type="text", text=f"{name} result")])
+    target.list_prompts = AsyncMock(return_value=[])
+    target.get_prompt = AsyncMock(return_value=GetPromptResult(messages=[]))
+    return target
+
+
+class TestCachedTarget:
+    """Test cases for CachedTarget class."""
+
+    def test_name(self, base_target):
+        """Test the cached target name."""
+        assert CachedTarget(base_target).name == "base_cached"
+
+    def test_from_config(self):
+        """Test CachedTarget.from_config and resolution by the factory."""
+        config = OmegaConf.create(
+            {
+                "type": "cached",
+                "base_target": {"type": "mcp", "name": "base", "url": "http://example.com/mcp"},
+                "max_bytes": 1024,
+                "ttl": 60,
+                "tool_ttls": {"search": 5},
+                "cache_all_tools": True,
+            }
+        )
+
+        target = create_target_from_config(config)
+
+        assert isinstance(target, CachedTarget)
+        assert target.target.name == "base"
+        assert target.cache_config == CacheConfig(max_bytes=1024, ttl=60, tool_ttls={"search": 5}, cache_all_tools=True)
+        assert target.cache.max_bytes == 1024
+
+    @pytest.mark.asyncio
+    async def test_caches_read_only_and_idempotent_tools(self, base_target):
+        """Test only read only and idempotent tools are cached by default."""
+        target = CachedTarget(base_target)
+        await target.initialize()
+
+        for name in ["lookup", "upsert", "send"]:
+            for _ in range(2):
+                result = await target.call_tool(name, {"id": 1})
+                assert result[0].text == f"{name} result"
+
+        assert [call.args[0] for call in base_target.call_tool.call_args_list] == ["lookup", "upsert", "send", "send"]
+
+    @pytest.mark.asyncio
+    async def test_cache_key_uses_canonical_arguments(self, base_target):
+        """Test calls with the same arguments in another order hit the cache."""
+        target = CachedTarget(base_target)
+        await target.initialize()
+
+        await target.call_tool("lookup", {"a": 1, "b": 2})
+        await target.call_tool("lookup", {"b": 2, "a": 1})
+        await target.call_tool("lookup", {"a": 2, "b": 2})
+
+        assert base_target.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_all_tools(self, base_target):
+        """Test every tool is cached with cache_all_tools."""
+        target = CachedTarget(base_target, CacheConfig(cache_all_tools=True))
+
+        await target.call_tool("send", {})
+        await target.call_tool("send", {})
+
+        base_target.call_tool.assert_called_once()
+        base_target.list_tools.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_ttls(self, base_target):
+        """Test per tool TTLs opt tools in, expire results and disable caching."""
+        target = CachedTarget(base_target, CacheConfig(ttl=60, tool_ttls={"send": 10, "lookup": 0}))
+        await target.initialize()
+
+        with patch("mcp_kit.cache.time.monotonic", return_value=100.0):
+            await target.call_tool("send", {})
+            await target.call_tool("upsert", {})
+            await target.call_tool("lookup", {})
+            await target.call_tool("lookup", {})
+        with patch("mcp_kit.cache.time.monotonic", return_value=120.0):
+            await target.call_tool("send", {})
+            await target.call_tool("upsert", {})
+
+        assert [call.args[0] for call in base_target.call_tool.call_args_list] == ["send", "upsert", "lookup", "lookup", "send"]
+
+    @pytest.mark.asyncio
+    async def test_size_cap(self, base_target):
+        """Test results are evicted to stay under the size cap."""
+        target = CachedTarget(base_target, CacheConfig(max_bytes=100))
+        await target.initialize()
+
+        await target.call_tool("lookup", {"id": 1})
+        await target.call_tool("lookup", {"id": 2})
+        await target.call_tool("lookup", {"id": 1})
+
+        assert target.cache.size <= 100
+        assert base_target.call_tool.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, base_target):
+        """Test failed calls are not cached."""
+        base_target.call_tool = AsyncMock(side_effect=[ConnectionError("boom"), [TextContent(type="text", text="ok")]])
+        target = CachedTarget(base_target)
+        await target.initialize()
+
+        with pytest.raises(ConnectionError):
+            await target.call_tool("lookup", {})
+        assert (await target.call_tool("lookup", {}))[0].text == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_not_shared(self, base_target):
+        """Test modifying a returned result doesn't modify the cached result."""
+        target = CachedTarget(base_target)
+
+        first = await target.call_tool("lookup", {})
+        first[0].text = "changed"
+        second = await target.call_tool("lookup", {})
+        second[0].text = "changed again"
+
+        assert (await target.call_tool("lookup", {}))[0].text == "lookup result"
+        base_target.call_tool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_tools_learned_on_first_call(self, base_target):
+        """Test the cacheable tools are learned by the first call, not at initialization."""
+        target = CachedTarget(base_target)
+        await target.initialize()
+        base_target.list_tools.assert_not_called()
+
+        await target.call_tool("lookup", {})
+        await target.call_tool("lookup", {})
+        await target.call_tool("send", {})
+
+        base_target.list_tools.assert_called_once()
+        assert base_target.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tools_listing_failure(self, base_target):
+        """Test a base target failing to list its tools still serves the calls, without caching them."""
+        tools = base_target.list_tools.return_value
+        base_target.list_tools.side_effect = [ValueError("No tools available"), tools]
+        target = CachedTarget(base_target)
+        await target.initialize()
+
+        await target.call_tool("lookup", {})
+        await target.call_tool("lookup", {})
+        await target.list_tools()
+        await target.call_tool("lookup", {})
+        await target.call_tool("lookup", {})
+
+        assert base_target.call_tool.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prompts_are_forwarded(self, base_target):
+        """Test prompts are forwarded to the base target."""
+        target = CachedTarget(base_target)
+
+        assert await target.list_prompts() == []
+        await target.get_prompt("prompt", {"a": "b"})
+
+        base_target.get_prompt.assert_called_once_with("prompt", {"a": "b"})
+
+    @pytest.mark.asyncio
+    async def test_close(self, base_target):
+        """Test close drops the cache and closes the base target."""
+        target = CachedTarget(base_target)
+        await target.initialize()
+        await target.call_tool("lookup", {})
+
+        await target.close()
+
+        assert len(target.cache) == 0
+        base_target.close.assert_called_once()
@@ -1,12 +1,24 @@
 """Tests for MCP target implementation."""
 
+import asyncio
+import sys
+import textwrap
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from mcp import Tool
-from mcp.types import TextContent
+from mcp import ErrorData, McpError, Tool
+from mcp.types import (
+    Prompt,
+    ToolAnnotations,
+    PromptListChangedNotification,
+    ServerNotification,
+    TextContent,
+    ToolListChangedNotification,
+)
 from omegaconf import OmegaConf
 
+from mcp_kit.resilience import CircuitOpenError, ReconnectConfig
+from mcp_kit.session_pool import SessionPoolConfig
 from mcp_kit.targets.mcp import McpTarget
 
 
@@ -126,7 +138,9 @@ class TestMcpTarget:
             assert target.target_mcp == mock_session
             assert target.target_mcp_exit_stack == mock_exit_stack
             mock_http_session.assert_called_once_with(
-                "http://example.com/mcp", {"Authorization": "Bearer token"}
+                "http://example.com/mcp",
+                {"Authorization": "Bearer token"},
+                message_handler=target._handle_message,
             )
 
     @pytest.mark.asyncio
@@ -167,6 +181,371 @@ class TestMcpTarget:
         assert result == mock_tools
         mock_session.list_tools.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_list_tools_not_cached_by_default(self):
+        """Test list_tools queries the server every time without a catalog TTL."""
+        target = McpTarget(name="test-mcp", url="http://example.com/mcp")
+
+        mock_session = AsyncMock()
+        mock_session.list_tools.return_value.tools = []
+        target.target_mcp = mock_session
+
+        await target.list_tools()
+        await target.list_tools()
+        assert mock_session.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tools_and_prompts_cached_within_ttl(self):
+        """Test the catalog cache serves tools and prompts until the TTL expires."""
+        target = McpTarget(name="test-mcp", url="http://example.com/mcp", catalog_ttl=60)
+
+        mock_session = AsyncMock()
+        mock_tools = [Tool(name="server_tool", inputSchema={})]
+        mock_prompts = [Prompt(name="server_prompt")]
+        mock_session.list_tools.return_value.tools = mock_tools
+        mock_session.list_prompts.return_value.prompts = mock_prompts
+        target.target_mcp = mock_session
+
+        with patch("mcp_kit.targets.mcp.time.monotonic", return_value=100.0):
+            assert await target.list_tools() == mock_tools
+            assert await target.list_tools() is await target.list_tools()
+            assert await target.list_prompts() == mock_prompts
+            assert await target.list_prompts() == mock_prompts
+        assert mock_session.list_tools.call_count == 1
+        assert mock_session.list_prompts.call_count == 1
+
+        with patch("mcp_kit.targets.mcp.time.monotonic", return_value=161.0):
+            await target.list_tools()
+            await target.list_prompts()
+        assert mock_session.list_tools.call_count == 2
+        assert mock_session.list_prompts.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_catalog_cache(self):
+        """Test invalidate_catalog_cache forces the catalog to be listed again."""
+        target = McpTarget(name="test-mcp", url="http://example.com/mcp", catalog_ttl=60)
+
+        mock_session = AsyncMock()
+        mock_session.list_tools.return_value.tools = []
+        mock_session.list_prompts.return_value.prompts = []
+        target.target_mcp = mock_session
+
+        await target.list_tools()
+        await target.list_prompts()
+        target.invalidate_catalog_cache()
+        await target.list_tools()
+        await target.list_prompts()
+
+        assert mock_session.list_tools.call_count == 2
+        assert mock_session.list_prompts.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notifications_invalidate_cache(self):
+        """Test list_changed notifications from the server drop the matching cache."""
+        target = McpTarget(name="test-mcp", url="http://example.com/mcp", catalog_ttl=60)
+
+        mock_session = AsyncMock()
+        mock_session.list_tools.return_value.tools = []
+        mock_session.list_prompts.return_value.prompts = []
+        target.target_mcp = mock_session
+
+        await target.list_tools()
+        await target.list_prompts()
+
+        await target._handle_message(
+            ServerNotification(ToolListChangedNotification(method="notifications/tools/list_changed"))
+        )
+        await target.list_tools()
+        await target.list_prompts()
+        assert mock_session.list_tools.call_count == 2
+        assert mock_session.list_prompts.call_count == 1
+
+        await target._handle_message(
+            ServerNotification(PromptListChangedNotification(method="notifications/prompts/list_changed"))
+        )
+        await target.list_tools()
+        await target.list_prompts()
+        assert mock_session.list_tools.call_count == 2
+        assert mock_session.list_prompts.call_count == 2
+
+    def test_from_config_with_catalog_ttl(self):
+        """Test McpTarget.from_config reads the catalog TTL."""
+        config = OmegaConf.create(
+            {"type": "mcp", "name": "config-mcp", "url": "http://example.com/mcp", "catalog_ttl": 30}
+        )
+
+        target = McpTarget.from_config(config)
+        assert target.catalog_ttl == 30
+
+    def test_from_config_with_pool(self):
+        """Test McpTarget.from_config reads the session pool configuration."""
+        config = OmegaConf.create(
+            {
+                "type": "mcp",
+                "name": "config-mcp",
+                "url": "http://example.com/mcp",
+                "pool": {"min_size": 2, "max_size": 8, "health_check_interval": 30},
+            }
+        )
+
+        target = McpTarget.from_config(config)
+        assert target.pool == SessionPoolConfig(min_size=2, max_size=8, health_check_interval=30)
+
+    @pytest.mark.asyncio
+    async def test_initialize_with_pool(self):
+        """Test initialize starts a session pool and requests go through it."""
+        target = McpTarget(
+            name="test-mcp",
+            url="http://example.com/mcp",
+            pool=SessionPoolConfig(min_size=1, max_size=4),
+        )
+
+        mock_session = AsyncMock()
+        mock_content = [TextContent(type="text", text="Pooled response")]
+        mock_session.call_tool.return_value.content = mock_content
+        mock_session.list_tools.return_value.tools = []
+
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.return_value = (mock_session, AsyncMock())
+
+            await target.initialize()
+            assert target.target_mcp is None
+            assert target.session_pool is not None
+            assert target.session_pool.size == 1
+
+            assert await target.list_tools() == []
+            assert await target.call_tool("pooled_tool", {}) == mock_content
+            mock_session.call_tool.assert_called_once_with(name="pooled_tool", arguments={})
+
+            await target.close()
+            assert target.session_pool is None
+
+    def test_from_config_with_reconnect(self):
+        """Test McpTarget.from_config reads the reconnect configuration."""
+        config = OmegaConf.create(
+            {
+                "type": "mcp",
+                "name": "config-mcp",
+                "url": "http://example.com/mcp",
+                "reconnect": {"max_attempts": 3, "initial_backoff": 0.1, "failure_threshold": 10},
+            }
+        )
+
+        target = McpTarget.from_config(config)
+        assert target.reconnect == ReconnectConfig(max_attempts=3, initial_backoff=0.1, failure_threshold=10)
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_idempotent_tool(self):
+        """Test a connection error on an idempotent tool reconnects and replays the call."""
+        tools = [
+            Tool(name="idempotent_tool", inputSchema={}, annotations=ToolAnnotations(idempotentHint=True)),
+        ]
+        target = McpTarget(
+            name="test-mcp",
+            url="http://example.com/mcp",
+            tools=tools,
+            reconnect=ReconnectConfig(initial_backoff=0, jitter=False),
+        )
+
+        broken_session = AsyncMock()
+        broken_session.call_tool.side_effect = ConnectionError("Connection lost")
+        new_session = AsyncMock()
+        mock_content = [TextContent(type="text", text="Replayed response")]
+        new_session.call_tool.return_value.content = mock_content
+
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.side_effect = [(broken_session, AsyncMock()), (new_session, AsyncMock())]
+
+            await target.initialize()
+            result = await target.call_tool("idempotent_tool", {"param": "value"})
+
+            assert result == mock_content
+            assert mock_http_session.call_count == 2
+            new_session.call_tool.assert_called_once_with(name="idempotent_tool", arguments={"param": "value"})
+            await target.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_does_not_replay_non_idempotent_tool(self):
+        """Test a non-idempotent call fails but the target reconnects for later calls."""
+        target = McpTarget(
+            name="test-mcp",
+            url="http://example.com/mcp",
+            reconnect=ReconnectConfig(initial_backoff=0, jitter=False),
+        )
+
+        broken_session = AsyncMock()
+        broken_session.call_tool.side_effect = ConnectionError("Connection lost")
+        new_session = AsyncMock()
+        new_session.call_tool.return_value.content = []
+
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.side_effect = [(broken_session, AsyncMock()), (new_session, AsyncMock())]
+
+            await target.initialize()
+            with pytest.raises(ConnectionError, match="Connection lost"):
+                await target.call_tool("unsafe_tool", {})
+
+            assert await target._reconnect_task
+            assert await target.call_tool("unsafe_tool", {}) == []
+            new_session.call_tool.assert_called_once()
+            await target.close()
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_fails_fast(self):
+        """Test calls fail fast without touching the server while the circuit is open."""
+        target = McpTarget(
+            name="test-mcp",
+            url="http://example.com/mcp",
+            reconnect=ReconnectConfig(max_attempts=0, failure_threshold=1, reset_timeout=60),
+        )
+
+        broken_session = AsyncMock()
+        broken_session.call_tool.side_effect = ConnectionError("Connection lost")
+
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.return_value = (broken_session, AsyncMock())
+
+            await target.initialize()
+            with pytest.raises(ConnectionError, match="Connection lost"):
+                await target.call_tool("some_tool", {})
+            with pytest.raises(CircuitOpenError, match="Circuit to MCP server 'test-mcp' is open"):
+                await target.call_tool("some_tool", {})
+
+            broken_session.call_tool.assert_called_once()
+            await target.close()
+
+    @pytest.mark.asyncio
+    async def test_mcp_error_does_not_trigger_reconnect(self):
+        """Test errors reported by the server are raised without reconnecting."""
+        target = McpTarget(
+            name="test-mcp",
+            url="http://example.com/mcp",
+            reconnect=ReconnectConfig(initial_backoff=0),
+        )
+
+        mock_session = AsyncMock()
+        mock_session.call_tool.side_effect = McpError(ErrorData(code=400, message="Bad request"))
+
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.return_value = (mock_session, AsyncMock())
+
+            await target.initialize()
+            with pytest.raises(McpError, match="Bad request"):
+                await target.call_tool("some_tool", {})
+
+            assert target._reconnect_task is None
+            assert target.circuit_breaker.failures == 0
+            await target.close()
+
+    def test_from_config_with_stdio_transport(self):
+        """Test McpTarget.from_config reads the stdio transport parameters."""
+        config = OmegaConf.create(
+            {
+                "type": "mcp",
+                "name": "stdio-mcp",
+                "transport": "stdio",
+                "command": "uvx",
+                "args": ["mcp-server-time"],
+                "env": {"TZ": "UTC"},
+            }
+        )
+
+        target = McpTarget.from_config(config)
+        assert target.transport == "stdio"
+        assert target.command == "uvx"
+        assert target.args == ["mcp-server-time"]
+        assert target.env == {"TZ": "UTC"}
+
+    def test_init_with_unknown_transport(self):
+        """Test an unknown transport is rejected."""
+        with pytest.raises(ValueError, match="Unknown MCP transport 'websocket'"):
+            McpTarget(name="test-mcp", url="ws://example.com/mcp", transport="websocket")
+
+    def test_init_stdio_without_command(self):
+        """Test the stdio transport requires a command."""
+        with pytest.raises(ValueError, match="requires a 'command'"):
+            McpTarget(name="test-mcp", transport="stdio")
+
+    @pytest.mark.asyncio
+    async def test_initialize_with_sse_transport(self):
+        """Test initialize opens an SSE session for the sse transport."""
+        target = McpTarget(name="test-mcp", url="http://example.com/sse", transport="sse")
+
+        mock_session = MagicMock()
+        mock_exit_stack = MagicMock()
+
+        with patch("mcp_kit.targets.mcp.sse_session") as mock_sse_session:
+            mock_sse_session.return_value = (mock_session, mock_exit_stack)
+
+            await target.initialize()
+
+            assert target.target_mcp == mock_session
+            mock_sse_session.assert_called_once_with(
+                "http://example.com/sse", None, message_handler=target._handle_message
+            )
+
+    @pytest.mark.asyncio
+    async def test_initialize_with_stdio_transport(self):
+        """Test initialize spawns the stdio server with the configured parameters."""
+        target = McpTarget(
+            name="test-mcp", transport="stdio", command="server", args=["--flag"], env={"KEY": "value"}
+        )
+
+        mock_session = MagicMock()
+        mock_exit_stack = MagicMock()
+
+        with patch("mcp_kit.targets.mcp.stdio_session") as mock_stdio_session:
+            mock_stdio_session.return_value = (mock_session, mock_exit_stack)
+
+            await target.initialize()
+
+            assert target.target_mcp == mock_session
+            server_parameters = mock_stdio_session.call_args.args[0]
+            assert server_parameters.command == "server"
+            assert server_parameters.args == ["--flag"]
+            assert server_parameters.env == {"KEY": "value"}
+
+    @pytest.mark.asyncio
+    async def test_stdio_worker_pool(self, tmp_path):
+        """Test a pool of stdio workers spawns one server process per session."""
+        server_script = tmp_path / "server.py"
+        server_script.write_text(
+            textwrap.dedent(
+                """
+                import os
+
+                from mcp.server.fastmcp import FastMCP
+
+                mcp = FastMCP("worker")
+
+
+                @mcp.tool()
+                def pid() -> str:
+                    return str(os.getpid())
+
+
+                mcp.run()
+                """
+            )
+        )
+        target = McpTarget(
+            name="stdio-mcp",
+            transport="stdio",
+            command=sys.executable,
+            args=[str(server_script)],
+            pool=SessionPoolConfig(min_size=2, max_size=2),
+        )
+
+        await target.initialize()
+        try:
+            assert [tool.name for tool in await target.list_tools()] == ["pid"]
+            async with target.session_pool.acquire() as first, target.session_pool.acquire() as second:
+                first_pid = (await first.call_tool("pid")).content[0].text
+                second_pid = (await second.call_tool("pid")).content[0].text
+            assert first_pid != second_pid
+        finally:
+            await target.close()
+
     @pytest.mark.asyncio
     async def test_list_tools_no_mcp_session(self):
         """Test list_tools when no MCP session is available."""
@@ -212,14 +591,18 @@ class TestMcpTarget:
 
     @pytest.mark.asyncio
     async def test_close_with_exit_stack(self):
-        """Test close when exit stack is available."""
-        target = McpTarget(name="test-mcp")
+        """Test close when exit stack is available, from another task than the one that initialized the target."""
+        target = McpTarget(name="test-mcp", url="http://example.com/mcp")
 
         mock_exit_stack = AsyncMock()
-        target.target_mcp_exit_stack = mock_exit_stack
+        with patch("mcp_kit.targets.mcp.http_streamable_session") as mock_http_session:
+            mock_http_session.return_value = (AsyncMock(), mock_exit_stack)
+            await asyncio.create_task(target.initialize())
 
         await target.close()
         mock_exit_stack.aclose.assert_called_once()
+        assert target.target_mcp is None
+        assert target.target_mcp_exit_stack is None
 
     @pytest.mark.asyncio
     async def test_close_without_exit_stack(self):
@@ -370,7 +370,7 @@ class TestMockedTarget:
     async def test_call_tool_caching_behavior(
         self, mocked_target, mock_base_target, mock_generator
     ):
-        """Test that list_tools is called each time for call_tool (no caching)."""
+        """Test that call_tool looks tools up in the index instead of re-listing."""
         tool = Tool(name="test_tool", description="Test tool", inputSchema={})
         mock_base_target.list_tools.return_value = [tool]
         mock_content = [TextContent(type="text", text="Mock response")]
@@ -380,7 +380,116 @@ class TestMockedTarget:
         await mocked_target.call_tool("test_tool", {"param": "value1"})
         await mocked_target.call_tool("test_tool", {"param": "value2"})
 
-        # list_tools should be called each time (no caching)
+        # list_tools should only be called once to build the index
+        assert mock_base_target.list_tools.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_initialize_builds_tools_index(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test initialize builds the tool index so call_tool doesn't list tools."""
+        tool = Tool(name="test_tool", description="Test tool", inputSchema={})
+        mock_base_target.list_tools.return_value = [tool]
+        mock_generator.generate.return_value = []
+
+        await mocked_target.initialize()
+        mock_base_target.list_tools.assert_called_once()
+
+        await mocked_target.call_tool("test_tool", {})
+        mock_base_target.list_tools.assert_called_once()
+        mock_generator.generate.assert_called_once_with("base-target", tool, {})
+
+    @pytest.mark.asyncio
+    async def test_initialize_without_generator_skips_tools_index(self, mock_base_target):
+        """Test initialize doesn't list tools when calls are delegated to the base target."""
+        mocked_target = MockedTarget(mock_base_target, MockConfig())
+
+        await mocked_target.initialize()
+
+        mock_base_target.list_tools.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tools_index_rebuilt_when_tool_list_changes(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test the index picks up tools when the base target's tool list changes."""
+        tool1 = Tool(name="tool1", description="Tool 1", inputSchema={})
+        tool2 = Tool(name="tool2", description="Tool 2", inputSchema={})
+        mock_base_target.list_tools.return_value = [tool1]
+        mock_generator.generate.return_value = []
+
+        await mocked_target.initialize()
+
+        # A new list from the base target refreshes the index
+        mock_base_target.list_tools.return_value = [tool1, tool2]
+        await mocked_target.list_tools()
+        await mocked_target.call_tool("tool2", {})
+
+        mock_generator.generate.assert_called_once_with("base-target", tool2, {})
+        assert mock_base_target.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tools_index_follows_changed_definitions(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test a tool changed in the same tool list is picked up when the tools are listed again."""
+        tools = [Tool(name="tool", description="Tool", inputSchema={})]
+        mock_base_target.list_tools.return_value = tools
+        mock_generator.generate.return_value = []
+        await mocked_target.initialize()
+
+        changed = Tool(name="tool", description="Tool", inputSchema={"type": "object"})
+        tools[0] = changed
+        await mocked_target.list_tools()
+        await mocked_target.call_tool("tool", {})
+
+        mock_generator.generate.assert_called_once_with("base-target", changed, {})
+
+    @pytest.mark.asyncio
+    async def test_initialize_base_failing_to_list_tools(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test a base target failing to list its tools at startup doesn't fail the initialization."""
+        tool = Tool(name="tool", description="Tool", inputSchema={})
+        mock_base_target.list_tools.side_effect = [ValueError("No tools available"), [tool]]
+        mock_generator.generate.return_value = []
+
+        await mocked_target.initialize()
+        await mocked_target.call_tool("tool", {})
+
+        mock_generator.generate.assert_called_once_with("base-target", tool, {})
+
+    @pytest.mark.asyncio
+    async def test_tools_index_refreshed_on_miss(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test an unknown tool triggers a single refresh of the index."""
+        tool1 = Tool(name="tool1", description="Tool 1", inputSchema={})
+        tool2 = Tool(name="tool2", description="Tool 2", inputSchema={})
+        mock_base_target.list_tools.return_value = [tool1]
+        mock_generator.generate.return_value = []
+
+        await mocked_target.initialize()
+        mock_base_target.list_tools.return_value = [tool1, tool2]
+
+        await mocked_target.call_tool("tool2", {})
+
+        mock_generator.generate.assert_called_once_with("base-target", tool2, {})
+        assert mock_base_target.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tools_index(
+        self, mocked_target, mock_base_target, mock_generator
+    ):
+        """Test invalidate_tools_index forces the index to be rebuilt."""
+        tool = Tool(name="test_tool", description="Test tool", inputSchema={})
+        mock_base_target.list_tools.return_value = [tool]
+        mock_generator.generate.return_value = []
+
+        await mocked_target.initialize()
+        mocked_target.invalidate_tools_index()
+        await mocked_target.call_tool("test_tool", {})
+
         assert mock_base_target.list_tools.call_count == 2
 
     @pytest.mark.asyncio
@@ -551,3 +660,146 @@ class TestMockedTargetPromptEngine:
         assert len(result_default.messages) == 1
         assert result_default.messages[0].content.text == "Hello Bob, welcome to our platform!"
         assert result.messages[0].role == "user"
+
+
+class TestMockedTargetPromptIndex:
+    """Test cases for the MockedTarget prompt index and prompt result cache."""
+
+    @pytest.fixture
+    def base_target(self):
+        """Create a base target with a greeting prompt."""
+        from mcp.types import Prompt
+
+        target = MagicMock(spec=Target)
+        target.name = "base-target"
+        target.initialize = AsyncMock()
+        target.list_prompts = AsyncMock(return_value=[Prompt(name="greeting", description="Greeting")])
+        return target
+
+    @pytest.fixture
+    def prompt_engine(self):
+        """Create an interpolation prompt engine with a greeting prompt."""
+        from mcp_kit.prompts.interpolation import InterpolationPromptEngine
+
+        engine = InterpolationPromptEngine({"greeting": InterpolationPrompt(text="Hello {name}")})
+        engine.generate = AsyncMock(wraps=engine.generate)
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_prompts_index_built_on_first_use(self, base_target, prompt_engine):
+        """Test the prompts are listed once, by the first get_prompt."""
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+        await mocked_target.initialize()
+        base_target.list_prompts.assert_not_called()
+
+        await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        await mocked_target.get_prompt("greeting", {"name": "Bob"})
+
+        base_target.list_prompts.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deterministic_results_are_cached(self, base_target, prompt_engine):
+        """Test results of deterministic engines are cached per prompt and arguments."""
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+        await mocked_target.initialize()
+
+        first = await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        second = await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        other = await mocked_target.get_prompt("greeting", {"name": "Bob"})
+
+        assert second == first
+        assert second is not first
+        assert other.messages[0].content.text == "Hello Bob"
+        assert prompt_engine.generate.call_count == 2
+        assert len(mocked_target.prompt_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_not_shared(self, base_target, prompt_engine):
+        """Test modifying a returned result doesn't modify the cached result."""
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+
+        first = await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        first.messages[0].content.text = "Changed"
+        second = await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        second.messages.clear()
+
+        third = await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        assert third.messages[0].content.text == "Hello Ada"
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, base_target, prompt_engine):
+        """Test nothing is cached with a zero size cache."""
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine, prompt_cache_max_bytes=0))
+
+        for _ in range(2):
+            await mocked_target.get_prompt("greeting", {"name": "Ada"})
+
+        assert prompt_engine.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_results_are_not_cached(self, base_target, prompt_engine):
+        """Test results of engines that are not deterministic are generated on every call."""
+        prompt_engine.deterministic = False
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+
+        for _ in range(2):
+            await mocked_target.get_prompt("greeting", {"name": "Ada"})
+
+        assert prompt_engine.generate.call_count == 2
+        assert len(mocked_target.prompt_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_cleared_when_prompt_list_changes(self, base_target, prompt_engine):
+        """Test a different prompt list rebuilds the index and drops the cached results."""
+        from mcp.types import Prompt
+
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+        await mocked_target.initialize()
+        await mocked_target.get_prompt("greeting", {"name": "Ada"})
+
+        base_target.list_prompts.return_value = [Prompt(name="greeting", description="Changed")]
+        await mocked_target.list_prompts()
+
+        assert len(mocked_target.prompt_cache) == 0
+        assert mocked_target._prompts_index["greeting"].description == "Changed"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prompts_index(self, base_target, prompt_engine):
+        """Test invalidate_prompts_index drops the index and the cached results."""
+        mocked_target = MockedTarget(base_target, MockConfig(prompt_engine=prompt_engine))
+        await mocked_target.initialize()
+        await mocked_target.get_prompt("greeting", {"name": "Ada"})
+
+        mocked_target.invalidate_prompts_index()
+        await mocked_target.get_prompt("greeting", {"name": "Ada"})
+
+        assert base_target.list_prompts.call_count == 2
+        assert prompt_engine.generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_initialize_base_without_prompts(self, prompt_engine):
+        """Test a base target without prompts initializes, only getting a prompt fails."""
+        from mcp_kit.targets import McpTarget
+
+        base = McpTarget(name="static", tools=[Tool(name="tool", inputSchema={"type": "object"})])
+        mocked_target = MockedTarget(base, MockConfig(prompt_engine=prompt_engine))
+
+        await mocked_target.initialize()
+
+        with pytest.raises(ValueError, match="No prompts available"):
+            await mocked_target.get_prompt("greeting", {"name": "Ada"})
+        await mocked_target.close()
+
+    def test_from_config_prompt_cache_size(self):
+        """Test the prompt cache size is read from the configuration."""
+        config = OmegaConf.create({
+            "type": "mocked",
+            "base_target": {"type": "mcp", "name": "base-mcp", "url": "http://example.com/mcp"},
+            "prompt_engine": {"type": "interpolation", "prompts": {"greeting": {"text": "Hello {name}"}}},
+            "prompt_cache_max_bytes": 1024,
+        })
+
+        target = MockedTarget.from_config(config)
+
+        assert target.mock_config.prompt_cache_max_bytes == 1024
+        assert target.prompt_cache.max_bytes == 1024
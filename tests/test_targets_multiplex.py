@@ -1,10 +1,12 @@
 """Tests for multiplex target implementation."""
 
+import asyncio
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from mcp import McpError, Tool
-from mcp.types import TextContent, Prompt, PromptArgument, GetPromptResult
+from mcp.types import TextContent, Prompt, PromptArgument, GetPromptResult, ToolAnnotations
 from omegaconf import OmegaConf
 
 from mcp_kit.targets.interfaces import Target
@@ -184,7 +186,7 @@ class TestMultiplexTarget:
 
         assert result == mock_content
         mock_target1.call_tool.assert_called_once_with(
-            "target1.tool1", {"param": "value"}
+            "tool1", {"param": "value"}
         )
 
     @pytest.mark.asyncio
@@ -403,7 +405,7 @@ class TestMultiplexTarget:
 
         assert result == mock_result
         mock_target1.get_prompt.assert_called_once_with(
-            "target1.test_prompt",
+            "test_prompt",
             {"arg1": "value1"}
         )
         mock_target2.get_prompt.assert_not_called()
@@ -492,3 +494,210 @@ class TestMultiplexTarget:
         assert "target1.prompt1" in [p.name for p in prompts]
         assert "target2.tool2" in [t.name for t in tools]
         assert "target2.prompt2" in [p.name for p in prompts]
+
+
+class TestMultiplexTargetFanOut:
+    """Test cases for concurrent listing of tools and prompts."""
+
+    def test_from_config_with_timeout_and_partial_results(self):
+        """Test MultiplexTarget.from_config reads the timeout and partial results mode."""
+        config = OmegaConf.create(
+            {
+                "type": "multiplex",
+                "name": "config-multiplex",
+                "timeout": 2.5,
+                "partial_results": True,
+                "targets": [],
+            }
+        )
+
+        target = MultiplexTarget.from_config(config)
+        assert target.timeout == 2.5
+        assert target.partial_results is True
+
+    @pytest.mark.asyncio
+    async def test_list_tools_runs_concurrently(self, mock_target1, mock_target2):
+        """Test targets are listed concurrently rather than one after another."""
+        both_started = asyncio.Event()
+        started = []
+
+        async def list_tools(name):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return [Tool(name="tool", inputSchema={})]
+
+        mock_target1.list_tools.side_effect = partial(list_tools, "target1")
+        mock_target2.list_tools.side_effect = partial(list_tools, "target2")
+        multiplex = MultiplexTarget("multi-target", mock_target1, mock_target2)
+
+        tools = await multiplex.list_tools()
+
+        assert [tool.name for tool in tools] == ["target1.tool", "target2.tool"]
+
+    @pytest.mark.asyncio
+    async def test_list_tools_failure_raises(self, mock_target1, mock_target2):
+        """Test a failing target fails the listing without partial results."""
+        mock_target1.list_tools.side_effect = RuntimeError("List failed")
+        mock_target2.list_tools.return_value = []
+        multiplex = MultiplexTarget("multi-target", mock_target1, mock_target2)
+
+        with pytest.raises(RuntimeError, match="List failed"):
+            await multiplex.list_tools()
+        assert list(multiplex.failed_tool_targets) == ["target1"]
+
+    @pytest.mark.asyncio
+    async def test_list_tools_timeout(self, mock_target1, mock_target2):
+        """Test a target that doesn't answer within the timeout fails the listing."""
+
+        async def slow_list_tools():
+            await asyncio.sleep(1)
+            return []
+
+        mock_target1.list_tools.side_effect = slow_list_tools
+        mock_target2.list_tools.return_value = []
+        multiplex = MultiplexTarget("multi-target", mock_target1, mock_target2, timeout=0.01)
+
+        with pytest.raises(TimeoutError, match="Listing tools of target 'target1' timed out after 0.01s"):
+            await multiplex.list_tools()
+
+    @pytest.mark.asyncio
+    async def test_list_tools_partial_results(self, mock_target1, mock_target2):
+        """Test partial results return tools of healthy targets and report the failed ones."""
+
+        async def slow_list_tools():
+            await asyncio.sleep(1)
+            return []
+
+        mock_target1.list_tools.side_effect = slow_list_tools
+        mock_target2.list_tools.return_value = [Tool(name="tool2", inputSchema={})]
+        multiplex = MultiplexTarget(
+            "multi-target", mock_target1, mock_target2, timeout=0.01, partial_results=True
+        )
+
+        tools = await multiplex.list_tools()
+
+        assert [tool.name for tool in tools] == ["target2.tool2"]
+        assert list(multiplex.failed_tool_targets) == ["target1"]
+        assert isinstance(multiplex.failed_tool_targets["target1"], TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_list_prompts_partial_results(self, mock_target1, mock_target2):
+        """Test partial results also apply to prompts."""
+        mock_target1.list_prompts.return_value = [Prompt(name="prompt1")]
+        mock_target2.list_prompts.side_effect = RuntimeError("List failed")
+        multiplex = MultiplexTarget("multi-target", mock_target1, mock_target2, partial_results=True)
+
+        prompts = await multiplex.list_prompts()
+
+        assert [prompt.name for prompt in prompts] == ["target1.prompt1"]
+        assert list(multiplex.failed_prompt_targets) == ["target2"]
+
+        # A later successful listing clears the reported failures
+        mock_target2.list_prompts.side_effect = None
+        mock_target2.list_prompts.return_value = []
+        await multiplex.list_prompts()
+        assert multiplex.failed_prompt_targets == {}
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_listing(self, mock_target1, mock_target2):
+        """Test concurrent tool and prompt listings report their own failures."""
+        mock_target1.list_tools.side_effect = RuntimeError("Tools failed")
+        mock_target1.list_prompts.return_value = []
+        mock_target2.list_tools.return_value = []
+        mock_target2.list_prompts.side_effect = RuntimeError("Prompts failed")
+        multiplex = MultiplexTarget("multi-target", mock_target1, mock_target2, partial_results=True)
+
+        await asyncio.gather(multiplex.list_tools(), multiplex.list_prompts())
+
+        assert list(multiplex.failed_tool_targets) == ["target1"]
+        assert list(multiplex.failed_prompt_targets) == ["target2"]
+
+
+class TestMultiplexTargetRouting:
+    """Test cases for the namespace routing table."""
+
+    @pytest.mark.asyncio
+    async def test_namespaced_tools_cached(self, multiplex_target, mock_target1, mock_target2):
+        """Test namespaced tools are reused while the sub-target catalog doesn't change."""
+        mock_target1.list_tools.return_value = [Tool(name="tool1", inputSchema={})]
+        mock_target2.list_tools.return_value = [Tool(name="tool2", inputSchema={})]
+
+        first = await multiplex_target.list_tools()
+        # An equal catalog from a new list is not rebuilt either
+        mock_target2.list_tools.return_value = [Tool(name="tool2", inputSchema={})]
+        second = await multiplex_target.list_tools()
+
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+    @pytest.mark.asyncio
+    async def test_routing_table_rebuilt_when_catalog_changes(
+        self, multiplex_target, mock_target1, mock_target2
+    ):
+        """Test routes follow the sub-target catalog when it changes."""
+        mock_target1.list_tools.return_value = [Tool(name="old_tool", inputSchema={})]
+        mock_target2.list_tools.return_value = []
+        await multiplex_target.list_tools()
+        assert multiplex_target._tool_routes == {"target1.old_tool": (mock_target1, "old_tool")}
+
+        mock_target1.list_tools.return_value = [Tool(name="new_tool", inputSchema={})]
+        tools = await multiplex_target.list_tools()
+
+        assert [tool.name for tool in tools] == ["target1.new_tool"]
+        assert multiplex_target._tool_routes == {"target1.new_tool": (mock_target1, "new_tool")}
+
+    @pytest.mark.asyncio
+    async def test_namespaced_tool_keeps_all_fields(self, multiplex_target, mock_target1, mock_target2):
+        """Test namespacing only changes the tool name."""
+        tool = Tool(
+            name="tool1",
+            description="Tool 1",
+            inputSchema={"type": "object"},
+            annotations=ToolAnnotations(readOnlyHint=True),
+        )
+        mock_target1.list_tools.return_value = [tool]
+        mock_target2.list_tools.return_value = []
+
+        tools = await multiplex_target.list_tools()
+
+        assert tools == [tool.model_copy(update={"name": "target1.tool1"})]
+        assert tool.name == "tool1"
+
+    @pytest.mark.asyncio
+    async def test_dotted_target_names(self):
+        """Test tools of targets with dots in their names are routed with the original name."""
+        dotted_target = MagicMock(spec=Target)
+        dotted_target.name = "api.v2"
+        dotted_target.list_tools = AsyncMock(return_value=[Tool(name="get.user", inputSchema={})])
+        dotted_target.call_tool = AsyncMock(return_value=[])
+        short_target = MagicMock(spec=Target)
+        short_target.name = "api"
+        short_target.list_tools = AsyncMock(return_value=[])
+        short_target.call_tool = AsyncMock(return_value=[])
+        multiplex = MultiplexTarget("multi-target", short_target, dotted_target)
+
+        # Routed by longest target name prefix before the routing table is built
+        await multiplex.call_tool("api.v2.other", {})
+        dotted_target.call_tool.assert_called_once_with("other", {})
+
+        tools = await multiplex.list_tools()
+        assert [tool.name for tool in tools] == ["api.v2.get.user"]
+        await multiplex.call_tool("api.v2.get.user", {"id": 1})
+        dotted_target.call_tool.assert_called_with("get.user", {"id": 1})
+        short_target.call_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prompt_routing_table(self, multiplex_target, mock_target1, mock_target2):
+        """Test prompts are routed through the routing table after listing."""
+        mock_target1.list_prompts.return_value = []
+        mock_target2.list_prompts.return_value = [Prompt(name="prompt2")]
+        mock_target2.get_prompt.return_value = GetPromptResult(messages=[])
+
+        prompts = await multiplex_target.list_prompts()
+        await multiplex_target.get_prompt("target2.prompt2", {"arg": "value"})
+
+        assert [prompt.name for prompt in prompts] == ["target2.prompt2"]
+        assert multiplex_target._prompt_routes == {"target2.prompt2": (mock_target2, "prompt2")}
+        mock_target2.get_prompt.assert_called_once_with("prompt2", {"arg": "value"})
@@ -1,13 +1,18 @@
 """Tests for OpenAPI Specification (OAS) target implementation."""
 
+import json
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import yaml
 from mcp import Tool
 from mcp.types import TextContent
 from omegaconf import OmegaConf
 
-from mcp_kit.targets.oas import OasTarget
+from mcp_kit.spec_cache import SpecCache
+from mcp_kit.targets.oas import OasTarget, create_mcp_server, create_mcp_server_from_spec, parse_spec
 
 
 class TestOasTarget:
@@ -340,3 +345,130 @@ class TestOasTarget:
         # Should not raise any errors
         str_repr = str(target)
         assert "repr-test" in str_repr or "OasTarget" in str_repr
+
+
+PETSTORE_SPEC = {
+    "openapi": "3.0.0",
+    "servers": [{"url": "http://petstore.example.com/v1/"}],
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "summary": "List all pets",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                "responses": {"200": {"description": "A list of pets"}},
+            },
+        },
+        "/pets/{petId}": {
+            "get": {
+                "summary": "Info for a specific pet",
+                "parameters": [{"name": "petId", "in": "path", "required": True, "schema": {"type": "string"}}],
+                "responses": {"200": {"description": "A pet"}},
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def petstore():
+    """Serve the petstore specification and API through mock transports."""
+    requests = []
+
+    def handle(request):
+        requests.append(request)
+        if request.url.path == "/openapi.json":
+            return httpx.Response(200, json=PETSTORE_SPEC, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=[{"id": 1, "name": "Rex"}])
+
+    client = partial(httpx.AsyncClient, transport=httpx.MockTransport(handle))
+    with (
+        patch("mcp_kit.spec_cache.httpx.AsyncClient", client),
+        patch("openapi_mcp.http_tools.httpx.AsyncClient", client),
+    ):
+        yield requests
+
+
+class TestOasTargetSpecCache:
+    """Test cases for OasTarget with a spec cache."""
+
+    @pytest.mark.asyncio
+    async def test_tools_match_create_mcp_server(self):
+        """Test the tools built from a downloaded spec are the ones built from its URL."""
+        response = httpx.Response(200, json=PETSTORE_SPEC, request=httpx.Request("GET", "http://example.com"))
+        with patch("openapi_mcp.http_tools.httpx.get", return_value=response):
+            expected = await create_mcp_server("http://example.com/openapi.json").list_tools()
+
+        with patch("openapi_mcp.http_tools.httpx.get", side_effect=AssertionError("Spec downloaded again")):
+            tools = await create_mcp_server_from_spec(PETSTORE_SPEC, "http://example.com/openapi.json").list_tools()
+
+        assert tools == expected
+        assert [tool.name for tool in tools] == ["listPets", "get__pets_petId"]
+
+    def test_parse_yaml_spec(self):
+        """Test specs are parsed from JSON or YAML."""
+        assert parse_spec(json.dumps(PETSTORE_SPEC).encode()) == PETSTORE_SPEC
+        assert parse_spec(yaml.dump(PETSTORE_SPEC).encode()) == PETSTORE_SPEC
+        with pytest.raises(ValueError, match="Invalid OpenAPI spec"):
+            parse_spec(b"- not\n- an object\n")
+
+    @pytest.mark.asyncio
+    async def test_catalog_cached(self, petstore, tmp_path):
+        """Test a restarted target lists the cached tools without parsing the spec."""
+        target = OasTarget("petstore", "http://example.com/openapi.json", SpecCache(tmp_path))
+        await target.initialize()
+        tools = await target.list_tools()
+
+        restarted = OasTarget("petstore", "http://example.com/openapi.json", SpecCache(tmp_path))
+        with patch("mcp_kit.targets.oas.create_mcp_server_from_spec") as create_server:
+            await restarted.initialize()
+            assert await restarted.list_tools() == tools
+
+        create_server.assert_not_called()
+        assert restarted._fast_mcp is None
+        assert petstore[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_call_tool_creates_server(self, petstore, tmp_path):
+        """Test the server is created on the first tool call when the tools were cached."""
+        await OasTarget("petstore", "http://example.com/openapi.json", SpecCache(tmp_path)).initialize()
+        target = OasTarget("petstore", "http://example.com/openapi.json", SpecCache(tmp_path))
+        await target.initialize()
+
+        result = await target.call_tool("listPets", {"limit": 1})
+
+        assert target._fast_mcp is not None
+        assert "Rex" in result[0].text
+        assert petstore[-1].url.host == "petstore.example.com"
+        assert petstore[-1].url.path == "/v1/pets"
+
+    @pytest.mark.asyncio
+    async def test_close_resets_cached_state(self, petstore, tmp_path):
+        """Test closing the target drops the cached spec and tools."""
+        target = OasTarget("petstore", "http://example.com/openapi.json", SpecCache(tmp_path))
+        await target.initialize()
+
+        await target.close()
+
+        with pytest.raises(ValueError, match="OasTarget server is not initialized"):
+            await target.list_tools()
+        with pytest.raises(ValueError, match="OasTarget server is not initialized"):
+            await target.call_tool("listPets", {})
+
+    def test_from_config_with_cache(self):
+        """Test the spec cache is configured from the cache section."""
+        config = OmegaConf.create(
+            {
+                "type": "oas",
+                "name": "cached-oas",
+                "spec_url": "http://example.com/openapi.json",
+                "cache": {"path": "/tmp/oas_cache", "max_age": 300},
+            }
+        )
+
+        target = OasTarget.from_config(config)
+
+        assert target.spec_cache is not None
+        assert str(target.spec_cache.path) == "/tmp/oas_cache"
+        assert target.spec_cache.max_age == 300
+        assert OasTarget.from_config(OmegaConf.create({"name": "oas", "spec_url": "x"})).spec_cache is None
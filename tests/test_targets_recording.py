@@ -0,0 +1,249 @@
+"""Tests for recording and replay target implementations."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp import McpError
+from mcp.types import GetPromptResult, ImageContent, Prompt, PromptMessage, TextContent, Tool
+from omegaconf import OmegaConf
+
+from mcp_kit.factory import create_target_from_config
+from mcp_kit.record_log import read_records
+from mcp_kit.replay_index import MatchConfig, NearestIndex
+from mcp_kit.targets.interfaces import Target
+from mcp_kit.targets.recording import RecordingTarget
+from mcp_kit.targets.replay import ReplayTarget
+
+TOOLS = [Tool(name="search", description="Search things", inputSchema={"type": "object"})]
+PROMPTS = [Prompt(name="greet", description="Greet someone")]
+
+
+@pytest.fixture
+def base_target():
+    """Create a mock base target answering with the call arguments."""
+    target = MagicMock(spec=Target)
+    target.name = "base"
+    target.initialize = AsyncMock()
+    target.close = AsyncMock()
+    target.list_tools = AsyncMock(return_value=TOOLS)
+    target.call_tool = AsyncMock(
+        side_effect=lambda name, arguments: [
+            TextContent(type="text", text=f"{name} {arguments}"),
+            ImageContent(type="image", data="aGk=", mimeType="image/png"),
+        ]
+    )
+    target.list_prompts = AsyncMock(return_value=PROMPTS)
+    target.get_prompt = AsyncMock(
+        side_effect=lambda name, arguments: GetPromptResult(
+            messages=[PromptMessage(role="user", content=TextContent(type="text", text=f"Hello {arguments['who']}"))]
+        )
+    )
+    return target
+
+
+class TestRecordingTarget:
+    """Test cases for RecordingTarget class."""
+
+    def test_name(self, base_target, tmp_path):
+        """Test the recording target keeps the base target name."""
+        assert RecordingTarget(base_target, str(tmp_path / "calls.jsonl")).name == "base"
+
+    def test_from_config(self, tmp_path):
+        """Test RecordingTarget.from_config and resolution by the factory."""
+        config = OmegaConf.create(
+            {
+                "type": "recording",
+                "path": str(tmp_path / "calls.jsonl"),
+                "max_bytes": 1024,
+                "backup_count": 3,
+                "base_target": {"type": "mcp", "name": "base", "url": "http://example.com/mcp"},
+            }
+        )
+
+        target = create_target_from_config(config)
+
+        assert isinstance(target, RecordingTarget)
+        assert target.target.name == "base"
+        assert target.log.max_bytes == 1024
+        assert target.log.backup_count == 3
+
+    @pytest.mark.asyncio
+    async def test_records_calls_and_listings(self, base_target, tmp_path):
+        """Test calls, prompts and changed listings are appended to the log."""
+        path = tmp_path / "calls.jsonl"
+        target = RecordingTarget(base_target, str(path))
+        await target.initialize()
+
+        await target.list_tools()
+        await target.list_tools()
+        result = await target.call_tool("search", {"q": "mcp"})
+        await target.list_prompts()
+        await target.get_prompt("greet", {"who": "world"})
+        await target.close()
+
+        assert result[0].text == "search {'q': 'mcp'}"
+        records = list(read_records(path))
+        assert [record["type"] for record in records] == ["tools", "call_tool", "prompts", "get_prompt"]
+        assert records[0]["tools"][0]["name"] == "search"
+        assert records[1]["name"] == "search"
+        assert records[1]["arguments"] == {"q": "mcp"}
+        assert records[1]["result"][0] == {"type": "text", "text": "search {'q': 'mcp'}"}
+        assert records[1]["duration"] >= 0
+        assert records[3]["result"]["messages"][0]["content"]["text"] == "Hello world"
+        base_target.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_recorded(self, base_target, tmp_path):
+        """Test errors of the base target are raised and not recorded."""
+        path = tmp_path / "calls.jsonl"
+        base_target.call_tool.side_effect = RuntimeError("boom")
+        target = RecordingTarget(base_target, str(path))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await target.call_tool("search", {"q": "mcp"})
+
+        assert list(read_records(path)) == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_recorded(self, base_target, tmp_path):
+        """Test concurrent calls are all recorded by the time the target is closed."""
+        path = tmp_path / "calls.jsonl"
+        target = RecordingTarget(base_target, str(path), max_bytes=512)
+
+        await asyncio.gather(*[target.call_tool("search", {"q": n}) for n in range(20)])
+        await target.close()
+
+        assert sorted(record["arguments"]["q"] for record in read_records(path)) == list(range(20))
+
+
+class TestReplayTarget:
+    """Test cases for ReplayTarget class."""
+
+    async def record(self, base_target, path, calls):
+        """Record tool calls of the base target to a log."""
+        target = RecordingTarget(base_target, str(path), max_bytes=256)
+        await target.initialize()
+        await target.list_tools()
+        await target.list_prompts()
+        for arguments in calls:
+            await target.call_tool("search", arguments)
+        await target.get_prompt("greet", {"who": "world"})
+        await target.close()
+
+    def test_from_config(self, tmp_path):
+        """Test ReplayTarget.from_config and resolution by the factory."""
+        config = OmegaConf.create({"type": "replay", "name": "base", "path": str(tmp_path / "calls.jsonl")})
+
+        target = create_target_from_config(config)
+
+        assert isinstance(target, ReplayTarget)
+        assert target.name == "base"
+        assert target.path == str(tmp_path / "calls.jsonl")
+        assert target.match_config == MatchConfig()
+
+    @pytest.mark.asyncio
+    async def test_from_config_with_match(self, base_target, tmp_path):
+        """Test the match configuration of ReplayTarget.from_config."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a"}])
+        config = OmegaConf.create(
+            {
+                "type": "replay",
+                "name": "base",
+                "path": str(path),
+                "match": {"strategy": "nearest", "ignore_paths": ["ts"], "min_similarity": 0.5},
+            }
+        )
+
+        target = create_target_from_config(config)
+        await target.initialize()
+
+        assert target.match_config == MatchConfig(strategy="nearest", ignore_paths=["ts"], min_similarity=0.5)
+        assert isinstance(target._tool_responses["search"], NearestIndex)
+
+    @pytest.mark.asyncio
+    async def test_replays_recorded_traffic(self, base_target, tmp_path):
+        """Test recorded listings, calls and prompts are served back from rotated logs."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a"}, {"q": "b"}])
+        assert len(list(tmp_path.iterdir())) > 1
+
+        target = ReplayTarget("base", str(path))
+        await target.initialize()
+
+        assert await target.list_tools() == TOOLS
+        assert await target.list_prompts() == PROMPTS
+        assert await target.call_tool("search", {"q": "b"}) == await base_target.call_tool("search", {"q": "b"})
+        prompt = await target.get_prompt("greet", {"who": "world"})
+        assert prompt.messages[0].content.text == "Hello world"
+
+    @pytest.mark.asyncio
+    async def test_replayed_results_are_not_shared(self, base_target, tmp_path):
+        """Test modifying a replayed result doesn't modify the recorded result."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a"}])
+        target = ReplayTarget("base", str(path))
+        await target.initialize()
+
+        (await target.call_tool("search", {"q": "a"}))[0].text = "changed"
+        (await target.get_prompt("greet", {"who": "world"})).messages.clear()
+
+        assert (await target.call_tool("search", {"q": "a"}))[0].text == "search {'q': 'a'}"
+        assert len((await target.get_prompt("greet", {"who": "world"})).messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_cycle_through_recorded_responses(self, base_target, tmp_path):
+        """Test a call recorded several times is answered with each recorded response in turn."""
+        path = tmp_path / "calls.jsonl"
+        responses = iter(["first", "second"])
+        base_target.call_tool.side_effect = lambda name, arguments: [TextContent(type="text", text=next(responses))]
+        await self.record(base_target, path, [{"q": "a"}, {"q": "a"}])
+
+        target = ReplayTarget("base", str(path))
+        await target.initialize()
+
+        texts = [(await target.call_tool("search", {"q": "a"}))[0].text for _ in range(3)]
+        assert texts == ["first", "second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_calls_raise(self, base_target, tmp_path):
+        """Test calls and prompts that were not recorded raise an McpError."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a"}])
+
+        target = ReplayTarget("base", str(path))
+        await target.initialize()
+
+        with pytest.raises(McpError, match="No recorded response for tool 'search'"):
+            await target.call_tool("search", {"q": "other"})
+        with pytest.raises(McpError, match="No recorded response for tool 'missing'"):
+            await target.call_tool("missing")
+        with pytest.raises(McpError, match="No recorded response for prompt 'greet'"):
+            await target.get_prompt("greet", {"who": "nobody"})
+
+    @pytest.mark.asyncio
+    async def test_ignore_paths_match(self, base_target, tmp_path):
+        """Test calls differing only in ignored arguments are served the recorded response."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a", "ts": 1}])
+
+        target = ReplayTarget("base", str(path), MatchConfig(strategy="ignore_paths", ignore_paths=["ts"]))
+        await target.initialize()
+
+        result = await target.call_tool("search", {"q": "a", "ts": 2})
+        assert result[0].text == "search {'q': 'a', 'ts': 1}"
+        with pytest.raises(McpError):
+            await target.call_tool("search", {"q": "b", "ts": 1})
+
+    @pytest.mark.asyncio
+    async def test_nearest_match(self, base_target, tmp_path):
+        """Test calls are served the response of the nearest recorded call."""
+        path = tmp_path / "calls.jsonl"
+        await self.record(base_target, path, [{"q": "a", "ts": 1}, {"q": "b", "ts": 2}])
+
+        target = ReplayTarget("base", str(path), MatchConfig(strategy="nearest"))
+        await target.initialize()
+
+        result = await target.call_tool("search", {"q": "b", "ts": 3})
+        assert result[0].text == "search {'q': 'b', 'ts': 2}"